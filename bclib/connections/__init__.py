@@ -24,11 +24,12 @@ Example:
     ```
 """
 
+from .connection_registry import ConnectionRegistry
 from .mongo import IMongoConnection
 from .rabbit import IRabbitConnection
 from .restful import IRestfulConnection
 
-__all__ = ['add_connection_services', 'IMongoConnection',
+__all__ = ['add_connection_services', 'ConnectionRegistry', 'IMongoConnection',
            'IRabbitConnection', 'IRestfulConnection']
 
 
@@ -44,6 +45,9 @@ def add_connection_services(service_container: IServiceContainer) -> IServiceCon
     This allows you to inject IMongoConnection[TConfig] and IRabbitConnection[TConfig]
     directly into your services without creating custom connection classes.
 
+    Underlying clients are shared per configuration key for the life of the
+    process through the hosted ConnectionRegistry, which closes them on shutdown.
+
     Args:
         service_container: The service container to register services with
 
@@ -0,0 +1,98 @@
+"""Process-wide registry of shared connections"""
+import asyncio
+import inspect
+from typing import Any, Callable, Dict, Tuple, TypeVar
+
+from bclib.di import IServiceContainer
+from bclib.di.ihosted_service import IHostedService
+
+T = TypeVar('T')
+
+
+class ConnectionRegistry(IHostedService):
+    """
+    Process-wide registry of shared connections keyed by connection kind and config key
+
+    Connection services (IMongoConnection, IRabbitConnection,
+    IRestfulConnection) keep one shared connection per configuration key here,
+    created on first use and reused for the life of the process, so the
+    underlying client pools, AMQP connections and HTTP sessions are not
+    re-created for every request scope. Scopes get cheap handles on top of
+    the shared connection.
+
+    Registered as a hosted service: connections are created lazily on first
+    use and closed, newest first, on shutdown.
+
+    Example:
+        ```python
+        registry = services.get_service(ConnectionRegistry)
+        shared = registry.get_or_create(
+            'mongo', 'database.users', lambda: MongoConnection(options))
+        ```
+    """
+
+    def __init__(self) -> None:
+        self.__connections: Dict[Tuple[str, str], Any] = dict()
+
+    def __len__(self) -> int:
+        return len(self.__connections)
+
+    def __contains__(self, kind_and_key: Tuple[str, str]) -> bool:
+        return kind_and_key in self.__connections
+
+    def get_or_create(self, kind: str, key: str, factory: Callable[[], T]) -> T:
+        """
+        Get the shared connection of a config key, creating it on first use
+
+        Args:
+            kind: Connection kind, e.g. 'mongo', 'rabbit' or 'restful'
+            key: Configuration key, e.g. 'database.users'
+            factory: Creates the shared connection
+
+        Returns:
+            T: Shared connection of the key
+        """
+        connection = self.__connections.get((kind, key))
+        if connection is None:
+            connection = self.__connections[(kind, key)] = factory()
+        return connection
+
+    async def start_async(self) -> None:
+        """Connections are created on first use"""
+        pass
+
+    async def stop_async(self) -> None:
+        """Close all shared connections, newest first"""
+        connections, self.__connections = self.__connections, dict()
+        for connection in reversed(list(connections.values())):
+            try:
+                await ConnectionRegistry.__close_async(connection)
+            except Exception:
+                pass
+
+    @staticmethod
+    async def __close_async(connection: Any) -> None:
+        """Close a shared connection with the method it provides"""
+        for name in ('dispose_async', 'close_async', 'close'):
+            close = getattr(connection, name, None)
+            if close is not None:
+                result = close()
+                if inspect.isawaitable(result):
+                    await asyncio.wait_for(result, timeout=10)
+                return
+
+
+def add_connection_registry(service_container: IServiceContainer) -> IServiceContainer:
+    """
+    Register the shared ConnectionRegistry once as a hosted singleton
+
+    Args:
+        service_container: The DI container to register services in
+
+    Returns:
+        The service container (for chaining)
+    """
+    if not service_container.is_registered(ConnectionRegistry):
+        service_container.add_singleton(
+            ConnectionRegistry, ConnectionRegistry, is_hosted=True)
+    return service_container
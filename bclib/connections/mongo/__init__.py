@@ -105,14 +105,17 @@ def add_mongodb_connection(service_container: IServiceContainer) -> IServiceCont
         After calling this function, you can inject IMongoConnection['your.config.key']
         into any service constructor. The DI container will automatically:
         1. Resolve configuration from 'your.config.key' 
-        2. Create MongoConnection instance with those options
+        2. Create one shared MongoConnection per key in the ConnectionRegistry,
+           whose client pools live for the life of the process
         3. Provide both sync (client) and async (async_client) MongoDB clients
-        4. Inject it as IMongoConnection['your.config.key']
+        4. Inject a per-scope handle on it as IMongoConnection['your.config.key']
     """
     from bclib.di import IServiceProvider, extract_generic_type_key
 
+    from ..connection_registry import ConnectionRegistry, add_connection_registry
+
     def create_mongo_connection(sp: IServiceProvider, **kwargs):
-        """Factory for creating MongoConnection with configuration key from generic type"""
+        """Factory for creating a MongoConnection handle on the shared clients of the configuration key"""
         from bclib.options import AppOptions
         from bclib.utility import resolve_dict_value
 
@@ -125,6 +128,10 @@ def add_mongodb_connection(service_container: IServiceContainer) -> IServiceCont
         if options is None:
             raise ValueError(
                 f"MongoConnection configuration for key '{key}' not found.")
-        return MongoConnection(options)
+        shared = sp.get_service(ConnectionRegistry).get_or_create(
+            'mongo', key, lambda: MongoConnection(options))
+        return MongoConnection(options, shared)
+
+    add_connection_registry(service_container)
     return service_container.add_scoped(
         IMongoConnection, factory=create_mongo_connection)
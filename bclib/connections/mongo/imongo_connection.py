@@ -1,11 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Generic, Optional, TypeVar
 
 if TYPE_CHECKING:
     from pymongo import AsyncMongoClient, MongoClient
     from pymongo.collection import Collection
     from pymongo.database import Database
 
+    from .mongo_bulk_writer import MongoBulkFlushResult, MongoBulkWriter
+
 
 T = TypeVar('T')
 
@@ -83,6 +85,12 @@ class IMongoConnection(Generic[T], ABC):
         """Drop a collection."""
         pass
 
+    @abstractmethod
+    def bulk_writer(self, collection_name: str, max_batch: int = 1000, max_delay_ms: int = 100,
+                    on_flush: Optional[Callable[['MongoBulkFlushResult'], Any]] = None) -> 'MongoBulkWriter':
+        """Get the write-behind bulk writer of a collection."""
+        pass
+
     @abstractmethod
     def close(self) -> None:
         """Close the database connection."""
@@ -0,0 +1,305 @@
+"""Write-behind buffer of MongoDB insert/upsert/$inc operations"""
+import asyncio
+import inspect
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Optional
+
+from pymongo import InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError
+
+if TYPE_CHECKING:
+    from pymongo.asynchronous.collection import AsyncCollection
+
+    from bclib.logger.ilogger import ILogger
+
+
+class MongoBulkFlushResult:
+    """
+    Outcome of one bulk writer flush
+
+    Attributes:
+        operations (int): Operations sent in the flush
+        inserted_count (int): Inserted documents
+        matched_count (int): Documents matched by updates
+        modified_count (int): Documents modified by updates
+        upserted_count (int): Documents inserted by upserts
+        write_errors (list): Per-operation errors reported by the server
+        error (Exception): Error of the flush, None on success
+    """
+
+    def __init__(self, operations: int) -> None:
+        self.operations = operations
+        self.inserted_count = 0
+        self.matched_count = 0
+        self.modified_count = 0
+        self.upserted_count = 0
+        self.write_errors: List[dict] = []
+        self.error: Optional[Exception] = None
+
+    @property
+    def succeeded(self) -> bool:
+        """Check if every operation of the flush was applied"""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        return (f"<MongoBulkFlushResult operations={self.operations} inserted={self.inserted_count} "
+                f"upserted={self.upserted_count} modified={self.modified_count} "
+                f"errors={len(self.write_errors)}>")
+
+
+class MongoBulkWriter:
+    """
+    Write-behind buffer of insert, upsert and $inc operations for one collection
+
+    Operations are kept in memory and sent as one unordered bulk_write when
+    max_batch operations are buffered or max_delay_ms after the first
+    buffered operation, whichever comes first. $inc, $set and $unset updates
+    of the same filter are merged before flushing: $inc amounts are summed and
+    $set/$unset keep the latest value per field, so a hot counter costs one
+    operation per flush instead of one per request. Updates with other
+    operators ($push, $addToSet, $pull, $mul, $min, $max, ...) or touching a
+    field already updated by another operator are sent as separate operations.
+
+    Because the bulk write is unordered, operations of one flush have no
+    order guarantee between different documents.
+
+    Example:
+        ```python
+        class EventService:
+            def __init__(self, db: IMongoConnection['database.events']):
+                self.counters = db.bulk_writer('counters', max_batch=1000, max_delay_ms=200)
+                self.events = db.bulk_writer('events')
+
+            def track(self, page: str, event: dict):
+                self.events.insert(event)
+                self.counters.inc(page, {'views': 1})
+        ```
+    """
+
+    # Update operators merged per filter, every other operator is sent as is
+    __MERGEABLE_OPERATORS = ('$inc', '$set', '$unset')
+
+    def __init__(self,
+                 collection: 'AsyncCollection',
+                 max_batch: int = 1000,
+                 max_delay_ms: int = 100,
+                 on_flush: Optional[Callable[[MongoBulkFlushResult], Any]] = None,
+                 logger: Optional['ILogger'] = None) -> None:
+        """
+        Initialize bulk writer
+
+        Args:
+            collection: Async collection to write to
+            max_batch: Buffered operations that trigger a flush
+            max_delay_ms: Max milliseconds an operation waits before being flushed
+            on_flush: Optional callback (sync or async) receiving each MongoBulkFlushResult
+            logger: Optional logger for flush errors
+        """
+        self.collection = collection
+        self.max_batch = max(1, max_batch)
+        self.max_delay = max(0, max_delay_ms) / 1000
+        self.on_flush = on_flush
+        self.__logger = logger
+        self.__inserts: List[dict] = []
+        # [filter, update, upsert] in arrival order
+        self.__updates: List[list] = []
+        # filter key -> last buffered update of that filter that can still be merged into
+        self.__mergeable_updates: Dict[Hashable, list] = {}
+        self.__timer: Optional[asyncio.TimerHandle] = None
+        self.__flush_task: Optional[asyncio.Task] = None
+        self.__lock = asyncio.Lock()
+        self.last_result: Optional[MongoBulkFlushResult] = None
+        self.flush_count = 0
+        self.error_count = 0
+
+    @property
+    def pending_count(self) -> int:
+        """Get number of buffered operations"""
+        return len(self.__inserts) + len(self.__updates)
+
+    def insert(self, document: dict) -> None:
+        """
+        Buffer an insert
+
+        Args:
+            document: Document to insert
+        """
+        self.__inserts.append(document)
+        self.__on_buffered()
+
+    def upsert(self, filter: dict, update: dict) -> None:
+        """
+        Buffer an update that inserts the document when no document matches
+
+        Args:
+            filter: Document filter, e.g. {'_id': key}
+            update: Update operators, or a plain document to $set
+        """
+        self.update(filter, update, upsert=True)
+
+    def inc(self, _id: Any, fields: Dict[str, Any], upsert: bool = True) -> None:
+        """
+        Buffer a $inc of the document with the given _id
+
+        Increments of the same _id are summed before flushing.
+
+        Args:
+            _id: Document _id
+            fields: Field -> amount
+            upsert: Create the document when missing (default: True)
+        """
+        self.update({'_id': _id}, {'$inc': fields}, upsert=upsert)
+
+    def update(self, filter: dict, update: dict, upsert: bool = False) -> None:
+        """
+        Buffer an update of the single document matching filter
+
+        Args:
+            filter: Document filter
+            update: Update operators, or a plain document to $set
+            upsert: Insert the document when no document matches
+        """
+        if not any(name.startswith('$') for name in update):
+            update = {'$set': update}
+        key = MongoBulkWriter.__filter_key(filter)
+        mergeable = all(op in MongoBulkWriter.__MERGEABLE_OPERATORS for op in update)
+        pending = self.__mergeable_updates.get(key) if mergeable else None
+        # An upsert merged into an update (or the reverse) would change what the
+        # created document contains, so only updates with the same flag are merged
+        if pending is None or pending[2] != upsert or \
+                not MongoBulkWriter.__merge_update(pending[1], update):
+            pending = [filter, {op: dict(fields) for op, fields in update.items()}, upsert]
+            self.__updates.append(pending)
+            if mergeable:
+                self.__mergeable_updates[key] = pending
+            else:
+                # Later updates must not be merged into an update sent before this one
+                self.__mergeable_updates.pop(key, None)
+        self.__on_buffered()
+
+    async def flush_async(self) -> Optional[MongoBulkFlushResult]:
+        """
+        Send buffered operations now
+
+        Returns:
+            Optional[MongoBulkFlushResult]: Result of the flush, None if nothing was buffered
+        """
+        self.__cancel_timer()
+        async with self.__lock:
+            inserts, self.__inserts = self.__inserts, []
+            updates, self.__updates = self.__updates, []
+            self.__mergeable_updates = {}
+            if not inserts and not updates:
+                return None
+            operations = [InsertOne(document) for document in inserts]
+            operations.extend(UpdateOne(filter, update, upsert=upsert)
+                              for filter, update, upsert in updates)
+            result = MongoBulkFlushResult(len(operations))
+            try:
+                write_result = await self.collection.bulk_write(operations, ordered=False)
+                MongoBulkWriter.__fill_counts(result, write_result.bulk_api_result)
+            except BulkWriteError as ex:
+                MongoBulkWriter.__fill_counts(result, ex.details)
+                result.error = ex
+            except Exception as ex:
+                result.error = ex
+            self.flush_count += 1
+            self.last_result = result
+            if result.error is not None:
+                self.error_count += 1
+                if self.__logger:
+                    self.__logger.error(
+                        f"Mongo bulk write to '{self.collection.name}' failed: {result.error}")
+        if self.on_flush is not None:
+            try:
+                ret = self.on_flush(result)
+                if inspect.isawaitable(ret):
+                    await ret
+            except Exception as ex:
+                if self.__logger:
+                    self.__logger.error(f"Mongo bulk writer on_flush error: {ex}")
+        return result
+
+    async def close_async(self) -> None:
+        """Flush buffered operations and stop the flush timer (call on shutdown)"""
+        if self.__flush_task is not None:
+            await asyncio.gather(self.__flush_task, return_exceptions=True)
+        await self.flush_async()
+
+    def __on_buffered(self) -> None:
+        """Schedule a flush for size or time"""
+        if self.pending_count >= self.max_batch:
+            self.__start_flush()
+        elif self.__timer is None:
+            self.__timer = asyncio.get_running_loop().call_later(
+                self.max_delay, self.__start_flush)
+
+    def __start_flush(self) -> None:
+        self.__cancel_timer()
+        if self.__flush_task is None or self.__flush_task.done():
+            self.__flush_task = asyncio.ensure_future(self.__flush_pending_async())
+
+    async def __flush_pending_async(self) -> None:
+        """Flush, then reschedule for operations buffered during the flush"""
+        await self.flush_async()
+        if self.pending_count:
+            self.__on_buffered()
+
+    def __cancel_timer(self) -> None:
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+
+    @staticmethod
+    def __filter_key(filter: dict) -> Hashable:
+        """Key of a filter for merging updates, unique for unhashable filters"""
+        try:
+            key = tuple(sorted(filter.items()))
+            hash(key)
+            return key
+        except TypeError:
+            return object()
+
+    @staticmethod
+    def __merge_update(target: dict, update: dict) -> bool:
+        """
+        Merge $inc/$set/$unset operators into target
+
+        $inc amounts add up and $set/$unset of the same field keep the last one.
+
+        Returns:
+            bool: False (target unchanged) if a field conflicts with a field of another operator
+        """
+        def overlaps(a: str, b: str) -> bool:
+            return a == b or a.startswith(b + '.') or b.startswith(a + '.')
+
+        for op, fields in update.items():
+            for name in fields:
+                for target_op, target_fields in target.items():
+                    for target_name in target_fields:
+                        if not overlaps(name, target_name):
+                            continue
+                        # Only the exact same field can be summed ($inc) or replaced ($set/$unset)
+                        same_kind = (op == '$inc') == (target_op == '$inc')
+                        if not same_kind or name != target_name:
+                            return False
+        for op, fields in update.items():
+            for name, value in fields.items():
+                if op == '$inc':
+                    current = target.setdefault(op, {})
+                    current[name] = current.get(name, 0) + value
+                else:
+                    for other in ('$set', '$unset'):
+                        if other != op and name in target.get(other, {}):
+                            del target[other][name]
+                            if not target[other]:
+                                del target[other]
+                    target.setdefault(op, {})[name] = value
+        return True
+
+    @staticmethod
+    def __fill_counts(result: MongoBulkFlushResult, details: dict) -> None:
+        result.inserted_count = details.get('nInserted', 0)
+        result.matched_count = details.get('nMatched', 0)
+        result.modified_count = details.get('nModified', 0)
+        result.upserted_count = details.get('nUpserted', 0)
+        result.write_errors = details.get('writeErrors', [])
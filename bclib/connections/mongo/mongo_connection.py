@@ -37,7 +37,7 @@ Configuration Example:
     ```
 """
 
-from typing import Any, Dict, Optional, TypeVar
+from typing import Any, Callable, Dict, Optional, TypeVar
 
 from pymongo import AsyncMongoClient, MongoClient
 from pymongo.collection import Collection
@@ -46,6 +46,7 @@ from pymongo.database import Database
 from bclib.options import IOptions
 
 from .imongo_connection import IMongoConnection
+from .mongo_bulk_writer import MongoBulkFlushResult, MongoBulkWriter
 
 T = TypeVar('T')
 
@@ -85,6 +86,13 @@ class MongoConnection(IMongoConnection[T]):
         - Connection pooling
         - No inheritance required
 
+    Shared clients:
+        A connection created with `shared` is a cheap handle that uses the
+        (lazily created) clients of the shared connection instead of its own;
+        closing a handle leaves the shared clients open. The DI registration
+        keeps one shared connection per configuration key in the
+        ConnectionRegistry and hands out one handle per request scope.
+
     Attributes:
         connection_string (str): MongoDB connection string
         database_name (str): Target database name
@@ -92,12 +100,13 @@ class MongoConnection(IMongoConnection[T]):
         database (Database): MongoDB database instance
     """
 
-    def __init__(self, options: IOptions[T]):
+    def __init__(self, options: IOptions[T], shared: Optional['MongoConnection'] = None):
         """
         Initialize MongoDB connection with configuration options.
 
         Args:
             options: Configuration options containing connection details
+            shared: Connection whose clients this handle uses (owned elsewhere)
 
         Required configuration keys:
             - connection_string: MongoDB connection URI
@@ -118,6 +127,8 @@ class MongoConnection(IMongoConnection[T]):
         self._database: Optional[Database] = None
         self._async_client: Optional[AsyncMongoClient] = None
         self._async_database: Optional[Database] = None
+        self._shared = shared
+        self._bulk_writers: Dict[str, MongoBulkWriter] = {}
 
         # Validate required configuration
         self._validate_options()
@@ -144,6 +155,8 @@ class MongoConnection(IMongoConnection[T]):
         Returns:
             MongoClient: Active MongoDB client
         """
+        if self._shared is not None:
+            return self._shared.client
         if self._client is None:
             self._client = self._create_client()
         return self._client
@@ -156,6 +169,8 @@ class MongoConnection(IMongoConnection[T]):
         Returns:
             AsyncMongoClient: Active async MongoDB client
         """
+        if self._shared is not None:
+            return self._shared.async_client
         if self._async_client is None:
             self._async_client = self._create_async_client()
         return self._async_client
@@ -317,22 +332,77 @@ class MongoConnection(IMongoConnection[T]):
         """
         self.database.drop_collection(collection_name)
 
+    def bulk_writer(self, collection_name: str, max_batch: int = 1000, max_delay_ms: int = 100,
+                    on_flush: Optional[Callable[[MongoBulkFlushResult], Any]] = None) -> MongoBulkWriter:
+        """
+        Get the write-behind bulk writer of a collection.
+
+        Inserts, upserts and $inc operations are buffered and flushed as
+        unordered bulk writes on size or time (see MongoBulkWriter). There is
+        one writer per collection, shared by all handles of a shared
+        connection; the options of the first call are used. Writers are
+        flushed by dispose_async, which runs on application shutdown for
+        connections injected through IMongoConnection.
+
+        Args:
+            collection_name: Name of the collection
+            max_batch: Buffered operations that trigger a flush
+            max_delay_ms: Max milliseconds an operation waits before being flushed
+            on_flush: Optional callback receiving each MongoBulkFlushResult
+
+        Returns:
+            MongoBulkWriter: Bulk writer of the collection
+
+        Example:
+            ```python
+            counters = db.bulk_writer('page_views', max_batch=500, max_delay_ms=250)
+            counters.inc(page_id, {'views': 1})
+            ```
+        """
+        if self._shared is not None:
+            return self._shared.bulk_writer(collection_name, max_batch, max_delay_ms, on_flush)
+        writer = self._bulk_writers.get(collection_name)
+        if writer is None:
+            writer = self._bulk_writers[collection_name] = MongoBulkWriter(
+                self.get_async_collection(collection_name), max_batch, max_delay_ms, on_flush)
+        return writer
+
+    async def dispose_async(self) -> None:
+        """
+        Flush bulk writers and close the MongoDB clients.
+
+        Called for shared connections on application shutdown.
+        """
+        writers, self._bulk_writers = self._bulk_writers, {}
+        for writer in writers.values():
+            await writer.close_async()
+        if self._shared is None and self._async_client is not None:
+            # AsyncMongoClient.close is a coroutine
+            await self._async_client.close()
+            self._async_client = None
+            self._async_database = None
+        self.close()
+
     def close(self) -> None:
         """
         Close the MongoDB client connections (sync and async).
 
         Note:
             Connection will be automatically closed when used as context manager.
+            Handles of a shared connection only drop their database references.
         """
+        self._database = None
+        self._async_database = None
+        if self._shared is not None:
+            return
+
         if self._client is not None:
             self._client.close()
             self._client = None
-            self._database = None
 
         if self._async_client is not None:
             self._async_client.close()
             self._async_client = None
-            self._async_database = None
 
     def __enter__(self):
         """Context manager entry."""
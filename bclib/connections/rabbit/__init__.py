@@ -113,17 +113,18 @@ def add_rabbitmq_connection(service_container: IServiceContainer) -> IServiceCon
         After calling this function, you can inject IRabbitConnection['your.config.key']
         into any service constructor. The DI container will automatically:
         1. Resolve configuration from 'your.config.key' 
-        2. Create RabbitConnection instance with those options
+        2. Create one shared RabbitConnection per key in the ConnectionRegistry,
+           so every scope publishes over the same AMQP connection and channels
         3. Provide connection to RabbitMQ with configured queue/exchange
         4. Inject it as IRabbitConnection['your.config.key']
     """
     from bclib.di import IServiceProvider
     from bclib.options import IOptions
 
-    # return service_container.add_transient(IRabbitConnection, RabbitConnection)
+    from ..connection_registry import ConnectionRegistry, add_connection_registry
 
     def create_rabbit_connection(service_provider: IServiceProvider, **kwargs):
-        """Factory for creating RabbitConnection with configuration key from generic type"""
+        """Factory for getting the shared RabbitConnection of the configuration key from generic type"""
         from bclib.di import extract_generic_type_key
 
         from .rabbit_connection import RabbitConnection
@@ -131,11 +132,19 @@ def add_rabbitmq_connection(service_container: IServiceContainer) -> IServiceCon
         # Extract configuration key from generic type arguments
         key = extract_generic_type_key(kwargs)
 
-        # Get configuration options for this key
-        options = service_provider.get_service(IOptions[key])
-
-        # # The actual configuration is provided through options parameter
-        return service_provider.create_instance(RabbitConnection, options=options, **kwargs)
-
-    return service_container.add_transient(
+        def create_shared():
+            # The shared connection outlives the scope, so it is built from the root provider
+            root_provider = service_provider.get_service(IServiceProvider)
+            # Get configuration options for this key
+            options = root_provider.get_service(IOptions[key])
+            connection = root_provider.create_instance(
+                RabbitConnection, options=options, **kwargs)
+            connection.shared = True
+            return connection
+
+        return service_provider.get_service(ConnectionRegistry).get_or_create(
+            'rabbit', key, create_shared)
+
+    add_connection_registry(service_container)
+    return service_container.add_scoped(
         IRabbitConnection, factory=create_rabbit_connection)
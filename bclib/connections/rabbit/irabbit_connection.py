@@ -5,6 +5,8 @@ if TYPE_CHECKING:
     from aio_pika import Channel, Message, RobustConnection
     from aio_pika.abc import AbstractExchange, AbstractQueue
 
+    from bclib.listener.rabbit.rabbit_message import RabbitMessage
+
 
 T = TypeVar('T')
 
@@ -104,6 +106,56 @@ class IRabbitConnection(Generic[T], ABC):
         """
         pass
 
+    @abstractmethod
+    async def publish_many_async(
+        self,
+        messages: list[Union[Dict[str, Any], 'Message']],
+        routing_key: Optional[str] = None,
+        exchange: Optional[str] = None
+    ) -> None:
+        """
+        Publish a batch of messages with pipelined publisher confirms.
+
+        Args:
+            messages: Messages to publish (dicts will be JSON serialized)
+            routing_key: Optional routing key (for exchange mode)
+            exchange: Optional exchange name (overrides config)
+        """
+        pass
+
+    @abstractmethod
+    async def request_async(
+        self,
+        message: Union[Dict[str, Any], 'Message'],
+        timeout: Optional[float] = 30.0,
+        routing_key: Optional[str] = None,
+        exchange: Optional[str] = None
+    ) -> Any:
+        """
+        Publish a request and wait for its reply (RPC).
+
+        Args:
+            message: Request message (dict will be JSON serialized)
+            timeout: Seconds to wait for the reply (None waits forever)
+            routing_key: Optional routing key (for exchange mode)
+            exchange: Optional exchange name (overrides config)
+
+        Returns:
+            Any: Reply body (JSON-decoded for JSON replies)
+        """
+        pass
+
+    @abstractmethod
+    async def reply_async(self, request: 'RabbitMessage', result: Any) -> None:
+        """
+        Publish result to the reply_to queue of a request message.
+
+        Args:
+            request: Received request message
+            result: Reply value
+        """
+        pass
+
     @abstractmethod
     async def publish_to_queue(self, message: Any, queue: Optional[str] = None) -> None:
         """
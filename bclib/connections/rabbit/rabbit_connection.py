@@ -46,6 +46,7 @@ Configuration Example:
 
 import asyncio
 import json
+import uuid
 from typing import TYPE_CHECKING, Any, Dict, Generic, Optional, TypeVar, Union
 from urllib.parse import urlparse
 
@@ -58,6 +59,8 @@ if TYPE_CHECKING:
     from aio_pika import Channel, Message, RobustConnection
     from aio_pika.abc import AbstractExchange, AbstractQueue
 
+    from bclib.listener.rabbit.rabbit_message import RabbitMessage
+
 
 T = TypeVar('T')
 
@@ -136,6 +139,16 @@ class RabbitConnection(IRabbitConnection[T], Generic[T]):
             - exclusive: Queue is exclusive to this connection
             - auto_delete: Queue/exchange auto-deletes when not in use
             - passive: Don't create queue/exchange, just check if exists
+            - prefetch_count: Channel QoS prefetch count (defaults to concurrency
+              when concurrency > 1, 4 * concurrency with an ordering_key, otherwise
+              broker default)
+            - concurrency: Max messages processed at once by listening_async (default: 1)
+            - ordering_key: Header name; messages sharing its value are processed in
+              order. Messages waiting for their key do not hold a processing slot, so
+              prefetch_count bounds how many are buffered
+            - drain_timeout: Seconds to wait for in-flight messages on shutdown (default: 10)
+            - publish_channels: Number of channels used round-robin for publishing (default: 1)
+            - max_unconfirmed: Max published messages awaiting broker confirm (default: 256)
 
         Raises:
             KeyError: If required configuration keys are missing
@@ -148,12 +161,51 @@ class RabbitConnection(IRabbitConnection[T], Generic[T]):
 
         # Parse listener options
         self._retry_delay: int = int(self._options.get("retry_delay", 10))
+        self._concurrency: int = max(1, int(self._options.get("concurrency", 1)))
+        self._ordering_key: Optional[str] = self._options.get("ordering_key")
+        prefetch_count = self._options.get("prefetch_count")
+        if prefetch_count is None and self._ordering_key:
+            # Leave room for other keys while a busy key has messages waiting
+            prefetch_count = 4 * self._concurrency
+        elif prefetch_count is None and self._concurrency > 1:
+            prefetch_count = self._concurrency
+        self._prefetch_count: Optional[int] = int(
+            prefetch_count) if prefetch_count is not None else None
+        self._drain_timeout: float = float(
+            self._options.get("drain_timeout", 10))
+
+        # In-flight message tasks and per ordering-key locks ([lock, users])
+        self._in_flight: set[asyncio.Task] = set()
+        self._ordering_locks: Dict[Any, list] = {}
+
+        # Publisher options: channel pool and bounded unconfirmed window
+        self._publish_channel_count: int = max(
+            1, int(self._options.get("publish_channels", 1)))
+        self._max_unconfirmed: int = max(
+            1, int(self._options.get("max_unconfirmed", 256)))
+        self._confirm_semaphore: Optional[asyncio.Semaphore] = None
+        # Extra publish channels (slot 0 is the main channel) and per-channel exchange cache
+        self._publish_channels: list['Channel'] = []
+        self._publish_index: int = 0
+        self._exchange_cache: Dict[tuple['Channel', str], 'AbstractExchange'] = {}
+        self._publish_lock: Optional[asyncio.Lock] = None
+
+        # Request/reply (RPC): one exclusive reply queue per connection
+        self._reply_queue: Optional['AbstractQueue'] = None
+        self._reply_lock: Optional[asyncio.Lock] = None
+        self._pending_replies: Dict[str, asyncio.Future] = {}
 
         self._connection: Optional['RobustConnection'] = None
         self._channel: Optional['Channel'] = None
+        # Serialises connects, so concurrent first uses open one connection
+        self._connect_lock: Optional[asyncio.Lock] = None
         self._queue: Optional['AbstractQueue'] = None
         self._exchange: Optional['AbstractExchange'] = None
 
+        # Shared connections (kept per config key by ConnectionRegistry) stay
+        # open when users close them and are disposed by the registry
+        self.shared: bool = False
+
         # Validate required configuration
         self._validate_options()
 
@@ -210,7 +262,7 @@ class RabbitConnection(IRabbitConnection[T], Generic[T]):
             RobustConnection: Active RabbitMQ connection with auto-reconnect
         """
         if self._connection is None or self._connection.is_closed:
-            await self.connect_async()
+            await self._ensure_connected_async()
         return self._connection
 
     async def get_channel_async(self) -> 'Channel':
@@ -221,7 +273,7 @@ class RabbitConnection(IRabbitConnection[T], Generic[T]):
             Channel: Active RabbitMQ channel
         """
         if self._channel is None or self._channel.is_closed:
-            await self.connect_async()
+            await self._ensure_connected_async()
         return self._channel
 
     @property
@@ -259,11 +311,33 @@ class RabbitConnection(IRabbitConnection[T], Generic[T]):
 
     async def connect_async(self) -> None:
         """Establish connection and channel, declare queue/exchange based on mode."""
+        async with self._get_connect_lock():
+            await self._connect_async()
+
+    async def _ensure_connected_async(self) -> None:
+        """Connect unless a concurrent caller connected while we waited for the lock."""
+        async with self._get_connect_lock():
+            if (self._connection is None or self._connection.is_closed or
+                    self._channel is None or self._channel.is_closed or
+                    (self._queue_name and self._queue is None)):
+                await self._connect_async()
+
+    def _get_connect_lock(self) -> asyncio.Lock:
+        if self._connect_lock is None:
+            self._connect_lock = asyncio.Lock()
+        return self._connect_lock
+
+    async def _connect_async(self) -> None:
         import aio_pika
 
         # Create robust connection (auto-reconnect)
         self._connection = await aio_pika.connect_robust(self._url)
         self._channel = await self._connection.channel()
+        self._publish_channels = []
+        self._exchange_cache = {}
+        self._reply_queue = None
+        if self._prefetch_count is not None:
+            await self._channel.set_qos(prefetch_count=self._prefetch_count)
 
         # Declare resources based on connection mode
         if self._exchange_name:
@@ -293,6 +367,10 @@ class RabbitConnection(IRabbitConnection[T], Generic[T]):
         """
         Publish a message to RabbitMQ with automatic JSON serialization.
 
+        Waits for the broker confirm of this message only, so concurrent callers
+        are pipelined (bounded by max_unconfirmed) and spread over the publish
+        channel pool instead of serialising on one channel.
+
         Args:
             message: The message to publish (dict will be JSON serialized, or aio_pika.Message for direct publish)
             routing_key: Optional routing key (overrides config)
@@ -312,45 +390,224 @@ class RabbitConnection(IRabbitConnection[T], Generic[T]):
             await rabbit.publish(msg)
             ```
         """
-        import aio_pika
+        if self._confirm_semaphore is None:
+            self._confirm_semaphore = asyncio.Semaphore(self._max_unconfirmed)
+        aio_message = self._create_message(message)
+        async with self._confirm_semaphore:
+            target_exchange, target_routing_key = await self._get_publish_target_async(
+                routing_key, exchange)
+            # Channels use publisher confirms, so this returns once the broker confirms
+            await target_exchange.publish(
+                message=aio_message,
+                routing_key=target_routing_key
+            )
 
-        # Ensure connection is established
-        channel = await self.get_channel_async()
+    async def publish_many_async(
+        self,
+        messages: list[Union[Dict[str, Any], 'Message']],
+        routing_key: Optional[str] = None,
+        exchange: Optional[str] = None
+    ) -> None:
+        """
+        Publish a batch of messages, pipelining them over the publish channels.
+
+        Up to max_unconfirmed messages are in flight at once; the call returns
+        when every message is confirmed by the broker.
+
+        Args:
+            messages: Messages to publish (dicts are JSON serialized)
+            routing_key: Optional routing key (overrides config)
+            exchange: Optional exchange name (overrides config)
+
+        Raises:
+            Exception: First publish error; remaining publishes still complete
+
+        Example:
+            ```python
+            events = [{'event': 'click', 'id': i} for i in range(10000)]
+            await rabbit.publish_many_async(events, routing_key='ui.click')
+            ```
+        """
+        if not messages:
+            return
+        results = await asyncio.gather(
+            *(self.publish_async(message, routing_key, exchange)
+              for message in messages),
+            return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    def _create_message(self, message: Union[Dict[str, Any], 'Message']) -> 'Message':
+        """Create aio_pika message, serializing non-Message values to JSON."""
+        import aio_pika
 
         # Check if message is already an aio_pika.Message
         if isinstance(message, aio_pika.Message):
-            aio_message = message
-        else:
-            # Serialize dict to JSON
-            message_body = json.dumps(
-                message, ensure_ascii=False).encode('utf-8')
-
-            # Create message with properties
-            aio_message = aio_pika.Message(
-                body=message_body,
-                content_type='application/json',
-                content_encoding='utf-8',
-                delivery_mode=aio_pika.DeliveryMode.PERSISTENT if self._durable else aio_pika.DeliveryMode.NOT_PERSISTENT
-            )
+            return message
+
+        # Serialize dict to JSON
+        message_body = json.dumps(
+            message, ensure_ascii=False).encode('utf-8')
+
+        # Create message with properties
+        return aio_pika.Message(
+            body=message_body,
+            content_type='application/json',
+            content_encoding='utf-8',
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT if self._durable else aio_pika.DeliveryMode.NOT_PERSISTENT
+        )
+
+    async def _get_publish_channel_async(self) -> 'Channel':
+        """
+        Get next publish channel (round-robin over the publish channel pool).
+
+        Slot 0 is the main channel; extra channels are opened lazily on first use.
+        """
+        channel = await self.get_channel_async()
+        if self._publish_channel_count == 1:
+            return channel
+        index = self._publish_index
+        self._publish_index = (index + 1) % self._publish_channel_count
+        if index == 0:
+            return channel
+        if self._publish_lock is None:
+            self._publish_lock = asyncio.Lock()
+        async with self._publish_lock:
+            while len(self._publish_channels) < index:
+                self._publish_channels.append(await self._connection.channel())
+        publish_channel = self._publish_channels[index - 1]
+        if publish_channel.is_closed:
+            # Exchanges cached for the closed channel are bound to it
+            self._exchange_cache = {key: value for key, value in self._exchange_cache.items()
+                                    if key[0] is not publish_channel}
+            publish_channel = self._publish_channels[index - 1] = await self._connection.channel()
+        return publish_channel
+
+    async def _get_publish_target_async(
+        self,
+        routing_key: Optional[str],
+        exchange: Optional[str]
+    ) -> tuple['AbstractExchange', str]:
+        """
+        Resolve exchange object and routing key for a publish.
+
+        Exchange objects are cached per channel, so get_exchange is only called
+        once per (channel, exchange name).
+        """
+        channel = await self._get_publish_channel_async()
 
         # Determine target exchange and routing key from config or parameters
         target_exchange_name = exchange or self._exchange_name
         target_routing_key = routing_key or self._routing_key or self._queue_name or ''
 
-        # Get or declare exchange
-        if target_exchange_name and not self._exchange:
-            target_exchange = await channel.get_exchange(target_exchange_name)
-        elif self._exchange:
-            target_exchange = self._exchange
-        else:
+        if not target_exchange_name:
             # Use default exchange for direct queue publishing
-            target_exchange = channel.default_exchange
+            return channel.default_exchange, target_routing_key
+        if channel is self._channel and self._exchange is not None and target_exchange_name == self._exchange_name:
+            return self._exchange, target_routing_key
+
+        cache_key = (channel, target_exchange_name)
+        target_exchange = self._exchange_cache.get(cache_key)
+        if target_exchange is None:
+            # Configured exchange is declared in connect_async, no need to check it again
+            target_exchange = await channel.get_exchange(
+                target_exchange_name, ensure=target_exchange_name != self._exchange_name)
+            self._exchange_cache[cache_key] = target_exchange
+        return target_exchange, target_routing_key
+
+    async def request_async(
+        self,
+        message: Union[Dict[str, Any], 'Message'],
+        timeout: Optional[float] = 30.0,
+        routing_key: Optional[str] = None,
+        exchange: Optional[str] = None
+    ) -> Any:
+        """
+        Publish a request and wait for its reply (RPC over RabbitMQ).
 
-        # Publish message
-        await target_exchange.publish(
-            message=aio_message,
-            routing_key=target_routing_key
-        )
+        Replies arrive on one exclusive reply queue per connection and are
+        matched to the awaiting caller by correlation_id. The worker side is a
+        rabbit_handler; its return value is published back automatically.
+
+        Args:
+            message: Request message (dict will be JSON serialized)
+            timeout: Seconds to wait for the reply (None waits forever)
+            routing_key: Optional routing key (overrides config)
+            exchange: Optional exchange name (overrides config)
+
+        Returns:
+            Any: Reply body, JSON-decoded for JSON replies, raw bytes otherwise
+
+        Raises:
+            asyncio.TimeoutError: If no reply arrives within timeout
+
+        Example:
+            ```python
+            price = await rabbit.request_async({'sku': 'A-100'}, timeout=5)
+            ```
+        """
+        reply_queue = await self._get_reply_queue_async()
+        aio_message = self._create_message(message)
+        correlation_id = uuid.uuid4().hex
+        aio_message.correlation_id = correlation_id
+        aio_message.reply_to = reply_queue.name
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending_replies[correlation_id] = future
+        try:
+            await self.publish_async(aio_message, routing_key, exchange)
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending_replies.pop(correlation_id, None)
+
+    async def reply_async(self, request: 'RabbitMessage', result: Any) -> None:
+        """
+        Publish result as the reply of a request message.
+
+        No-op when the request has no reply_to.
+
+        Args:
+            request: Received request message
+            result: Reply value (dict/list will be JSON serialized)
+        """
+        import aio_pika
+
+        if not request.reply_to:
+            return
+        aio_message = self._create_message(result)
+        aio_message.correlation_id = request.correlation_id
+        # Reply queues are transient, so replies are never persisted
+        aio_message.delivery_mode = aio_pika.DeliveryMode.NOT_PERSISTENT
+        channel = await self._get_publish_channel_async()
+        await channel.default_exchange.publish(aio_message, routing_key=request.reply_to)
+
+    async def _get_reply_queue_async(self) -> 'AbstractQueue':
+        """Declare the exclusive reply queue and start consuming it (once per connection)."""
+        if self._reply_queue is not None and self.is_connected:
+            return self._reply_queue
+        if self._reply_lock is None:
+            self._reply_lock = asyncio.Lock()
+        async with self._reply_lock:
+            if self._reply_queue is None or not self.is_connected:
+                channel = await self.get_channel_async()
+                queue = await channel.declare_queue(exclusive=True, auto_delete=True)
+                await queue.consume(self._on_reply_async, no_ack=True)
+                self._reply_queue = queue
+        return self._reply_queue
+
+    async def _on_reply_async(self, message) -> None:
+        """Resolve the future waiting for this reply (late or unknown replies are dropped)."""
+        future = self._pending_replies.get(message.correlation_id)
+        if future is None or future.done():
+            return
+        if message.content_type == 'application/json':
+            try:
+                future.set_result(json.loads(message.body))
+            except ValueError as ex:
+                future.set_exception(ex)
+        else:
+            future.set_result(message.body)
 
     async def publish_to_queue(self, message: Any, queue: Optional[str] = None) -> None:
         """
@@ -457,7 +714,7 @@ class RabbitConnection(IRabbitConnection[T], Generic[T]):
             raise ValueError("No queue configured for this connection")
 
         if self._queue is None:
-            await self.connect_async()
+            await self._ensure_connected_async()
 
         return self._queue
 
@@ -474,7 +731,7 @@ class RabbitConnection(IRabbitConnection[T], Generic[T]):
                 # Ensure fresh connection (close old one if needed)
                 if self.is_connected:
                     try:
-                        await self.close_async()
+                        await self.dispose_async()
                     except:
                         pass
 
@@ -492,15 +749,22 @@ class RabbitConnection(IRabbitConnection[T], Generic[T]):
                 # Consume messages using async iterator
                 queue_iter = queue.iterator()
                 async with queue_iter:
-                    async for message in queue_iter:
-                        try:
-                            async with message.process():
-                                await self._process_message(message)
-                        except Exception as ex:
-                            if self._logger:
-                                self._logger.error(
-                                    f"Error processing message from {self.host}:{self.queue_name} - {ex}")
-
+                    if self._concurrency == 1 and not self._ordering_key:
+                        async for message in queue_iter:
+                            await self._handle_message_async(message)
+                    else:
+                        # Bounded pool: at most `concurrency` messages processed at once
+                        semaphore = asyncio.Semaphore(self._concurrency)
+                        async for message in queue_iter:
+                            key = self._get_ordering_key(message)
+                            if key is None:
+                                await semaphore.acquire()
+                            task = asyncio.create_task(
+                                self._handle_message_in_pool_async(message, key, semaphore))
+                            self._in_flight.add(task)
+                            task.add_done_callback(self._in_flight.discard)
+
+                await self._drain_async()
                 break  # Exit if consumption completes normally
 
             except asyncio.CancelledError:
@@ -512,10 +776,13 @@ class RabbitConnection(IRabbitConnection[T], Generic[T]):
                 except:
                     pass  # Ignore logging errors during shutdown
 
+                # Let in-flight messages finish (and ack) before closing the channel
+                await self._drain_async()
+
                 # Try to close gracefully
                 try:
                     if self.is_connected:
-                        await asyncio.wait_for(self.close_async(), timeout=2.0)
+                        await asyncio.wait_for(self.dispose_async(), timeout=2.0)
                 except (asyncio.TimeoutError, RuntimeError):
                     # Force close if async close fails
                     try:
@@ -539,8 +806,9 @@ class RabbitConnection(IRabbitConnection[T], Generic[T]):
                     pass
 
                 # Close connection
+                await self._drain_async()
                 try:
-                    await self.close_async()
+                    await self.dispose_async()
                 except:
                     pass
 
@@ -557,11 +825,94 @@ class RabbitConnection(IRabbitConnection[T], Generic[T]):
                 # If cancelled during sleep, cleanup and exit
                 try:
                     if self.is_connected:
-                        await asyncio.wait_for(self.close_async(), timeout=2.0)
+                        await asyncio.wait_for(self.dispose_async(), timeout=2.0)
                 except:
                     pass
                 raise
 
+    async def _handle_message_async(self, message) -> None:
+        """
+        Process a single message and ack it on success or reject it on failure.
+
+        Messages already rejected by _process_message (see RabbitMessage.nack)
+        are not acked again.
+
+        Args:
+            message: aio_pika IncomingMessage instance
+        """
+        try:
+            async with message.process(ignore_processed=True):
+                await self._process_message(message)
+        except Exception as ex:
+            if self._logger:
+                self._logger.error(
+                    f"Error processing message from {self.host}:{self.queue_name} - {ex}")
+
+    def _get_ordering_key(self, message) -> Any:
+        """Get the ordering key of a message, None if it has none or none is configured."""
+        if not self._ordering_key:
+            return None
+        return (message.headers or {}).get(self._ordering_key)
+
+    async def _handle_message_in_pool_async(
+            self, message, key: Any, semaphore: asyncio.Semaphore) -> None:
+        """
+        Process a message as a pool task, serialised per ordering key if configured.
+
+        Tasks are created in delivery order and asyncio.Lock wakes waiters in FIFO
+        order, so messages that share an ordering key are processed in order. A
+        keyed message takes its pool slot only once it holds the key lock, so
+        messages queued behind a busy key do not block other keys.
+
+        Args:
+            message: aio_pika IncomingMessage instance
+            key: Ordering key of the message, None if it has none
+            semaphore: Pool semaphore, already acquired by the consumer loop for
+                messages without key
+        """
+        if key is None:
+            try:
+                await self._handle_message_async(message)
+            finally:
+                semaphore.release()
+            return
+
+        entry = self._ordering_locks.get(key)
+        if entry is None:
+            entry = self._ordering_locks[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                async with semaphore:
+                    await self._handle_message_async(message)
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                self._ordering_locks.pop(key, None)
+
+    async def _drain_async(self) -> None:
+        """
+        Wait for in-flight message tasks to finish, up to drain_timeout seconds.
+
+        Tasks still running after the timeout are cancelled; their messages are
+        not acked and will be redelivered by the broker.
+        """
+        if not self._in_flight:
+            return
+        pending = set(self._in_flight)
+        if self._logger:
+            try:
+                self._logger.info(
+                    f"Waiting for {len(pending)} in-flight message(s) to complete...")
+            except:
+                pass
+        try:
+            _, not_done = await asyncio.wait(pending, timeout=self._drain_timeout)
+        except asyncio.CancelledError:
+            not_done = pending
+        for task in not_done:
+            task.cancel()
+
     async def _on_message_received(self, rabbit_message):
         """
         Handle received message. Override this method in derived classes.
@@ -593,11 +944,14 @@ class RabbitConnection(IRabbitConnection[T], Generic[T]):
             method=None,
             properties=message.properties if hasattr(
                 message, 'properties') else None,
-            routing_key=message.routing_key or self.routing_key
+            routing_key=message.routing_key or self.routing_key,
+            connection=self
         )
 
         # Call overridable handler
         await self._on_message_received(rabbit_message)
+        if rabbit_message.nacked:
+            await message.reject(requeue=rabbit_message.requeue)
 
     async def close_async(self) -> None:
         """
@@ -605,7 +959,30 @@ class RabbitConnection(IRabbitConnection[T], Generic[T]):
 
         Note:
             Connection will be automatically closed when used as async context manager.
+            Shared connections stay open until disposed by ConnectionRegistry.
         """
+        if not self.shared:
+            await self.dispose_async()
+
+    async def dispose_async(self) -> None:
+        """Close channels and the RabbitMQ connection, even if shared."""
+        # Close extra publish channels
+        for publish_channel in self._publish_channels:
+            try:
+                if not publish_channel.is_closed:
+                    await asyncio.wait_for(publish_channel.close(), timeout=3.0)
+            except Exception:
+                pass
+        self._publish_channels = []
+        self._exchange_cache = {}
+
+        # Fail pending requests, their reply queue goes away with the channel
+        self._reply_queue = None
+        for future in self._pending_replies.values():
+            if not future.done():
+                future.set_exception(ConnectionError(
+                    "RabbitMQ connection closed before reply was received"))
+
         # Close channel
         if self._channel is not None:
             try:
@@ -79,6 +79,10 @@ def add_restful_connection(service_container: IServiceContainer) -> IServiceCont
     This allows you to inject IRestfulConnection[TConfig] directly into your services without
     inheritance - similar to ILogger<T> pattern.
 
+    One shared RestfulConnection (and so one pooled aiohttp session) is kept per
+    configuration key in the ConnectionRegistry; each request scope gets a cheap
+    handle on it. The shared sessions are closed on application shutdown.
+
     Args:
         service_container: The DI container to register services in
 
@@ -124,6 +128,7 @@ def add_restful_connection(service_container: IServiceContainer) -> IServiceCont
         - headers (optional): Default headers for all requests
         - ssl_verify (optional): Enable/disable SSL certificate verification (default: true)
         - ssl_cert_path (optional): Path to custom CA certificate bundle
+        - cache (optional): true or HttpCache options to cache GET responses
 
         Example:
         ```json
@@ -150,37 +155,45 @@ def add_restful_connection(service_container: IServiceContainer) -> IServiceCont
     from bclib.di import IServiceProvider, extract_generic_type_key
     from bclib.options import IOptions
 
-    from .restful_connection import RestfulConnection
+    from ..connection_registry import ConnectionRegistry, add_connection_registry
 
     def create_restful_connection(service_provider: IServiceProvider, **kwargs):
         """
-        Factory function for creating RestfulConnection instances.
+        Factory function for creating RestfulConnection handles.
 
         This factory is called by the DI container when resolving IRestfulConnection[T].
-        It extracts the configuration key from generic type arguments and creates
-        a RestfulConnection with the appropriate configuration.
+        It extracts the configuration key from generic type arguments, gets the shared
+        RestfulConnection of that key from the ConnectionRegistry (created on first use)
+        and returns a cheap handle using its session, cache and metrics.
 
         Args:
             service_provider: Service provider for resolving dependencies
             **kwargs: Contains 'generic_type_args' with configuration key
 
         Returns:
-            RestfulConnection instance configured for the specified key
+            RestfulConnection handle configured for the specified key
 
         Note:
             This is an internal factory function. Use add_restful_connection() to register
             the service, then inject IRestfulConnection[TConfig] in your services.
         """
+        from .restful_connection import RestfulConnection
+
         # Extract configuration key from generic type arguments
         key = extract_generic_type_key(kwargs)
 
         # Get configuration options for this key
         options = service_provider.get_service(IOptions[key])
 
-        # Create and return RestfulConnection
-        return service_provider.create_instance(RestfulConnection, options=options, **kwargs)
+        # The shared connection outlives the scope, so it is built from the root provider
+        shared = service_provider.get_service(ConnectionRegistry).get_or_create(
+            'restful', key,
+            lambda: service_provider.get_service(IServiceProvider).create_instance(
+                RestfulConnection, options=options, **kwargs))
+        return service_provider.create_instance(RestfulConnection, options=options, shared=shared, **kwargs)
 
-    return service_container.add_transient(
+    add_connection_registry(service_container)
+    return service_container.add_scoped(
         IRestfulConnection,
         factory=create_restful_connection
     )
@@ -0,0 +1,219 @@
+"""Client-side HTTP cache for RestfulConnection GET requests"""
+import asyncio
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+
+
+class HttpCacheEntry:
+    """
+    Cached GET response
+
+    Holds the parsed response value with its validators (ETag, Last-Modified)
+    and freshness lifetime computed from the response headers.
+    """
+
+    __slots__ = ('status', 'value', 'size', 'etag',
+                 'last_modified', 'stored_at', 'ttl')
+
+    def __init__(self, status: int, value: Any, size: int, etag: Optional[str],
+                 last_modified: Optional[str], ttl: float) -> None:
+        self.status = status
+        self.value = value
+        self.size = size
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = time.monotonic()
+        self.ttl = ttl
+
+    @property
+    def age(self) -> float:
+        """Get seconds since the entry was stored or last revalidated"""
+        return time.monotonic() - self.stored_at
+
+    @property
+    def has_validator(self) -> bool:
+        """Check if the entry can be revalidated with a conditional request"""
+        return self.etag is not None or self.last_modified is not None
+
+    def is_fresh(self, max_age: Optional[float] = None) -> bool:
+        """
+        Check if the entry can be served without contacting the server
+
+        Args:
+            max_age: Per-call lifetime overriding the one from the response headers
+
+        Returns:
+            bool: True if the entry is younger than its lifetime
+        """
+        return self.age < (self.ttl if max_age is None else max_age)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Get If-None-Match / If-Modified-Since headers for revalidation"""
+        headers = {}
+        if self.etag is not None:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def refresh(self, ttl: float) -> None:
+        """Mark the entry as revalidated with a new lifetime"""
+        self.stored_at = time.monotonic()
+        self.ttl = ttl
+
+
+class HttpCache:
+    """
+    LRU cache of GET responses, bounded by entry count and/or total bytes
+
+    Honours Cache-Control (no-store, no-cache, max-age), Age and Expires for
+    freshness, does not store "Vary: *" responses and keeps ETag/Last-Modified validators so stale entries are
+    revalidated with conditional requests. Concurrent identical GETs share
+    one in-flight request (see `in_flight`).
+
+    Cached values are shared between callers and must be treated as read-only.
+
+    Options:
+        - max_entries: Max cached responses (default: 1000)
+        - max_bytes: Max total size of cached bodies, None for no limit (default: None)
+        - default_ttl: Lifetime in seconds of responses without freshness
+          headers (default: 0, revalidate every time when a validator exists)
+    """
+
+    def __init__(self, options: Optional[Mapping] = None) -> None:
+        """
+        Initialize cache
+
+        Args:
+            options: Cache options (see class docstring)
+        """
+        options = options or {}
+        self.max_entries: int = max(1, int(options.get('max_entries', 1000)))
+        max_bytes = options.get('max_bytes')
+        self.max_bytes: Optional[int] = None if max_bytes is None else int(
+            max_bytes)
+        self.default_ttl: float = float(options.get('default_ttl', 0))
+        self.__entries: OrderedDict[Hashable,
+                                    HttpCacheEntry] = OrderedDict()
+        self.__bytes = 0
+        # Requests in progress, shared by concurrent identical GETs
+        self.in_flight: Dict[Hashable, asyncio.Future] = dict()
+        self.hit_count = 0
+        self.miss_count = 0
+        self.revalidated_count = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Get total size of cached bodies"""
+        return self.__bytes
+
+    @staticmethod
+    def make_key(path: str, params: Optional[Mapping[str, Any]], headers: Optional[Mapping[str, str]]) -> Tuple:
+        """
+        Build the cache key of a GET request
+
+        Args:
+            path: Request path
+            params: Query parameters
+            headers: Additional request headers
+
+        Returns:
+            Tuple: Hashable key, independent of parameter and header order
+        """
+        return (path,
+                tuple(sorted((str(k), str(v)) for k, v in params.items())) if params else (),
+                tuple(sorted((k.lower(), v) for k, v in headers.items())) if headers else ())
+
+    def get(self, key: Hashable) -> Optional[HttpCacheEntry]:
+        """
+        Get an entry and mark it as most recently used
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[HttpCacheEntry]: Cached entry, fresh or stale, or None
+        """
+        entry = self.__entries.get(key)
+        if entry is not None:
+            self.__entries.move_to_end(key)
+        return entry
+
+    def set(self, key: Hashable, entry: HttpCacheEntry) -> None:
+        """
+        Store an entry, evicting least recently used entries over the bounds
+
+        Args:
+            key: Cache key
+            entry: Entry to store
+        """
+        self.remove(key)
+        if self.max_bytes is not None and entry.size > self.max_bytes:
+            return
+        self.__entries[key] = entry
+        self.__bytes += entry.size
+        while len(self.__entries) > self.max_entries or \
+                (self.max_bytes is not None and self.__bytes > self.max_bytes):
+            _, evicted = self.__entries.popitem(last=False)
+            self.__bytes -= evicted.size
+
+    def remove(self, key: Hashable) -> None:
+        """Remove an entry if cached"""
+        entry = self.__entries.pop(key, None)
+        if entry is not None:
+            self.__bytes -= entry.size
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self.__entries.clear()
+        self.__bytes = 0
+
+    def get_ttl(self, headers: Mapping[str, str]) -> Optional[float]:
+        """
+        Compute the freshness lifetime of a response
+
+        Args:
+            headers: Response headers
+
+        Returns:
+            Optional[float]: Lifetime in seconds, or None if the response must not be stored
+        """
+        if any(name.strip() == '*' for name in headers.get('Vary', '').split(',')):
+            # Response depends on more than the request headers in the key
+            return None
+        directives = {}
+        for directive in headers.get('Cache-Control', '').split(','):
+            name, _, value = directive.strip().partition('=')
+            if name:
+                directives[name.lower()] = value.strip('"')
+        if 'no-store' in directives:
+            return None
+        if 'no-cache' in directives:
+            return 0.0
+        age = HttpCache.__to_seconds(headers.get('Age')) or 0
+        if 'max-age' in directives:
+            max_age = HttpCache.__to_seconds(directives['max-age'])
+            return None if max_age is None else max(0.0, max_age - age)
+        if 'Expires' in headers:
+            try:
+                expires = parsedate_to_datetime(headers['Expires'])
+                date = parsedate_to_datetime(headers['Date']) \
+                    if 'Date' in headers else None
+                now = date.timestamp() if date else time.time()
+                return max(0.0, expires.timestamp() - now - age)
+            except (TypeError, ValueError):
+                # Invalid Expires means already expired
+                return 0.0
+        return self.default_ttl
+
+    @staticmethod
+    def __to_seconds(value: Optional[str]) -> Optional[float]:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
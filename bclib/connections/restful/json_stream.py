@@ -0,0 +1,187 @@
+"""Incremental parsing of streamed JSON arrays"""
+import json
+import re
+from typing import Any, List
+
+
+class JsonArrayParser:
+    """
+    Incremental parser for a top-level JSON array
+
+    Text is fed in arbitrary pieces and complete array items are returned as
+    soon as they are received, so large arrays can be processed without
+    holding the whole payload in memory.
+
+    Items that are complete within a piece are decoded directly. An item
+    split over pieces is scanned once: the parser keeps its state inside the
+    item (nesting depth, string and escape state) between pieces and decodes
+    it when its end was found, so a large item is not parsed again from the
+    start for every piece.
+
+    Example:
+        ```python
+        parser = JsonArrayParser()
+        async for chunk in response.content.iter_chunked(65536):
+            for item in parser.feed(chunk.decode()):
+                process(item)
+        parser.close()
+        ```
+    """
+
+    _WHITESPACE = ' \t\n\r'
+    # Next character that changes the scan state inside a string / a container / a scalar
+    _STRING_SPECIAL = re.compile(r'["\\]')
+    _CONTAINER_SPECIAL = re.compile(r'["\[\]{}]')
+    _SCALAR_END = re.compile(r'[ \t\n\r,\]"\[{}]')
+
+    # What the parser expects next outside of an item
+    _OPEN, _VALUE_OR_CLOSE, _VALUE, _COMMA_OR_CLOSE, _END = range(5)
+
+    def __init__(self) -> None:
+        self.__decoder = json.JSONDecoder()
+        self.__expect = JsonArrayParser._OPEN
+        # Text of the item being received, joined once the item is complete
+        self.__item_parts: List[str] = []
+        self.__in_item = False
+        self.__depth = 0
+        self.__in_string = False
+        self.__escape = False
+
+    @property
+    def finished(self) -> bool:
+        """Check if the closing bracket of the array was received"""
+        return self.__expect == JsonArrayParser._END
+
+    def feed(self, text: str) -> List[Any]:
+        """
+        Add received text and get the items completed by it
+
+        Args:
+            text: Next piece of the JSON document
+
+        Returns:
+            List[Any]: Items completed by this piece, in order
+
+        Raises:
+            ValueError: If the document is not a JSON array
+        """
+        items = []
+        position = 0
+        length = len(text)
+        while position < length:
+            if self.__in_item:
+                end = self.__scan_item(text, position)
+                if end < 0:
+                    self.__item_parts.append(text[position:])
+                    break
+                self.__item_parts.append(text[position:end])
+                items.append(json.loads(''.join(self.__item_parts)))
+                self.__item_parts = []
+                self.__in_item = False
+                self.__expect = JsonArrayParser._COMMA_OR_CLOSE
+                position = end
+                continue
+            char = text[position]
+            if char in self._WHITESPACE:
+                position += 1
+                continue
+            expect = self.__expect
+            if expect == JsonArrayParser._END:
+                raise ValueError("Unexpected data after end of JSON array")
+            if expect == JsonArrayParser._OPEN:
+                if char != '[':
+                    raise ValueError("JSON document is not an array")
+                self.__expect = JsonArrayParser._VALUE_OR_CLOSE
+            elif expect == JsonArrayParser._COMMA_OR_CLOSE:
+                if char == ',':
+                    self.__expect = JsonArrayParser._VALUE
+                elif char == ']':
+                    self.__expect = JsonArrayParser._END
+                else:
+                    raise ValueError(f"Expected ',' or ']' in JSON array, got {char!r}")
+            elif char == ']' and expect == JsonArrayParser._VALUE_OR_CLOSE:
+                self.__expect = JsonArrayParser._END
+            elif char in ',]}:':
+                raise ValueError(f"Expected a value in JSON array, got {char!r}")
+            else:
+                try:
+                    item, end = self.__decoder.raw_decode(text, position)
+                except json.JSONDecodeError:
+                    end = -1
+                # A number or literal is only complete when a delimiter follows it,
+                # at the end of the piece it may still continue
+                if end >= 0 and (char in '"[{' or (end < length and text[end] in ' \t\n\r,]')):
+                    items.append(item)
+                    self.__expect = JsonArrayParser._COMMA_OR_CLOSE
+                    position = end
+                    continue
+                # Item continues in the next piece (or is invalid), the scan above consumes it
+                self.__in_item = True
+                self.__depth = 0
+                self.__in_string = False
+                self.__escape = False
+                continue
+            position += 1
+        return items
+
+    def close(self) -> None:
+        """
+        Check that the whole array was received
+
+        Raises:
+            ValueError: If the array is incomplete
+        """
+        if not self.finished:
+            raise ValueError("Incomplete JSON array")
+
+    def __scan_item(self, text: str, position: int) -> int:
+        """
+        Continue scanning the current item
+
+        Returns:
+            int: Index in text just after the item, -1 if the item continues in the next piece
+        """
+        length = len(text)
+        while position < length:
+            if self.__in_string:
+                if self.__escape:
+                    self.__escape = False
+                    position += 1
+                    continue
+                match = self._STRING_SPECIAL.search(text, position)
+                if match is None:
+                    return -1
+                position = match.end()
+                if match.group() == '\\':
+                    self.__escape = True
+                    continue
+                self.__in_string = False
+                if self.__depth == 0:
+                    return position
+                continue
+            if self.__depth == 0:
+                if text[position] == '"':
+                    self.__in_string = True
+                    position += 1
+                    continue
+                if text[position] in '[{':
+                    self.__depth = 1
+                    position += 1
+                    continue
+                # Number or literal, ends at whitespace or a delimiter
+                match = self._SCALAR_END.search(text, position)
+                return -1 if match is None else match.start()
+            match = self._CONTAINER_SPECIAL.search(text, position)
+            if match is None:
+                return -1
+            position = match.end()
+            char = match.group()
+            if char == '"':
+                self.__in_string = True
+            elif char in '[{':
+                self.__depth += 1
+            else:
+                self.__depth -= 1
+                if self.__depth == 0:
+                    return position
+        return -1
@@ -0,0 +1,128 @@
+"""Retry and hedging policies for RestfulConnection bulk requests"""
+import random
+from collections import deque
+from typing import Mapping, Optional
+
+# Methods that can be sent more than once without changing the outcome
+IDEMPOTENT_METHODS = frozenset(
+    ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'))
+
+
+class RetryPolicy:
+    """
+    Retry with jittered exponential backoff
+
+    Only idempotent methods are retried, on connection errors, timeouts and
+    retryable statuses. The delay before retry n is a random value between 0
+    and min(max_delay, base_delay * 2 ** n) ("full jitter").
+
+    Options:
+        - attempts: Max attempts including the first one (default: 3)
+        - base_delay: Backoff base in seconds (default: 0.1)
+        - max_delay: Backoff cap in seconds (default: 2)
+        - statuses: Retryable response statuses (default: 429, 502, 503, 504)
+    """
+
+    def __init__(self, options: Optional[Mapping] = None) -> None:
+        options = options or {}
+        self.attempts: int = max(1, int(options.get('attempts', 3)))
+        self.base_delay: float = float(options.get('base_delay', 0.1))
+        self.max_delay: float = float(options.get('max_delay', 2))
+        self.statuses: frozenset = frozenset(
+            options.get('statuses', (429, 502, 503, 504)))
+
+    def get_delay(self, retry: int) -> float:
+        """
+        Get the backoff before a retry
+
+        Args:
+            retry: Zero based retry number
+
+        Returns:
+            float: Delay in seconds
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** retry))
+
+
+class HedgePolicy:
+    """
+    Hedged requests: send a duplicate when the first one is slow
+
+    The duplicate is sent after `delay` seconds or, when no delay is set,
+    after the observed p95 latency of the connection. The first reply wins
+    and the other request is cancelled. Only idempotent methods are hedged.
+
+    Options:
+        - delay: Fixed hedge delay in seconds (default: None, use p95)
+        - min_samples: Latency samples needed before hedging on p95 (default: 20)
+    """
+
+    def __init__(self, options: Optional[Mapping] = None) -> None:
+        options = options or {}
+        delay = options.get('delay')
+        self.delay: Optional[float] = None if delay is None else float(delay)
+        self.min_samples: int = int(options.get('min_samples', 20))
+
+    def get_delay(self, latencies: 'LatencyTracker') -> Optional[float]:
+        """
+        Get the hedge delay
+
+        Args:
+            latencies: Recent latencies of the connection
+
+        Returns:
+            Optional[float]: Delay in seconds, None to not hedge yet
+        """
+        if self.delay is not None:
+            return self.delay
+        if len(latencies) < self.min_samples:
+            return None
+        return latencies.percentile(95)
+
+
+class LatencyTracker:
+    """Sliding window of request latencies"""
+
+    def __init__(self, size: int = 200) -> None:
+        self.__samples: deque = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self.__samples)
+
+    def add(self, latency: float) -> None:
+        """Record a latency in seconds"""
+        self.__samples.append(latency)
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """Get the given percentile of the recorded latencies, None when empty"""
+        if not self.__samples:
+            return None
+        samples = sorted(self.__samples)
+        return samples[min(len(samples) - 1, int(len(samples) * percent / 100))]
+
+
+def to_policy(value, policy_type: type, default: Optional[Mapping] = None):
+    """
+    Build a policy from a per-call value or the connection option
+
+    Args:
+        value: None to use default, False to disable, True for defaults, a
+            dict of options or a policy instance
+        policy_type: RetryPolicy or HedgePolicy
+        default: Connection option used when value is None
+
+    Returns:
+        Policy instance or None when disabled
+    """
+    if value is None:
+        value = default
+    if value is None or value is False:
+        return None
+    if isinstance(value, policy_type):
+        return value
+    return policy_type(value if isinstance(value, Mapping) else None)
+
+
+def is_idempotent(method: str) -> bool:
+    """Check if an HTTP method can be retried or hedged"""
+    return method.upper() in IDEMPOTENT_METHODS
@@ -1,7 +1,13 @@
 """RESTful HTTP Connection - Enhanced with certifi and raise_for_status"""
 import asyncio
+import codecs
+import json as jsonlib
+import re
 import ssl
-from typing import Any, Dict, Generic, Optional, TypeVar
+import time
+from contextlib import asynccontextmanager
+from typing import (TYPE_CHECKING, Any, AsyncIterator, Dict, Generic,
+                    Hashable, Iterable, List, Optional, Tuple, TypeVar, Union)
 
 import aiohttp
 from aiohttp import ClientResponse, ClientSession, ClientTimeout, TCPConnector
@@ -9,10 +15,20 @@ from aiohttp import ClientResponse, ClientSession, ClientTimeout, TCPConnector
 from bclib.logger.ilogger import ILogger
 from bclib.options import IOptions
 
+from .http_cache import HttpCache, HttpCacheEntry
 from .irestful_connection import IRestfulConnection
+from .json_stream import JsonArrayParser
+from .request_policy import (HedgePolicy, LatencyTracker, RetryPolicy,
+                             is_idempotent, to_policy)
+
+if TYPE_CHECKING:
+    from bclib.context.http_context import HttpContext
 
 T = TypeVar('T')
 
+# Content types parsed as JSON (same rule as aiohttp ClientResponse.json)
+_JSON_CONTENT_TYPE = re.compile(r'^application/(?:[\w.+-]+?\+)?json')
+
 
 class RestfulConnection(IRestfulConnection[T], Generic[T]):
     """
@@ -26,6 +42,10 @@ class RestfulConnection(IRestfulConnection[T], Generic[T]):
         - Session management with connection pooling
         - Type-safe configuration through generics
         - Automatic session cleanup
+        - Opt-in GET response cache (Cache-Control, ETag/Last-Modified
+          revalidation, coalescing of concurrent identical GETs)
+        - Bulk requests with a concurrency limit, retry and hedging (map_async)
+        - Streaming of large responses (bytes, lines, NDJSON, JSON array items)
 
     Configuration (in host.json):
         ```json
@@ -38,11 +58,41 @@ class RestfulConnection(IRestfulConnection[T], Generic[T]):
                     "Content-Type": "application/json"
                 },
                 "ssl_verify": true,
-                "ssl_cert_path": "/path/to/cert.pem"
+                "ssl_cert_path": "/path/to/cert.pem",
+                "cache": {
+                    "max_entries": 1000,
+                    "max_bytes": 10485760,
+                    "default_ttl": 0
+                },
+                "retry": {"attempts": 3, "base_delay": 0.1},
+                "hedge": {"min_samples": 20}
             }
         }
         ```
 
+    Caching:
+        GET responses are cached only when "cache" is set (true or an options
+        dict, see HttpCache). Each configuration key has its own cache, shared
+        by the handles of its connection, so responses fetched with one key's
+        default headers (e.g. credentials) are never served to another key.
+        Request headers are part of the cache key and responses with
+        "Vary: *" are not stored. Fresh entries are served without a request, stale
+        entries with an ETag/Last-Modified are revalidated with a conditional
+        request, and concurrent identical GETs wait for one request. Cached
+        values are shared and must not be mutated.
+
+    Bulk requests:
+        map_async sends many requests with a concurrency limit and returns the
+        results in request order. Idempotent requests are retried with
+        jittered backoff ("retry", see RetryPolicy) and can be hedged ("hedge",
+        see HedgePolicy). Counters are exposed by the metrics property.
+
+    Streaming:
+        stream_async, iter_lines_async, iter_ndjson_async and
+        iter_json_array_async read the response body incrementally instead
+        of buffering it; pipe_async forwards a downstream response to an
+        Edge streaming response chunk by chunk.
+
     Usage:
         ```python
         class UserService:
@@ -66,10 +116,16 @@ class RestfulConnection(IRestfulConnection[T], Generic[T]):
         ```
     """
 
+    # State a handle takes over from its shared connection
+    _SHARED_STATE = ('_base_url', '_timeout', '_default_headers', '_ssl_verify',
+                     '_ssl_cert_path', '_ssl_context', '_cache', '_retry_options',
+                     '_hedge_options', '_latencies', '_stats')
+
     def __init__(
         self,
         options: IOptions['RestfulConnection[T]'],
-        logger: Optional[ILogger['RestfulConnection[T]']] = None
+        logger: Optional[ILogger['RestfulConnection[T]']] = None,
+        shared: Optional['RestfulConnection[T]'] = None
     ):
         """
         Initialize RESTful connection.
@@ -77,12 +133,21 @@ class RestfulConnection(IRestfulConnection[T], Generic[T]):
         Args:
             options: Configuration options for this connection
             logger: Optional logger for connection events
+            shared: Connection whose session, cache and metrics this handle
+                uses (owned elsewhere); closing the handle leaves them open
         """
         self._options = options
         self._logger = logger
+        self._shared = shared
         self._session: Optional[ClientSession] = None
         self._session_lock = asyncio.Lock()
 
+        if shared is not None:
+            # Cheap handle: no SSL context or session of its own
+            for name in RestfulConnection._SHARED_STATE:
+                setattr(self, name, getattr(shared, name))
+            return
+
         # Parse configuration
         self._base_url = self._options.get('base_url', '')
         self._timeout = self._options.get('timeout', 30)
@@ -97,6 +162,19 @@ class RestfulConnection(IRestfulConnection[T], Generic[T]):
         # Create SSL context
         self._ssl_context = self._create_ssl_context()
 
+        cache_options = self._options.get('cache')
+        self._cache: Optional[HttpCache] = None
+        if cache_options:
+            self._cache = HttpCache(
+                cache_options if isinstance(cache_options, dict) else None)
+
+        # Bulk request policies and metrics
+        self._retry_options = self._options.get('retry')
+        self._hedge_options = self._options.get('hedge')
+        self._latencies = LatencyTracker()
+        self._stats: Dict[str, int] = {
+            'requests': 0, 'retries': 0, 'hedges': 0, 'hedge_wins': 0}
+
         if self._logger:
             ssl_status = "with certifi" if self._ssl_verify and not self._ssl_cert_path else (
                 "with custom cert" if self._ssl_cert_path else "disabled")
@@ -161,9 +239,21 @@ class RestfulConnection(IRestfulConnection[T], Generic[T]):
         """Get the default headers for requests."""
         return self._default_headers.copy()
 
+    @property
+    def cache(self) -> Optional[HttpCache]:
+        """Get the GET response cache, None when caching is not configured"""
+        return self._cache
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Get bulk request counters and the observed p95 latency in seconds."""
+        return {**self._stats, 'p95_latency': self._latencies.percentile(95)}
+
     @property
     def is_connected(self) -> bool:
         """Check if session is active."""
+        if self._shared is not None:
+            return self._shared.is_connected
         return self._session is not None and not self._session.closed
 
     async def get_session_async(self) -> ClientSession:
@@ -173,6 +263,8 @@ class RestfulConnection(IRestfulConnection[T], Generic[T]):
         Returns:
             Active ClientSession instance
         """
+        if self._shared is not None:
+            return await self._shared.get_session_async()
         if self._session is None or self._session.closed:
             async with self._session_lock:
                 if self._session is None or self._session.closed:
@@ -206,28 +298,35 @@ class RestfulConnection(IRestfulConnection[T], Generic[T]):
         """
         Read response with JSON/text fallback.
 
-        Tries to parse as JSON first, falls back to text if parsing fails.
-        This handles APIs that don't set proper content-type headers.
+        Reads and decodes the body once. JSON content types
+        (application/json, application/*+json) are parsed, falling back to
+        the text if parsing fails; other content types are returned as text.
 
         Args:
             response: aiohttp ClientResponse
 
         Returns:
-            Parsed JSON (dict/list) or text string
+            Parsed JSON (dict/list), None for an empty JSON body, or text string
         """
+        text = await response.text()
+        if not _JSON_CONTENT_TYPE.match(response.content_type):
+            return text
+        if not text.strip():
+            return None
         try:
-            # Try JSON first regardless of content-type
-            return await response.json()
-        except Exception:
+            return jsonlib.loads(text)
+        except ValueError:
             # Fall back to text for non-JSON responses
-            return await response.text()
+            return text
 
     async def get_async(
         self,
         path: str,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
-        raise_for_status: bool = True
+        raise_for_status: bool = True,
+        cache: bool = True,
+        max_age: Optional[float] = None
     ) -> Any:
         """
         Perform HTTP GET request.
@@ -237,6 +336,10 @@ class RestfulConnection(IRestfulConnection[T], Generic[T]):
             params: URL query parameters
             headers: Additional request headers
             raise_for_status: Raise exception if status >= 400 (default: True)
+            cache: Use the response cache when configured (default: True)
+            max_age: Serve a cached response younger than max_age seconds,
+                overriding the lifetime from the response headers
+                (0 always revalidates)
 
         Returns:
             Parsed JSON or text content
@@ -244,9 +347,16 @@ class RestfulConnection(IRestfulConnection[T], Generic[T]):
         Raises:
             Exception: If request fails or status >= 400 (when raise_for_status=True)
         """
-        session = await self.get_session_async()
         # Session already has base_url, so just use the path
         path = path.lstrip('/')
+        if cache and self._cache is not None:
+            status, value = await self._get_cached_async(path, params, headers, max_age)
+            if raise_for_status and status >= 400:
+                raise Exception(
+                    f"GET failed: status={status} url={path} response={value}")
+            return value
+
+        session = await self.get_session_async()
 
         try:
             async with session.get(path, params=params, headers=headers) as response:
@@ -267,6 +377,85 @@ class RestfulConnection(IRestfulConnection[T], Generic[T]):
                 self._logger.error(f"GET error: {path} - {str(e)}")
             raise
 
+    async def _get_cached_async(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        max_age: Optional[float]
+    ) -> Tuple[int, Any]:
+        """
+        Serve a GET from the cache, revalidating or fetching when needed.
+
+        Concurrent identical GETs that miss the cache share one request.
+
+        Returns:
+            Tuple of response status and parsed content
+        """
+        key = HttpCache.make_key(path, params, headers)
+        entry = self._cache.get(key)
+        if entry is not None and entry.is_fresh(max_age):
+            self._cache.hit_count += 1
+            return entry.status, entry.value
+        future = self._cache.in_flight.get(key)
+        if future is None:
+            self._cache.miss_count += 1
+            future = asyncio.ensure_future(
+                self._fetch_and_cache_async(key, path, params, headers, entry, max_age))
+            self._cache.in_flight[key] = future
+            future.add_done_callback(
+                lambda _: self._cache.in_flight.pop(key, None))
+        # Shield the shared request from cancellation of a single caller
+        return await asyncio.shield(future)
+
+    async def _fetch_and_cache_async(
+        self,
+        key: Hashable,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        entry: Optional[HttpCacheEntry],
+        max_age: Optional[float]
+    ) -> Tuple[int, Any]:
+        """Send the GET (conditional when a stale entry has validators) and update the cache"""
+        session = await self.get_session_async()
+        request_headers = dict(headers) if headers else {}
+        if entry is not None:
+            request_headers.update(entry.conditional_headers())
+        started = time.monotonic()
+        try:
+            async with session.get(path, params=params, headers=request_headers or None) as response:
+                # Cache hits are not recorded, they would hide the latency of the server
+                self._latencies.add(time.monotonic() - started)
+                ttl = self._cache.get_ttl(response.headers)
+                if response.status == 304 and entry is not None:
+                    self._cache.revalidated_count += 1
+                    entry.refresh(0.0 if ttl is None else ttl)
+                    if self._logger:
+                        self._logger.debug(f"GET {path} - Not Modified")
+                    return entry.status, entry.value
+
+                body = await response.read()
+                value = await self._read_response_async(response)
+                if self._logger:
+                    self._logger.debug(
+                        f"GET {path} - Status: {response.status}")
+                if response.status != 200 or ttl is None:
+                    self._cache.remove(key)
+                else:
+                    new_entry = HttpCacheEntry(
+                        response.status, value, len(body),
+                        response.headers.get('ETag'),
+                        response.headers.get('Last-Modified'), ttl)
+                    if ttl > 0 or new_entry.has_validator or max_age:
+                        self._cache.set(key, new_entry)
+                return response.status, value
+
+        except Exception as e:
+            if self._logger:
+                self._logger.error(f"GET error: {path} - {str(e)}")
+            raise
+
     async def post_async(
         self,
         path: str,
@@ -449,11 +638,386 @@ class RestfulConnection(IRestfulConnection[T], Generic[T]):
                 self._logger.error(f"DELETE error: {path} - {str(e)}")
             raise
 
+    async def map_async(
+        self,
+        requests: Iterable[Union[str, Dict[str, Any]]],
+        concurrency: int = 10,
+        retry: Union[None, bool, Dict[str, Any], RetryPolicy] = None,
+        hedge: Union[None, bool, Dict[str, Any], HedgePolicy] = None,
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        Send many requests with a concurrency limit.
+
+        Args:
+            requests: Paths to GET, or dicts with 'path' and optional 'method'
+                (default: GET), 'params', 'data', 'json', 'headers' and
+                'raise_for_status' (default: True)
+            concurrency: Max requests in flight
+            retry: Retry policy, overriding the 'retry' option (False disables)
+            hedge: Hedge policy, overriding the 'hedge' option (False disables)
+            return_exceptions: Return exceptions in place of results instead
+                of raising the first one
+
+        Returns:
+            Parsed JSON or text content of each request, in request order
+
+        Example:
+            ```python
+            users = await api.map_async(
+                [f'/users/{user_id}' for user_id in ids], concurrency=20)
+            ```
+        """
+        retry_policy = to_policy(retry, RetryPolicy, self._retry_options)
+        hedge_policy = to_policy(hedge, HedgePolicy, self._hedge_options)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def execute_async(request: Union[str, Dict[str, Any]]) -> Any:
+            if isinstance(request, str):
+                request = {'path': request}
+            async with semaphore:
+                return await self._execute_async(request, retry_policy, hedge_policy)
+
+        return await asyncio.gather(
+            *(execute_async(request) for request in requests),
+            return_exceptions=return_exceptions)
+
+    async def _execute_async(
+        self,
+        request: Dict[str, Any],
+        retry: Optional[RetryPolicy],
+        hedge: Optional[HedgePolicy]
+    ) -> Any:
+        """Send one bulk request, retrying and hedging idempotent methods."""
+        method = request.get('method', 'GET').upper()
+        path = request['path'].lstrip('/')
+        idempotent = is_idempotent(method)
+        attempts = retry.attempts if retry and idempotent else 1
+        for attempt in range(attempts):
+            is_last = attempt == attempts - 1
+            try:
+                if hedge and idempotent:
+                    status, value = await self._send_hedged_async(method, path, request, hedge)
+                else:
+                    status, value = await self._send_async(method, path, request)
+                if is_last or status not in retry.statuses:
+                    break
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if is_last:
+                    if self._logger:
+                        self._logger.error(
+                            f"{method} error: {path} - {str(e)}")
+                    raise
+            self._stats['retries'] += 1
+            await asyncio.sleep(retry.get_delay(attempt))
+
+        if request.get('raise_for_status', True) and status >= 400:
+            raise Exception(
+                f"{method} failed: status={status} url={path} response={value}")
+        return value
+
+    async def _send_hedged_async(
+        self,
+        method: str,
+        path: str,
+        request: Dict[str, Any],
+        hedge: HedgePolicy
+    ) -> Tuple[int, Any]:
+        """
+        Send a request and a duplicate if no reply came within the hedge delay.
+
+        The duplicate bypasses the coalescing of cached GETs, otherwise it would
+        only wait for the request it is meant to race.
+        """
+        delay = hedge.get_delay(self._latencies)
+        if delay is None:
+            return await self._send_async(method, path, request)
+        primary = asyncio.ensure_future(
+            self._send_async(method, path, request))
+        pending = {primary}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return primary.result()
+
+            self._stats['hedges'] += 1
+            secondary = asyncio.ensure_future(
+                self._send_async(method, path, request, coalesce=False))
+            pending.add(secondary)
+            while True:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED)
+                # Prefer a reply over an error; a failed request only loses
+                # while the other one can still reply
+                for task in sorted(done, key=lambda t: t.exception() is not None):
+                    if task.exception() is None or not pending:
+                        if task is secondary and task.exception() is None:
+                            self._stats['hedge_wins'] += 1
+                        return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _send_async(
+        self,
+        method: str,
+        path: str,
+        request: Dict[str, Any],
+        coalesce: bool = True
+    ) -> Tuple[int, Any]:
+        """
+        Send a single request and record its latency.
+
+        GETs go through the response cache when configured; with coalesce=False
+        they are sent directly instead of joining an identical request in flight.
+        """
+        self._stats['requests'] += 1
+        if coalesce and method == 'GET' and self._cache is not None:
+            return await self._get_cached_async(
+                path, request.get('params'), request.get('headers'), None)
+        session = await self.get_session_async()
+        started = time.monotonic()
+        async with session.request(
+                method, path,
+                params=request.get('params'),
+                data=request.get('data'),
+                json=request.get('json'),
+                headers=request.get('headers')) as response:
+            self._latencies.add(time.monotonic() - started)
+            value = await self._read_response_async(response)
+        if self._logger:
+            self._logger.debug(f"{method} {path} - Status: {response.status}")
+        return response.status, value
+
+    @asynccontextmanager
+    async def _open_stream_async(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Any],
+        json: Optional[Any],
+        headers: Optional[Dict[str, str]],
+        raise_for_status: bool
+    ) -> AsyncIterator[ClientResponse]:
+        """Send a request and yield the response with its body still unread."""
+        session = await self.get_session_async()
+        path = path.lstrip('/')
+        try:
+            async with session.request(
+                    method, path, params=params, data=data, json=json, headers=headers) as response:
+                if raise_for_status and response.status >= 400:
+                    error_body = await self._read_response_async(response)
+                    raise Exception(
+                        f"{method} failed: status={response.status} url={path} response={error_body}")
+                if self._logger:
+                    self._logger.debug(
+                        f"{method} {path} - Status: {response.status} (streaming)")
+                yield response
+        except Exception as e:
+            if self._logger:
+                self._logger.error(f"{method} error: {path} - {str(e)}")
+            raise
+
+    async def stream_async(
+        self,
+        path: str,
+        method: str = 'GET',
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        chunk_size: int = 65536,
+        raise_for_status: bool = True
+    ) -> AsyncIterator[bytes]:
+        """
+        Send a request and yield the response body in byte chunks.
+
+        Args:
+            path: API endpoint path (relative to base_url)
+            method: HTTP method (default: GET)
+            params: URL query parameters
+            data: Form data to send
+            json: JSON data to send
+            headers: Additional request headers
+            chunk_size: Max bytes per chunk
+            raise_for_status: Raise exception if status >= 400 (default: True)
+
+        Yields:
+            bytes: Next chunk of the body
+
+        Example:
+            ```python
+            async for chunk in api.stream_async('/export'):
+                file.write(chunk)
+            ```
+        """
+        async with self._open_stream_async(method, path, params, data, json, headers, raise_for_status) as response:
+            async for chunk in response.content.iter_chunked(chunk_size):
+                yield chunk
+
+    async def iter_lines_async(
+        self,
+        path: str,
+        method: str = 'GET',
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        encoding: str = 'utf-8',
+        raise_for_status: bool = True
+    ) -> AsyncIterator[str]:
+        """
+        Send a request and yield the response body line by line.
+
+        Lines are yielded without their line break and may be of any length.
+
+        Args:
+            path: API endpoint path (relative to base_url)
+            method: HTTP method (default: GET)
+            params: URL query parameters
+            data: Form data to send
+            json: JSON data to send
+            headers: Additional request headers
+            encoding: Body encoding (default: utf-8)
+            raise_for_status: Raise exception if status >= 400 (default: True)
+
+        Yields:
+            str: Next line of the body
+        """
+        decoder = codecs.getincrementaldecoder(encoding)()
+        pending = ''
+        async for chunk in self.stream_async(path, method, params, data, json, headers, raise_for_status=raise_for_status):
+            lines = (pending + decoder.decode(chunk)).split('\n')
+            pending = lines.pop()
+            for line in lines:
+                yield line.rstrip('\r')
+        pending += decoder.decode(b'', final=True)
+        if pending:
+            yield pending.rstrip('\r')
+
+    async def iter_ndjson_async(
+        self,
+        path: str,
+        method: str = 'GET',
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        raise_for_status: bool = True
+    ) -> AsyncIterator[Any]:
+        """
+        Send a request and yield the records of an NDJSON (JSON lines) body.
+
+        Args:
+            path: API endpoint path (relative to base_url)
+            method: HTTP method (default: GET)
+            params: URL query parameters
+            data: Form data to send
+            json: JSON data to send
+            headers: Additional request headers
+            raise_for_status: Raise exception if status >= 400 (default: True)
+
+        Yields:
+            Any: Next parsed record (blank lines are skipped)
+        """
+        async for line in self.iter_lines_async(path, method, params, data, json, headers, raise_for_status=raise_for_status):
+            if line.strip():
+                yield jsonlib.loads(line)
+
+    async def iter_json_array_async(
+        self,
+        path: str,
+        method: str = 'GET',
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        encoding: str = 'utf-8',
+        raise_for_status: bool = True
+    ) -> AsyncIterator[Any]:
+        """
+        Send a request and yield the items of a JSON array body as they arrive.
+
+        Only complete items are held in memory, so large exports can be
+        processed without buffering the whole payload.
+
+        Args:
+            path: API endpoint path (relative to base_url)
+            method: HTTP method (default: GET)
+            params: URL query parameters
+            data: Form data to send
+            json: JSON data to send
+            headers: Additional request headers
+            encoding: Body encoding (default: utf-8)
+            raise_for_status: Raise exception if status >= 400 (default: True)
+
+        Yields:
+            Any: Next array item
+
+        Raises:
+            ValueError: If the body is not a complete JSON array
+        """
+        decoder = codecs.getincrementaldecoder(encoding)()
+        parser = JsonArrayParser()
+        async for chunk in self.stream_async(path, method, params, data, json, headers, raise_for_status=raise_for_status):
+            for item in parser.feed(decoder.decode(chunk)):
+                yield item
+        for item in parser.feed(decoder.decode(b'', final=True)):
+            yield item
+        parser.close()
+
+    async def pipe_async(
+        self,
+        context: 'HttpContext',
+        path: str,
+        method: str = 'GET',
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        response_headers: Optional[Dict[str, str]] = None,
+        chunk_size: int = 65536
+    ) -> None:
+        """
+        Forward a downstream response to an Edge streaming response.
+
+        The status and Content-Type of the downstream response are copied and
+        the body is written to the client chunk by chunk, with back-pressure,
+        so the whole payload is never held in memory.
+
+        Args:
+            context: HTTP context of the current request
+            path: API endpoint path (relative to base_url)
+            method: HTTP method (default: GET)
+            params: URL query parameters
+            data: Form data to send
+            json: JSON data to send
+            headers: Additional request headers
+            response_headers: Extra headers for the client response
+            chunk_size: Max bytes per chunk
+
+        Example:
+            ```python
+            @app.web_handler("export")
+            async def export_handler(context: HttpContext, api: IRestfulConnection['reports']):
+                await api.pipe_async(context, '/export', params=context.query)
+            ```
+        """
+        async with self._open_stream_async(method, path, params, data, json, headers, False) as response:
+            client_headers = {'Content-Type': response.headers.get(
+                'Content-Type', 'application/octet-stream')}
+            client_headers.update(response_headers or {})
+            await context.pipe_async(
+                response.content.iter_chunked(chunk_size),
+                status=response.status, reason=response.reason, headers=client_headers)
+
     async def close_async(self) -> None:
         """
         Close the HTTP session and release resources.
 
-        Call this when the connection is no longer needed.
+        Call this when the connection is no longer needed. Handles of a
+        shared connection leave the shared session open.
         """
         if self._session and not self._session.closed:
             if self._logger:
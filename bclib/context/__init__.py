@@ -12,6 +12,9 @@ Features:
     - Message queue context (RabbitContext)
     - Context merging utilities (MergeType)
 
+ContextFactory is imported on first access; it depends on the dispatcher and
+listener message types, which in turn import this package.
+
 Example:
     ```python
     from bclib.context import HttpContext, Context
@@ -26,12 +29,13 @@ Example:
         await context.send('Hello WebSocket')
     ```
 """
+from typing import TYPE_CHECKING
 
 from .client_source_context import ClientSourceContext
 from .client_source_member_context import ClientSourceMemberContext
 from .cms_base_context import CmsBaseContext
+from .columnar_result import ColumnarResult
 from .context import Context
-from .context_factory import ContextFactory
 from .http_context import HttpContext
 from .merge_type import MergeType
 from .rabbit_context import RabbitContext
@@ -40,8 +44,12 @@ from .server_source_context import ServerSourceContext
 from .server_source_member_context import ServerSourceMemberContext
 from .source_context import SourceContext
 from .source_member_context import SourceMemberContext
+from .stream_result import StreamResult
 from .websocket_context import WebSocketContext
 
+if TYPE_CHECKING:
+    from .context_factory import ContextFactory
+
 __all__ = [
     # Base contexts
     'Context',
@@ -68,4 +76,14 @@ __all__ = [
     # Utilities
     'MergeType',
     'ContextFactory',
+    'StreamResult',
+    'ColumnarResult',
 ]
+
+
+def __getattr__(name: str):
+    if name == 'ContextFactory':
+        from .context_factory import ContextFactory
+        globals()[name] = ContextFactory
+        return ContextFactory
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
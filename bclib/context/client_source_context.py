@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 
 from bclib.context.restful_context import RESTfulContext
-from bclib.parser import HtmlParserEx
+from bclib.parser import SourceCommandCache
 
 if TYPE_CHECKING:
     from bclib.dispatcher.idispatcher import IDispatcher
@@ -13,17 +13,10 @@ class ClientSourceContext(RESTfulContext):
 
     def __init__(self, cms_object: dict, dispatcher: 'IDispatcher', message_object: 'HttpMessage') -> None:
         super().__init__(cms_object, dispatcher, message_object)
-        parser = HtmlParserEx()
         self.raw_command = self.form.get('command')
         self.dmn_id = self.form.get('dmnid')
-        parser.feed(self.raw_command)
-        self.command = parser.get_dict()
-        self.params: dict = None
-        if "params" in self.command:
-            params_list = self.command.get('params', [])
-            if len(params_list) > 0 and "add" in params_list[0]:
-                tmp_dic = {}
-                for item in params_list[0].get('add', []):
-                    tmp_dic[item.get('name')] = item.get('value')
-                self.params = tmp_dic
+        # Parsed command and params are shared read-only between requests
+        parsed = SourceCommandCache.shared().get(self.raw_command)
+        self.command = parsed.command
+        self.params = parsed.params
         self.process_async = True
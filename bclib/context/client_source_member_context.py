@@ -12,7 +12,9 @@ class ClientSourceMemberContext(Context):
     """Context for dbSource member request"""
 
     def __init__(self, sourceContext: 'ClientSourceContext', data: Any, member: dict) -> None:
-        super().__init__(sourceContext.dispatcher, False)
+        # Own child scope of the source request, so concurrently dispatched
+        # members can each resolve their context while sharing request services
+        super().__init__(sourceContext.dispatcher, True, sourceContext.services)
         self.__source_context = sourceContext
         self.member = member
         self.data = data
@@ -40,12 +40,13 @@ Note:
 """
 import json
 import traceback
-from typing import TYPE_CHECKING, Any, Tuple
+from typing import TYPE_CHECKING, Any, Optional, Tuple
 
 from bclib.context.context import Context
 from bclib.exception.short_circuit_err import ShortCircuitErr
 
 if TYPE_CHECKING:
+    from bclib.di.iservice_provider import IServiceProvider
     from bclib.dispatcher.idispatcher import IDispatcher
 
 from bclib.utility.http_base_data_name import HttpBaseDataName
@@ -101,7 +102,8 @@ class CmsBaseContext(Context):
     """
 
     # 1. Constructor
-    def __init__(self, cms_object: dict,  dispatcher: 'IDispatcher', create_scope: bool) -> None:
+    def __init__(self, cms_object: dict,  dispatcher: 'IDispatcher', create_scope: bool,
+                 parent_services: 'Optional[IServiceProvider]' = None) -> None:
         """
         Initialize CMS base context
 
@@ -109,12 +111,13 @@ class CmsBaseContext(Context):
             cms_object: CMS object with request data structure
             dispatcher: Dispatcher instance for routing
             create_scope: If True, creates new DI scope
+            parent_services: Optional provider the new scope is created from
 
         Note:
             Automatically parses URL, query, and form data from cms_object.
             Sets default response type to RENDERED and status code to OK.
         """
-        super().__init__(dispatcher, create_scope)
+        super().__init__(dispatcher, create_scope, parent_services)
         self.url_segments: dict[str, str] = None
         self.cms = cms_object
         self.url: str = self.cms.get('request', {}).get('url')
@@ -153,6 +156,13 @@ class CmsBaseContext(Context):
         else:
             self.__headers[key].append(value)
 
+    @property
+    def response_headers(self) -> 'dict[str, str]':
+        """Get headers added via add_header(), multiple values joined with commas"""
+        if self.__headers is None:
+            return {}
+        return {key: ",".join(values) for key, values in self.__headers.items()}
+
     def generate_error_response(self, exception: Exception) -> dict:
         """
         Generate HTML error response from exception
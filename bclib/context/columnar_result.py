@@ -0,0 +1,144 @@
+"""Column-oriented result set of source member handlers"""
+from typing import (Any, Dict, Iterable, Iterator, List, Mapping, Optional,
+                    Sequence)
+
+
+class ColumnarResult:
+    """
+    Result set stored as one array per column
+
+    Source member handlers can return a ColumnarResult instead of a list of
+    row dicts. The source response then carries the rows as arrays and the
+    names once in the columnNames option, so no dict is built or encoded per
+    row. Columns may be lists, tuples or NumPy arrays (or anything with a
+    tolist() method, e.g. a pandas Series); NumPy is not required.
+
+    When the member context has column_names set, the result is projected to
+    those columns, in that order, before it is written.
+
+    Example:
+        ```python
+        @app.client_source_member_handler(app.equal("context.member.name", "list"))
+        def list_member(context: ClientSourceMemberContext):
+            rows = context.data  # e.g. cursor.fetchall() tuples
+            return ColumnarResult.from_records(rows, ["id", "title", "price"])
+
+        @app.server_source_member_handler(app.equal("context.member.name", "prices"))
+        def prices_member(context: ServerSourceMemberContext):
+            return ColumnarResult({"id": ids, "price": numpy_prices})
+        ```
+    """
+
+    __slots__ = ('__columns',)
+
+    def __init__(self, columns: Mapping[str, Sequence]) -> None:
+        """
+        Initialize result from column arrays
+
+        Args:
+            columns: Column name -> values, all of the same length
+
+        Raises:
+            ValueError: If columns have different lengths
+        """
+        self.__columns: Dict[str, Sequence] = dict(columns)
+        lengths = {len(values) for values in self.__columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(
+                f"Columns of a ColumnarResult must have the same length, got {sorted(lengths)}")
+
+    @classmethod
+    def from_records(cls, records: Iterable[Sequence], column_names: Sequence[str]) -> 'ColumnarResult':
+        """
+        Create result from row tuples, e.g. the rows of a database cursor
+
+        Args:
+            records: Rows as sequences in the order of column_names
+            column_names: Names of the row positions
+
+        Returns:
+            ColumnarResult: Result with one column per name
+        """
+        records = records if isinstance(records, (list, tuple)) else list(records)
+        if not records:
+            return cls({name: [] for name in column_names})
+        return cls(dict(zip(column_names, zip(*records))))
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Mapping[str, Any]],
+                  column_names: Optional[Sequence[str]] = None) -> 'ColumnarResult':
+        """
+        Create result from row dicts
+
+        Args:
+            rows: Row dicts
+            column_names: Columns to keep (default: keys of the first row)
+
+        Returns:
+            ColumnarResult: Result with one column per name, missing values as None
+        """
+        rows = rows if isinstance(rows, (list, tuple)) else list(rows)
+        if column_names is None:
+            column_names = list(rows[0].keys()) if rows else []
+        return cls({name: [row.get(name) for row in rows] for name in column_names})
+
+    @property
+    def column_names(self) -> List[str]:
+        """Get names of the columns"""
+        return list(self.__columns)
+
+    def __len__(self) -> int:
+        for values in self.__columns.values():
+            return len(values)
+        return 0
+
+    def __getitem__(self, column_name: str) -> Sequence:
+        return self.__columns[column_name]
+
+    def select(self, column_names: Sequence[str]) -> 'ColumnarResult':
+        """
+        Project result to columns
+
+        Column arrays are shared with this result, not copied.
+
+        Args:
+            column_names: Columns to keep, in output order
+
+        Returns:
+            ColumnarResult: Projected result
+
+        Raises:
+            KeyError: If a column does not exist
+        """
+        return ColumnarResult({name: self.__columns[name] for name in column_names})
+
+    def iter_rows(self) -> Iterator[tuple]:
+        """Iterate rows as tuples in column order"""
+        return zip(*(ColumnarResult.__to_list(values) for values in self.__columns.values()))
+
+    def to_rows(self) -> List[dict]:
+        """Get rows as dicts, for consumers that need the row-oriented form"""
+        names = self.column_names
+        return [dict(zip(names, row)) for row in self.iter_rows()]
+
+    def to_source(self, options: dict) -> dict:
+        """
+        Get BasisCore source object of the result
+
+        Args:
+            options: Source options (tableName, keyFieldName, ...); columnNames is
+                     set to the columns of the result
+
+        Returns:
+            dict: {"options": {...}, "data": [[...], ...]}
+        """
+        return {
+            "options": {**options, "columnNames": self.column_names},
+            "data": list(self.iter_rows())
+        }
+
+    @staticmethod
+    def __to_list(values: Sequence) -> Sequence:
+        """Convert NumPy arrays (and similar) to lists of JSON serializable Python scalars"""
+        tolist = getattr(values, 'tolist', None)
+        return tolist() if tolist is not None else values
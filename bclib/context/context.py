@@ -34,12 +34,13 @@ Note:
     RESTfulContext, HttpContext, WebSocketContext, or TcpContext in your handlers.
 """
 from abc import ABC
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from bclib.di.iservice_container import IServiceContainer
 
 if TYPE_CHECKING:
     from bclib.di.iservice_provider import IServiceProvider
+    from bclib.dispatcher.callback_info import CallbackInfo
     from bclib.dispatcher.idispatcher import IDispatcher
 
 
@@ -76,13 +77,16 @@ class Context(ABC):
         in its own scope, allowing services to depend on the current context.
     """
 
-    def __init__(self, dispatcher: 'IDispatcher', create_scope: bool) -> None:
+    def __init__(self, dispatcher: 'IDispatcher', create_scope: bool,
+                 parent_services: Optional['IServiceProvider'] = None) -> None:
         """
         Initialize the base context
 
         Args:
             dispatcher: Dispatcher instance for routing and DI container access
             create_scope: If True, creates a new DI scope; if False, uses parent scope
+            parent_services: Optional provider to create the scope from instead of the
+                dispatcher root provider (e.g. a WebSocket session-lifetime scope)
 
         Note:
             Most request contexts use create_scope=True to isolate request-level services.
@@ -91,16 +95,15 @@ class Context(ABC):
         """
         super().__init__()
         self.dispatcher = dispatcher
+        if parent_services is None:
+            parent_services = dispatcher.service_provider
 
-        # Create scoped service provider for this request
-        if create_scope:
-            self.__service_provider = dispatcher.service_provider.create_scope()
-            # service_container = self.__service_provider.get_service(
-            #     IServiceContainer)
-            # Register current context as singleton in the scoped service provider
-            self.__service_provider.add_scoped(type(self), instance=self)
-        else:
-            self.__service_provider = dispatcher.service_provider
+        # The request scope is created on first access of services, so contexts
+        # whose handlers never resolve services (e.g. batched RabbitMQ messages)
+        # do not create one
+        self.__parent_services = parent_services
+        self.__service_provider: Optional['IServiceProvider'] = \
+            None if create_scope else parent_services
 
     @property
     def services(self) -> 'IServiceProvider':
@@ -134,8 +137,39 @@ class Context(ABC):
             Scoped services are created once per request and shared across
             all service dependencies within the same request context.
         """
+        if self.__service_provider is None:
+            self.__service_provider = self.__parent_services.create_scope()
+            # Register current context as singleton in the scoped service provider
+            self.__service_provider.add_scoped(type(self), instance=self)
         return self.__service_provider
 
+    @property
+    def resolved_callback(self) -> Optional['CallbackInfo']:
+        """
+        Get handler resolved for this context ahead of dispatch
+
+        Dispatcher tries this callback before the linear handler search. Contexts
+        that belong to a long-lived connection (e.g. WebSocketContext) override it
+        to return the handler matched for the first message of the connection.
+
+        Returns:
+            Optional[CallbackInfo]: Pre-resolved handler, or None to search handlers
+        """
+        return None
+
+    @resolved_callback.setter
+    def resolved_callback(self, callback_info: Optional['CallbackInfo']) -> None:
+        """
+        Remember handler that matched this context
+
+        Called by the dispatcher after a successful handler search. The base
+        implementation does nothing because request contexts are not reused.
+
+        Args:
+            callback_info: Handler that produced a result for this context
+        """
+        pass
+
     def generate_error_response(self, exception: Exception) -> dict:
         """
         Generate error response from exception
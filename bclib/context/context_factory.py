@@ -1,6 +1,6 @@
 """Context Factory - Creates appropriate context instances from messages"""
 import re
-from typing import TYPE_CHECKING, Optional, Type
+from typing import TYPE_CHECKING, Iterable, Optional, Type
 
 from bclib.logger.ilogger import ILogger
 from bclib.options.app_options import AppOptions
@@ -14,6 +14,7 @@ from bclib.listener.http.http_message import HttpMessage
 from bclib.listener.http.websocket_message import WebSocketMessage
 from bclib.listener.icms_base_message import ICmsBaseMessage
 from bclib.listener.message import Message
+from bclib.listener.message_type import MessageType
 from bclib.listener.rabbit.rabbit_message import RabbitMessage
 from bclib.listener.tcp.tcp_message import TcpMessage
 
@@ -59,8 +60,13 @@ class ContextFactory:
         self.__log_name = f"{name}: " if name else ''
 
         # Routing configuration
-        # pattern -> context_type
+        # pattern -> context_type, in registration order
         self.__route_lookup: dict[str, Type['Context']] = {}
+        # pattern -> {context_type: number of handlers using the pattern}
+        self.__route_owners: dict[str, dict[Type['Context'], int]] = {}
+        # context_type -> position in the handler lookup, decides shared patterns
+        self.__context_ranks: dict[Type['Context'], int] = {}
+        self.__supported_contexts: Optional[set[Type['Context']]] = None
 
     def create_context(self, message: Message) -> 'Context':
         """
@@ -79,6 +85,12 @@ class ContextFactory:
             KeyError: If required fields are missing from CMS object
             NameError: If context type cannot be determined or is invalid
         """
+        if isinstance(message, WebSocketMessage) and message.session.context_type is not None:
+            if message.session.routes_version == self.__dispatcher.routes_version:
+                return self.__create_session_context(message)
+            # Handlers changed since the session was routed, route it again
+            message.session.callback_info = None
+
         ret_val: Context = None
         context_type = None
         cms_object: Optional[dict] = None
@@ -107,8 +119,9 @@ class ContextFactory:
 
         # Determine context type based on URL patterns or message type
         # 1. Try to match URL patterns in lookup
-        if url and self.__route_lookup:
-            for pattern, ctx_type in self.__route_lookup.items():
+        route_lookup = self.__route_lookup
+        if url and route_lookup:
+            for pattern, ctx_type in route_lookup.items():
                 if pattern == "*" or re.search(pattern, url):
                     context_type = ctx_type
                     break
@@ -141,40 +154,116 @@ class ContextFactory:
         # Instantiate the context
         ret_val = context_type(cms_object, self.__dispatcher, message)
 
+        # URL of a WebSocket session never changes, remember route for next messages
+        if isinstance(message, WebSocketMessage):
+            message.session.context_type = context_type
+            message.session.routes_version = self.__dispatcher.routes_version
+
         return ret_val
 
+    def __create_session_context(self, message: WebSocketMessage) -> 'Context':
+        """
+        Create context for a message of an already routed WebSocket session
+
+        Skips URL pattern matching and per-message request logging; only
+        connection lifecycle messages (CONNECT/DISCONNECT) are logged.
+
+        Args:
+            message: WebSocket message whose session has a cached context type
+
+        Returns:
+            Context: Context instance of the session context type
+        """
+        context_type = message.session.context_type
+        cms_object = message.cms_object["cms"]
+        if self.__log_request and message.type != MessageType.MESSAGE:
+            req = cms_object["request"]
+            self.__logger.info(
+                f"{self.__log_name}({context_type.__name__}::{message.type.name}) - "
+                f"{req.get('request-id', 'none')} {req.get('method', 'none')} {req['full-url']}")
+        return context_type(cms_object, self.__dispatcher, message)
+
     def rebuild_router(self):
         """Auto-generate router from registered handlers in lookup"""
-        # Import context types at runtime to avoid circular dependency
-        from bclib.context import (ClientSourceContext, HttpContext,
-                                   RESTfulContext, ServerSourceContext,
-                                   WebSocketContext)
-
-        # Supported context types
-        supported_contexts = {
-            RESTfulContext,
-            HttpContext,
-            WebSocketContext,
-            ClientSourceContext,
-            ServerSourceContext
-        }
-
-        # Collect all URL patterns per context type
-        context_patterns: dict[Type['Context'], list[str]] = {}
-
-        for ctx_type, handlers in self.__look_up.items():
-            if ctx_type not in supported_contexts or len(handlers) == 0:
+        self.__route_lookup = {}
+        self.__route_owners = {}
+        self.add_routes((ctx_type, callback_info)
+                        for ctx_type, handlers in self.__look_up.items()
+                        for callback_info in handlers)
+
+    def add_routes(self, routes: 'Iterable[tuple[Type[Context], CallbackInfo]]') -> None:
+        """
+        Add URL patterns of registered handlers to the router
+
+        A pattern used by several context types is routed to the one that comes
+        last in the handler lookup, as a full rebuild does. The route table is
+        updated in place: it is only read synchronously by create_context, so
+        no context sees a partly updated table.
+
+        Args:
+            routes: (context type, handler) pairs
+        """
+        route_lookup = self.__route_lookup
+        for context_type, callback_info in routes:
+            if context_type not in self.__routed_contexts():
                 continue
+            for pattern in callback_info.get_url_patterns():
+                owners = self.__route_owners.setdefault(pattern, {})
+                owners[context_type] = owners.get(context_type, 0) + 1
+                current = route_lookup.get(pattern)
+                if current is None or self.__context_rank(context_type) > self.__context_rank(current):
+                    route_lookup[pattern] = context_type
+
+    def remove_routes(self, routes: 'Iterable[tuple[Type[Context], CallbackInfo]]') -> None:
+        """
+        Remove URL patterns of unregistered handlers from the router
 
-            context_patterns[ctx_type] = []
+        A pattern stays routed while another handler still uses it; if only
+        handlers of other context types are left, it is routed to the one that
+        comes last in the handler lookup.
 
-            # Extract URL patterns from each callback info
-            for callback_info in handlers:
-                patterns = callback_info.get_url_patterns()
-                context_patterns[ctx_type].extend(patterns)
+        Args:
+            routes: (context type, handler) pairs
+        """
+        route_lookup = self.__route_lookup
+        for context_type, callback_info in routes:
+            for pattern in callback_info.get_url_patterns():
+                owners = self.__route_owners.get(pattern)
+                if not owners or context_type not in owners:
+                    continue
+                owners[context_type] -= 1
+                if owners[context_type] > 0:
+                    continue
+                del owners[context_type]
+                if owners:
+                    route_lookup[pattern] = max(owners, key=self.__context_rank)
+                else:
+                    del self.__route_owners[pattern]
+                    route_lookup.pop(pattern, None)
+
+    def __context_rank(self, context_type: Type['Context']) -> int:
+        """Get the position of a context type in the handler lookup"""
+        rank = self.__context_ranks.get(context_type)
+        if rank is None:
+            # Context types are only appended to the lookup, ranks never change
+            self.__context_ranks = {ctx_type: index for index, ctx_type
+                                    in enumerate(self.__look_up)}
+            rank = self.__context_ranks.get(context_type, len(self.__context_ranks))
+        return rank
+
+    def __routed_contexts(self) -> 'set[Type[Context]]':
+        """Get context types that can be selected by URL pattern"""
+        if self.__supported_contexts is None:
+            # Import context types at runtime to avoid circular dependency
+            from bclib.context import (ClientSourceContext, HttpContext,
+                                       RESTfulContext, ServerSourceContext,
+                                       WebSocketContext)
 
-        # Build lookup dictionary from all patterns
-        self.__route_lookup = {}
-        for context_type, patterns in context_patterns.items():
-            for pattern in patterns:
-                self.__route_lookup[pattern] = context_type
+            self.__supported_contexts = {
+                RESTfulContext,
+                HttpContext,
+                WebSocketContext,
+                ClientSourceContext,
+                ServerSourceContext
+            }
+        return self.__supported_contexts
@@ -30,15 +30,18 @@ Example:
         )
     ```
 """
+import inspect
 import json
 from itertools import islice
-from typing import TYPE_CHECKING, Any, Coroutine, Iterator, Optional, Union
-
-from aiohttp.web_response import ContentCoding
+from typing import (TYPE_CHECKING, Any, AsyncIterable, Coroutine, Iterator,
+                    Optional, Union)
 
 from bclib.context.cms_base_context import CmsBaseContext
+from bclib.context.stream_result import StreamResult
 
 if TYPE_CHECKING:
+    from aiohttp.web_response import ContentCoding
+
     from bclib.dispatcher.idispatcher import IDispatcher
     from bclib.listener.http.http_message import HttpMessage
 
@@ -136,7 +139,87 @@ class HttpContext(CmsBaseContext):
         await self.write_async(data)
         await self.drain_async()
 
-    async def enable_compression(self, force: Optional[Union[bool, ContentCoding]] = None) -> None:
+    async def pipe_async(self, chunks: 'AsyncIterable[bytes]', status: int = 200,
+                         reason: Optional[str] = 'OK',
+                         headers: Optional[dict] = None) -> Coroutine[Any, Any, None]:
+        """
+        Stream chunks from an async source to the client
+
+        Starts a streaming response and writes each chunk as it arrives,
+        draining after every write so a slow client slows down the source
+        instead of buffering the whole payload.
+
+        Args:
+            chunks: Async iterable of bytes, e.g. RestfulConnection.stream_async()
+            status: HTTP status code (default: 200)
+            reason: HTTP reason phrase (default: 'OK')
+            headers: Optional dictionary of HTTP headers
+
+        Example:
+            ```python
+            await context.pipe_async(
+                api.stream_async('/export'),
+                headers={'Content-Type': 'application/json'}
+            )
+            ```
+        """
+        await self.start_stream_response_async(status, reason, headers)
+        async for chunk in chunks:
+            await self.write_and_drain_async(chunk)
+
+    async def generate_response_async(self, content: Any) -> dict:
+        """
+        Generate response, streaming async iterable results
+
+        Async iterables (e.g. an async Mongo cursor or an async generator) and
+        StreamResult objects are written as a chunked JSON array or NDJSON in
+        batches, draining after every batch. Other content is passed to
+        generate_response().
+
+        Args:
+            content: Handler result
+
+        Returns:
+            dict: CMS-formatted response object. For streamed content the body
+                  is already sent and the object only marks the request as handled.
+
+        Example:
+            ```python
+            @app.restful_handler("api/users")
+            def list_users(db: IMongoConnection['database.app']):
+                # Streamed as [{...},{...},...] without calling to_list()
+                return db.get_async_collection('users').find({})
+            ```
+
+        Note:
+            The first batch is read before the response is started, so errors
+            raised by the source up to that point produce a regular error response.
+            Headers added via add_header() and status_code are sent with the stream.
+        """
+        if not StreamResult.is_stream(content):
+            return self.generate_response(content)
+        stream = content if isinstance(content, StreamResult) else StreamResult(content)
+        batches = stream.iter_batches_async()
+        try:
+            first = await anext(batches, None)
+            status, _, reason = str(self.status_code).partition(' ')
+            self.mime = stream.mime
+            await self.start_stream_response_async(
+                int(status), reason or None,
+                {**self.response_headers, 'Content-Type': stream.mime})
+            if first is not None:
+                await self.write_and_drain_async(stream.encode(first, True))
+                async for batch in batches:
+                    await self.write_and_drain_async(stream.encode(batch, False))
+            end = stream.end(first is None)
+            if end:
+                await self.write_and_drain_async(end)
+        finally:
+            await batches.aclose()
+            await HttpContext.__close_source_async(stream.items)
+        return self.cms
+
+    async def enable_compression(self, force: Optional[Union[bool, 'ContentCoding']] = None) -> None:
         """
         Enable HTTP response compression
 
@@ -208,3 +291,12 @@ class HttpContext(CmsBaseContext):
                     }],
             }
             await self.write_and_drain_async(f"{json.dumps(data)}{delimiter}".encode())
+
+    @staticmethod
+    async def __close_source_async(items: Any) -> None:
+        """Release a stream source (cursor, async generator) that was not fully consumed"""
+        close = getattr(items, 'aclose', None) or getattr(items, 'close', None)
+        if close is not None:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
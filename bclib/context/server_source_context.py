@@ -1,24 +1,22 @@
-from mailbox import Message
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from bclib.dispatcher.idispatcher import IDispatcher
+    from bclib.listener.message import Message
 
 from bclib.context.context import Context
-from bclib.parser import HtmlParserEx
+from bclib.parser import SourceCommandCache
 
 
 class ServerSourceContext(Context):
     """Base class for dispatching server base dbsource request context"""
 
-    def __init__(self, cms_object: dict, dispatcher: 'IDispatcher', message_object: Message = None) -> None:
+    def __init__(self, cms_object: dict, dispatcher: 'IDispatcher', message_object: 'Message' = None) -> None:
         super().__init__(dispatcher, True)
-        parser = HtmlParserEx()
         self.raw_command = cms_object["command"]
         self.dmn_id = cms_object.get("dmnid")
         self.params = cms_object.get("params")
-        parser.feed(self.raw_command)
-        self.command = parser.get_dict()
+        self.command = SourceCommandCache.shared().get(self.raw_command).command
         self.process_async = True
 
     def generate_response(self, result: Any) -> dict:
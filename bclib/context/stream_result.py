@@ -0,0 +1,116 @@
+"""Streamed handler result written as a chunked JSON array or NDJSON"""
+import datetime
+import json
+from typing import (Any, AsyncIterable, AsyncIterator, Callable, Iterable,
+                    List, Optional)
+
+from bclib.utility.http_mime_types import HttpMimeTypes
+
+
+class StreamResult:
+    """
+    Handler result streamed to the client in bounded batches
+
+    RESTful and web handlers may return any async iterable (an async Mongo
+    cursor, an async generator, ...) to have it streamed as a chunked JSON
+    array. Wrap it in StreamResult to choose NDJSON, the batch size or the
+    JSON encoder.
+
+    Items are pulled from the source batch_size at a time and each batch is
+    written and drained before the next one is pulled, so a slow client slows
+    down the source instead of the whole result being held in memory.
+
+    Example:
+        ```python
+        @app.restful_handler("api/events")
+        def list_events(db: IMongoConnection['database.events']):
+            return db.get_async_collection('events').find({})
+
+        @app.restful_handler("api/events/export")
+        def export_events(db: IMongoConnection['database.events']):
+            return StreamResult(db.get_async_collection('events').find({}),
+                                format=StreamResult.NDJSON, batch_size=500)
+        ```
+    """
+
+    JSON = 'json'
+    NDJSON = 'ndjson'
+
+    def __init__(self,
+                 items: 'AsyncIterable | Iterable',
+                 format: str = JSON,
+                 batch_size: int = 100,
+                 default: Optional[Callable[[Any], Any]] = None) -> None:
+        """
+        Initialize stream result
+
+        Args:
+            items: Async or sync iterable of JSON serializable items
+            format: StreamResult.JSON (chunked array) or StreamResult.NDJSON
+            batch_size: Items written per chunk
+            default: JSON encoder fallback for unsupported types
+                     (default: ISO format for dates, str() for others such as ObjectId)
+        """
+        if format not in (StreamResult.JSON, StreamResult.NDJSON):
+            raise ValueError(f"Unsupported stream format '{format}'")
+        self.items = items
+        self.format = format
+        self.batch_size = max(1, batch_size)
+        self.default = default or StreamResult.json_default
+
+    @property
+    def mime(self) -> str:
+        """Get content type of the stream"""
+        return HttpMimeTypes.NDJSON if self.format == StreamResult.NDJSON else HttpMimeTypes.JSON
+
+    @staticmethod
+    def is_stream(content: Any) -> bool:
+        """Check if a handler result must be streamed"""
+        return isinstance(content, StreamResult) or hasattr(content, '__aiter__')
+
+    @staticmethod
+    def json_default(value: Any) -> Any:
+        """Encode dates as ISO strings and other unsupported values (ObjectId, Decimal128, ...) with str()"""
+        if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+            return value.isoformat()
+        return str(value)
+
+    async def iter_batches_async(self) -> AsyncIterator[List[Any]]:
+        """Yield items of the source in lists of at most batch_size"""
+        batch = []
+        if hasattr(self.items, '__aiter__'):
+            async for item in self.items:
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    yield batch
+                    batch = []
+        else:
+            for item in self.items:
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
+    def encode(self, batch: List[Any], first: bool) -> bytes:
+        """
+        Encode a batch as a chunk of the stream
+
+        Args:
+            batch: Items of the chunk
+            first: True for the first chunk of the stream
+
+        Returns:
+            bytes: NDJSON lines, or array items preceded by '[' or ','
+        """
+        dumps = [json.dumps(item, default=self.default) for item in batch]
+        if self.format == StreamResult.NDJSON:
+            return ("\n".join(dumps) + "\n").encode()
+        return (("[" if first else ",") + ",".join(dumps)).encode()
+
+    def end(self, empty: bool) -> bytes:
+        """Get closing chunk of the stream"""
+        if self.format == StreamResult.NDJSON:
+            return b""
+        return b"[]" if empty else b"]"
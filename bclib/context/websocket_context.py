@@ -33,14 +33,19 @@ Example:
         payload = context.message.payload
     ```
 """
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
-from bclib.dispatcher.idispatcher import IDispatcher
-from bclib.listener.http import (WebSocketMessage, WebSocketSession,
-                                 WebSocketSessionManager)
+from bclib.listener.http.websocket_message import WebSocketMessage
 
 from .cms_base_context import CmsBaseContext
 
+if TYPE_CHECKING:
+    from bclib.dispatcher.idispatcher import IDispatcher
+    from bclib.dispatcher.callback_info import CallbackInfo
+    from bclib.listener.http.websocket_session import WebSocketSession
+    from bclib.listener.http.websocket_session_manager import \
+        WebSocketSessionManager
+
 
 class WebSocketContext(CmsBaseContext):
     """
@@ -50,6 +55,11 @@ class WebSocketContext(CmsBaseContext):
     communication between client and server. Each WebSocket connection gets its own
     session with a unique ID and access to the session manager for broadcasting.
 
+    A context is created per message, but its DI scope is a cheap child of the
+    session-lifetime scope (`session.services`), so services registered as scoped
+    and resolved there live for the whole connection. The handler matched for the
+    first message is cached on the session and reused for following messages.
+
     Attributes:
         message (WebSocketMessage): The WebSocket message object containing payload and metadata
         session (WebSocketSession): The WebSocket session for this connection
@@ -80,7 +90,7 @@ class WebSocketContext(CmsBaseContext):
 
     def __init__(self,
                  cms_object: dict,
-                 dispatcher: IDispatcher,
+                 dispatcher: 'IDispatcher',
                  ws_message: WebSocketMessage) -> None:
         """
         Initialize WebSocket context
@@ -90,10 +100,43 @@ class WebSocketContext(CmsBaseContext):
             dispatcher: Dispatcher instance for routing
             ws_message: WebSocket message instance containing session and payload data
         """
-        super().__init__(cms_object, dispatcher, True)
+        session = ws_message.session
+        if session.services is None:
+            from bclib.listener.http.websocket_session import WebSocketSession
+            session.services = dispatcher.service_provider.create_scope()
+            session.services.add_scoped(WebSocketSession, instance=session)
+        super().__init__(cms_object, dispatcher, True, session.services)
         self.message: WebSocketMessage = ws_message
-        self.session: WebSocketSession = ws_message.session
-        self.session_manager: WebSocketSessionManager = self.session.session_manager
+        self.session: 'WebSocketSession' = session
+        self.session_manager: 'WebSocketSessionManager' = session.session_manager
+        self.url_segments = session.url_segments
+
+    @property
+    def resolved_callback(self) -> Optional['CallbackInfo']:
+        """
+        Get handler resolved for this connection
+
+        Returns:
+            Optional[CallbackInfo]: Handler cached on the session, or None before
+                the first message has been dispatched
+        """
+        return self.session.callback_info
+
+    @resolved_callback.setter
+    def resolved_callback(self, callback_info: Optional['CallbackInfo']) -> None:
+        """
+        Cache matched handler on the session
+
+        Only handlers whose predicates depend on the URL alone are cached, since
+        the URL is fixed for the life of the connection. Handlers with other
+        predicates keep going through the regular handler search.
+
+        Args:
+            callback_info: Handler whose predicates passed for this context
+        """
+        if self.session.callback_info is None and callback_info is not None and callback_info.is_route_only:
+            self.session.callback_info = callback_info
+            self.session.url_segments = self.url_segments
 
     def __repr__(self) -> str:
         """
@@ -2,9 +2,10 @@ from .db_manager import DbManager
 from .idb_manager import IDbManager
 from .mongo_db import MongoDb
 from .rabbit_connection import RabbitConnection
-from .restful_connection import RESTfulConnection
+from .restful_connection import RESTfulConnection, RESTfulSessionPool
 from .sql_db import SqlDb
 from .sqlite_db import SQLiteDb
 
 __all__ = ['DbManager', 'IDbManager', 'MongoDb',
-           'RabbitConnection', 'RESTfulConnection', 'SqlDb', 'SQLiteDb']
+           'RabbitConnection', 'RESTfulConnection', 'RESTfulSessionPool',
+           'SqlDb', 'SQLiteDb']
@@ -1,10 +1,17 @@
 """Base class for implement data base interface"""
 from abc import ABC
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from bclib.db_manager.db_pool import DbPool
 
 
 class Db(ABC):
     """Base class for implement data base interface"""
 
+    # Pool the connection belongs to (set by DbPool), None for unpooled connections
+    pool: Optional['DbPool'] = None
+
     def __enter__(self):
         pass
 
@@ -1,35 +1,69 @@
 import asyncio
+from typing import Any, AsyncIterator, Sequence
 
 from bclib.db_manager.idb_manager import IDbManager
+from bclib.di.ihosted_service import IHostedService
 from bclib.options.app_options import AppOptions
 
 from ..db_manager.db import Db
+from ..db_manager.db_pool import DbPool
 from ..db_manager.mongo_db import MongoDb
+from ..db_manager.odbc_db import OdbcDb
 from ..db_manager.rabbit_connection import RabbitConnection
-from ..db_manager.restful_connection import RESTfulConnection
+from ..db_manager.restful_connection import (RESTfulConnection,
+                                             RESTfulSessionPool)
 from ..db_manager.sql_db import SqlDb
 from ..db_manager.sqlite_db import SQLiteDb
 
 
-class DbManager(IDbManager):
+class DbManager(IDbManager, IHostedService):
     """
     Database connection manager implementation
 
     Manages database connections based on application configuration.
-    Supports SQL, SQLite, MongoDB, RESTful, and RabbitMQ connections.
+    Supports SQL, ODBC, SQLite, MongoDB, RESTful, and RabbitMQ connections.
+
+    SQL, ODBC and SQLite connections are pooled per connection key (see DbPool).
+    A pooled setting is either the connection string or a dict with
+    'connection_string' and optional 'pool' options:
+
+        ```json
+        "settings": {
+            "connections.sql.main": {
+                "connection_string": "DRIVER={ODBC Driver 17 for SQL Server};...",
+                "pool": {"min_size": 2, "max_size": 20, "idle_timeout": 120}
+            }
+        }
+        ```
+
+    RESTful connections share keep-alive sessions per base URL through the
+    injected RESTfulSessionPool (one is created from 'restful_session' when
+    none is registered); connector limits, DNS cache and timeouts come from
+    'restful_session'.
+
+    Registered as a hosted service: pools are filled to min_size on startup
+    and closed, with the RESTful sessions, on shutdown.
     """
 
-    def __init__(self, options: AppOptions, loop: asyncio.AbstractEventLoop) -> None:
+    POOLED_TYPES = ("sql", "odbc", "sqlite")
+
+    def __init__(self, options: AppOptions, loop: asyncio.AbstractEventLoop,
+                 restful_sessions: RESTfulSessionPool = None) -> None:
         """
         Initialize database manager
 
         Args:
             options: Application configuration (AppOptions type alias for dict)
             loop: The asyncio event loop for async operations
+            restful_sessions: Session pool of RESTful connections (created from
+                'restful_session' if not given)
         """
         self._options = options
         self._event_loop = loop
         self._connections: dict(str, list) = dict()
+        self._pools: dict[str, DbPool] = dict()
+        self._restful_sessions = restful_sessions or RESTfulSessionPool(
+            options.get('restful_session'))
         settings = options.get('settings') if "settings" in options else None
         if settings:
             for k, setting in [(k.split(".", 2)[1:], v) for k, v in settings.items() if k.find("connections.") == 0]:
@@ -37,23 +71,75 @@ class DbManager(IDbManager):
                 name = k[1].lower()
                 self._connections[name] = [db_type, setting]
 
-    def open_connection(self, key: str) -> Db:
-        ret_val: Db = None
+    def __get_setting(self, key: str) -> list:
         try:
-            data = self._connections[key]
+            return self._connections[key]
         except KeyError as ex:
             raise Exception(
                 f"Connection setting with name '{key}' not found!") from ex
-        db_type = data[0]
-        setting = data[1]
-        if db_type == "sql":
-            ret_val = SqlDb(data[1])
-        elif db_type == "sqlite":
-            ret_val = SQLiteDb(setting)
+
+    def get_pool(self, key: str) -> DbPool:
+        """
+        Get (or create) the connection pool of a SQL, ODBC or SQLite setting
+
+        Args:
+            key: Configuration key for the connection
+
+        Returns:
+            DbPool: Pool shared by all users of the key
+        """
+        pool = self._pools.get(key)
+        if pool is None:
+            db_type, setting = self.__get_setting(key)
+            if db_type not in DbManager.POOLED_TYPES:
+                raise Exception(
+                    f"Connection '{key}' of type '{db_type}' is not poolable")
+            pool_options = {}
+            if isinstance(setting, dict):
+                pool_options = setting.get("pool", {})
+                setting = setting["connection_string"]
+            if db_type == "sql":
+                factory = lambda: SqlDb(setting)
+            elif db_type == "odbc":
+                factory = lambda: OdbcDb(setting)
+            else:
+                # Pooled connections move between the pool threads
+                factory = lambda: SQLiteDb(setting, check_same_thread=False)
+            pool = self._pools[key] = DbPool(factory, pool_options, key)
+        return pool
+
+    async def start_async(self) -> None:
+        """Fill pools that have a min_size on startup"""
+        for key, (db_type, setting) in self._connections.items():
+            if db_type in DbManager.POOLED_TYPES and isinstance(setting, dict) and \
+                    setting.get("pool", {}).get("min_size"):
+                await self.get_pool(key).warm_up_async()
+
+    async def stop_async(self) -> None:
+        """Close all pools and RESTful sessions on shutdown"""
+        pools, self._pools = self._pools, dict()
+        for pool in pools.values():
+            await pool.close_async()
+        await self._restful_sessions.close_async()
+
+    async def execute_async(self, key: str, sql: str, params: Sequence[Any] = ()) -> int:
+        return await self.get_pool(key).execute_async(sql, params)
+
+    async def fetch_async(self, key: str, sql: str, params: Sequence[Any] = ()) -> list:
+        return await self.get_pool(key).fetch_async(sql, params)
+
+    def fetchmany(self, key: str, sql: str, params: Sequence[Any] = (), size: int = 100) -> AsyncIterator[list]:
+        return self.get_pool(key).fetchmany(sql, params, size)
+
+    def open_connection(self, key: str) -> Db:
+        ret_val: Db = None
+        db_type, setting = self.__get_setting(key)
+        if db_type in DbManager.POOLED_TYPES:
+            ret_val = self.get_pool(key).open()
         elif db_type == "mongo":
             ret_val = MongoDb(setting)
         elif db_type == "rest":
-            ret_val = RESTfulConnection(setting)
+            ret_val = RESTfulConnection(setting, self._restful_sessions)
         elif db_type == "rabbit":
             ret_val = RabbitConnection(setting)
         else:
@@ -0,0 +1,310 @@
+"""Connection pool for DB-API based Db wrappers (SqlDb, OdbcDb, SQLiteDb)"""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Optional, Sequence
+
+from ..db_manager.db import Db
+
+
+class DbPool:
+    """
+    Connection pool for one connection setting
+
+    Keeps idle connections for reuse, checks their health before reuse and
+    evicts connections idle for longer than idle_timeout (down to min_size).
+    Blocking DB-API calls of the async API run on a dedicated thread pool
+    sized to max_size, so they never block the event loop.
+
+    Connections returned by `open` (sync, used by DbManager.open_connection)
+    go back to the pool when the Db is exited (`with db:`). Connections used
+    by the async API are bounded by max_size; callers wait for a free one.
+    Uncommitted work is rolled back when a connection goes back to the pool,
+    so it never leaks into the next lease; a connection that cannot be
+    rolled back is closed instead.
+
+    Pool options:
+        - min_size: Connections kept open even when idle (default: 0)
+        - max_size: Max connections used by the async API and max idle
+          connections kept (default: 10)
+        - idle_timeout: Seconds before an idle connection is closed (default: 300)
+        - health_check: Query run on connections idle longer than
+          health_check_after before reuse (default: 'SELECT 1')
+        - health_check_after: Seconds idle before a health check (default: 30)
+
+    Example:
+        ```python
+        pool = DbPool(lambda: SQLiteDb("app.db", check_same_thread=False), {"max_size": 4})
+        rows = await pool.fetch_async("SELECT * FROM users WHERE age > ?", (18,))
+        async for rows in pool.fetchmany("SELECT * FROM events", size=500):
+            process(rows)
+        ```
+    """
+
+    def __init__(self, factory: Callable[[], Db], options: Optional[dict] = None, name: str = "db") -> None:
+        """
+        Initialize connection pool
+
+        Args:
+            factory: Callable creating a new connected Db
+            options: Pool options (see class docstring)
+            name: Pool name, used for worker thread names
+        """
+        options = options or {}
+        self.__factory = factory
+        self.min_size: int = max(0, int(options.get("min_size", 0)))
+        self.max_size: int = max(1, self.min_size,
+                                 int(options.get("max_size", 10)))
+        self.idle_timeout: float = float(options.get("idle_timeout", 300))
+        self.health_check: Optional[str] = options.get(
+            "health_check", "SELECT 1")
+        self.health_check_after: float = float(
+            options.get("health_check_after", 30))
+        # Idle connections as (db, returned at), most recently returned last
+        self.__idle: list[tuple[Db, float]] = []
+        self.__lock = threading.Lock()
+        self.__leased: set[int] = set()
+        self.__size = 0
+        self.__semaphore: Optional[asyncio.Semaphore] = None
+        self.__executor = ThreadPoolExecutor(
+            max_workers=self.max_size, thread_name_prefix=f"db-pool-{name}")
+
+    @property
+    def size(self) -> int:
+        """Get number of open connections (idle and in use)"""
+        return self.__size
+
+    @property
+    def idle_count(self) -> int:
+        """Get number of idle connections"""
+        return len(self.__idle)
+
+    def open(self) -> Db:
+        """
+        Get an idle connection or create a new one (blocking)
+
+        Returns:
+            Db: Connection that returns to the pool when exited
+        """
+        self.__evict_idle()
+        while True:
+            with self.__lock:
+                if not self.__idle:
+                    break
+                db, returned_at = self.__idle.pop()
+            if self.__is_healthy(db, returned_at):
+                return db
+            self.__close(db)
+        db = self.__factory()
+        db.pool = self
+        with self.__lock:
+            self.__size += 1
+        return db
+
+    def release(self, db: Db) -> None:
+        """
+        Roll back uncommitted work and return a connection to the pool
+
+        Args:
+            db: Connection obtained from this pool
+        """
+        self.__return(db, self.__rollback(db))
+
+    async def release_async(self, db: Db) -> None:
+        """
+        Return a connection to the pool, rolling back on the pool threads
+
+        Args:
+            db: Connection obtained from this pool
+        """
+        try:
+            reusable = await asyncio.get_running_loop().run_in_executor(
+                self.__executor, self.__rollback, db)
+        except BaseException:
+            self.__return(db, False)
+            raise
+        self.__return(db, reusable)
+
+    async def warm_up_async(self) -> None:
+        """Open connections until min_size connections are idle"""
+        loop = asyncio.get_running_loop()
+        while self.idle_count < self.min_size:
+            db = await loop.run_in_executor(self.__executor, self.__factory)
+            db.pool = self
+            with self.__lock:
+                self.__size += 1
+                self.__idle.append((db, time.monotonic()))
+
+    async def acquire_async(self) -> Db:
+        """
+        Wait for a free connection slot and get a connection on the pool threads
+
+        Returns:
+            Db: Connection to hand back with release()
+        """
+        if self.__semaphore is None:
+            self.__semaphore = asyncio.Semaphore(self.max_size)
+        await self.__semaphore.acquire()
+        try:
+            db = await asyncio.get_running_loop().run_in_executor(self.__executor, self.open)
+        except BaseException:
+            self.__semaphore.release()
+            raise
+        self.__leased.add(id(db))
+        return db
+
+    async def execute_async(self, sql: str, params: Sequence[Any] = ()) -> int:
+        """
+        Execute a statement and commit
+
+        Args:
+            sql: SQL statement
+            params: Statement parameters
+
+        Returns:
+            int: Number of affected rows
+        """
+        def execute(db: Db) -> int:
+            cursor = db.connection.cursor()
+            try:
+                self.__execute(cursor, sql, params)
+                db.connection.commit()
+                return cursor.rowcount
+            finally:
+                cursor.close()
+        return await self.__run_async(execute)
+
+    async def fetch_async(self, sql: str, params: Sequence[Any] = ()) -> list:
+        """
+        Run a query and fetch all rows
+
+        Args:
+            sql: SQL query
+            params: Query parameters
+
+        Returns:
+            list: All result rows
+        """
+        def fetch(db: Db) -> list:
+            cursor = db.connection.cursor()
+            try:
+                return self.__execute(cursor, sql, params).fetchall()
+            finally:
+                cursor.close()
+        return await self.__run_async(fetch)
+
+    async def fetchmany(self, sql: str, params: Sequence[Any] = (), size: int = 100) -> AsyncIterator[list]:
+        """
+        Run a query and stream result rows in batches
+
+        The connection is held until the iteration ends.
+
+        Args:
+            sql: SQL query
+            params: Query parameters
+            size: Rows per batch
+
+        Yields:
+            list: Up to size rows
+        """
+        loop = asyncio.get_running_loop()
+        db = await self.acquire_async()
+        try:
+            cursor = await loop.run_in_executor(self.__executor, db.connection.cursor)
+            try:
+                await loop.run_in_executor(self.__executor, self.__execute, cursor, sql, params)
+                while True:
+                    rows = await loop.run_in_executor(self.__executor, cursor.fetchmany, size)
+                    if not rows:
+                        break
+                    yield rows
+            finally:
+                await loop.run_in_executor(self.__executor, cursor.close)
+        finally:
+            await self.release_async(db)
+
+    async def close_async(self) -> None:
+        """Close idle connections and stop the pool threads"""
+        with self.__lock:
+            idle, self.__idle = self.__idle, []
+        loop = asyncio.get_running_loop()
+        for db, _ in idle:
+            await loop.run_in_executor(self.__executor, self.__close, db)
+        self.__executor.shutdown(wait=False)
+
+    async def __run_async(self, action: Callable[[Db], Any]) -> Any:
+        """Run a blocking action with a pooled connection on the pool threads"""
+        db = await self.acquire_async()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.__executor, action, db)
+        finally:
+            await self.release_async(db)
+
+    def __return(self, db: Db, reusable: bool) -> None:
+        """Keep a released connection as idle or close it, and free its async slot"""
+        leased = id(db) in self.__leased
+        self.__leased.discard(id(db))
+        keep = False
+        if reusable:
+            with self.__lock:
+                keep = len(self.__idle) < self.max_size
+                if keep:
+                    self.__idle.append((db, time.monotonic()))
+        if not keep:
+            self.__close(db)
+        if leased:
+            self.__semaphore.release()
+
+    @staticmethod
+    def __rollback(db: Db) -> bool:
+        """Roll back the open transaction of a connection, False if that failed"""
+        try:
+            db.connection.rollback()
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def __execute(cursor: Any, sql: str, params: Sequence[Any]) -> Any:
+        """Execute sql on cursor, passing params only when given"""
+        if params:
+            cursor.execute(sql, params)
+        else:
+            cursor.execute(sql)
+        return cursor
+
+    def __is_healthy(self, db: Db, returned_at: float) -> bool:
+        """Run the health check on a connection that was idle for a while"""
+        if self.health_check is None or time.monotonic() - returned_at < self.health_check_after:
+            return True
+        try:
+            cursor = db.connection.cursor()
+            try:
+                cursor.execute(self.health_check)
+                cursor.fetchall()
+            finally:
+                cursor.close()
+            return True
+        except Exception:
+            return False
+
+    def __evict_idle(self) -> None:
+        """Close connections idle longer than idle_timeout, keeping min_size"""
+        expired: list[Db] = []
+        now = time.monotonic()
+        with self.__lock:
+            # Oldest connections are at the start of the list
+            while len(self.__idle) > self.min_size and now - self.__idle[0][1] >= self.idle_timeout:
+                expired.append(self.__idle.pop(0)[0])
+        for db in expired:
+            self.__close(db)
+
+    def __close(self, db: Db) -> None:
+        """Close a pooled connection"""
+        with self.__lock:
+            self.__size -= 1
+        try:
+            db.connection.close()
+        except Exception:
+            pass
@@ -1,9 +1,10 @@
 """Database Manager Interface"""
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, AsyncIterator, Sequence
 
 if TYPE_CHECKING:
     from bclib.db_manager.db import Db
+    from bclib.db_manager.db_pool import DbPool
     from bclib.db_manager.mongo_db import MongoDb
     from bclib.db_manager.rabbit_connection import RabbitConnection
     from bclib.db_manager.restful_connection import RESTfulConnection
@@ -16,7 +17,8 @@ class IDbManager(ABC):
     Interface for database connection management
 
     Provides methods to open various types of database connections
-    based on configuration settings.
+    based on configuration settings, and an async query API over pooled
+    SQL, ODBC and SQLite connections.
     """
 
     @abstractmethod
@@ -99,3 +101,68 @@ class IDbManager(ABC):
             RabbitConnection: RabbitMQ connection instance
         """
         pass
+
+    @abstractmethod
+    def get_pool(self, key: str) -> 'DbPool':
+        """
+        Get the connection pool of a SQL, ODBC or SQLite connection
+
+        Args:
+            key: Configuration key for the connection
+
+        Returns:
+            DbPool: Connection pool for the key
+        """
+        pass
+
+    @abstractmethod
+    async def execute_async(self, key: str, sql: str, params: Sequence[Any] = ()) -> int:
+        """
+        Execute a statement on a pooled connection and commit
+
+        Args:
+            key: Configuration key for the connection
+            sql: SQL statement
+            params: Statement parameters
+
+        Returns:
+            int: Number of affected rows
+        """
+        pass
+
+    @abstractmethod
+    async def fetch_async(self, key: str, sql: str, params: Sequence[Any] = ()) -> list:
+        """
+        Run a query on a pooled connection and fetch all rows
+
+        Args:
+            key: Configuration key for the connection
+            sql: SQL query
+            params: Query parameters
+
+        Returns:
+            list: All result rows
+        """
+        pass
+
+    @abstractmethod
+    def fetchmany(self, key: str, sql: str, params: Sequence[Any] = (), size: int = 100) -> AsyncIterator[list]:
+        """
+        Run a query on a pooled connection and stream rows in batches
+
+        Args:
+            key: Configuration key for the connection
+            sql: SQL query
+            params: Query parameters
+            size: Rows per batch
+
+        Returns:
+            AsyncIterator[list]: Batches of up to size rows
+
+        Example:
+            ```python
+            async for rows in db_manager.fetchmany('main', 'SELECT * FROM events', size=500):
+                process(rows)
+            ```
+        """
+        pass
@@ -14,5 +14,8 @@ class OdbcDb(Db):
         self.connection = pyodbc.connect(connection_string)
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.connection.close()
+        if self.pool is not None:
+            self.pool.release(self)
+        else:
+            self.connection.close()
         return super().__exit__(exc_type, exc_val, exc_tb)
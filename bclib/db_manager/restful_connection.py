@@ -1,14 +1,116 @@
 """RESTful implementation of Db wrapper"""
-from typing import Any
+import asyncio
+from typing import TYPE_CHECKING, Any, Optional
+from urllib.parse import urlsplit
+
 from ..db_manager.db import Db
 
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+
+
+class RESTfulSessionPool:
+    """
+    Long-lived, keep-alive aiohttp sessions shared per base URL
+
+    One session is kept per URL origin (scheme, host and port) so every
+    RESTfulConnection to the same API reuses its pooled connections.
+    DbManager gets the pool injected (registered as a singleton by edge)
+    and closes it on shutdown; connections created without a pool use the
+    process-wide default pool.
+
+    Options:
+        - limit: Max connections in total per session (default: 100)
+        - limit_per_host: Max connections per host (default: 0, no limit)
+        - ttl_dns_cache: Seconds DNS results are cached (default: 300)
+        - keepalive_timeout: Seconds an idle connection is kept (default: 30)
+        - timeout: Total request timeout in seconds (default: 30)
+    """
+
+    __default: Optional['RESTfulSessionPool'] = None
+
+    def __init__(self, options: Optional[dict] = None) -> None:
+        """
+        Initialize session pool
+
+        Args:
+            options: Connector and timeout options (see class docstring)
+        """
+        options = options or {}
+        self.limit: int = int(options.get("limit", 100))
+        self.limit_per_host: int = int(options.get("limit_per_host", 0))
+        self.ttl_dns_cache: Optional[int] = options.get("ttl_dns_cache", 300)
+        self.keepalive_timeout: float = float(
+            options.get("keepalive_timeout", 30))
+        self.timeout: float = float(options.get("timeout", 30))
+        # origin -> (session, loop the session was created on)
+        self.__sessions: dict[str, tuple['ClientSession', asyncio.AbstractEventLoop]] = dict()
+
+    @classmethod
+    def default(cls) -> 'RESTfulSessionPool':
+        """Get the process-wide default pool"""
+        if cls.__default is None:
+            cls.__default = RESTfulSessionPool()
+        return cls.__default
+
+    def get_session(self, url: str) -> 'ClientSession':
+        """
+        Get the shared session for the origin of url
+
+        Args:
+            url: Request URL
+
+        Returns:
+            ClientSession: Keep-alive session for the URL origin
+        """
+        parts = urlsplit(url)
+        key = f"{parts.scheme}://{parts.netloc}"
+        loop = asyncio.get_running_loop()
+        session, session_loop = self.__sessions.get(key, (None, None))
+        if session is not None and not session.closed and session_loop is not loop:
+            RESTfulSessionPool.__close_stale(session, session_loop)
+            session = None
+        if session is None or session.closed:
+            import aiohttp
+            session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    ttl_dns_cache=self.ttl_dns_cache,
+                    use_dns_cache=self.ttl_dns_cache is not None,
+                    keepalive_timeout=self.keepalive_timeout))
+            self.__sessions[key] = (session, loop)
+        return session
+
+    @staticmethod
+    def __close_stale(session: 'ClientSession', session_loop: asyncio.AbstractEventLoop) -> None:
+        """Close a session created on another event loop before it is replaced"""
+        if session_loop.is_closed():
+            # Its connections died with the loop, only mark the session closed
+            session.detach()
+        else:
+            asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+
+    async def close_async(self) -> None:
+        """Close all sessions"""
+        sessions, self.__sessions = self.__sessions, dict()
+        for session, _ in sessions.values():
+            if not session.closed:
+                await session.close()
+
 
 class RESTfulConnection(Db):
     """RESTful implementation of Db wrapper"""
 
-    def __init__(self, connection_string: str) -> None:
+    def __init__(self, connection_string: str, session_pool: Optional[RESTfulSessionPool] = None) -> None:
         super().__init__()
         self.__api_url = connection_string
+        self.__session_pool = session_pool
+
+    def __get_session(self, url: str) -> 'ClientSession':
+        """Get shared session from the pool of this connection (or the default pool)"""
+        return (self.__session_pool or RESTfulSessionPool.default()).get_session(url)
 
     async def get_async(self, segment: str = None, params: dict = None, pre_segment: str = None) -> Any:
         """Send get request to web api"""
@@ -17,10 +119,8 @@ class RESTfulConnection(Db):
             self.__api_url, segment)
         if pre_segment:
             url = '{0}{1}'.format(pre_segment, url)
-        import aiohttp
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params) as response:
-                return await response.json()
+        async with self.__get_session(url).get(url, params=params) as response:
+            return await response.json()
 
     async def post_async(self, segment: str = None, params: dict = None, pre_segment: str = None) -> Any:
         """Send post request to web api"""
@@ -29,7 +129,5 @@ class RESTfulConnection(Db):
             self.__api_url, segment)
         if pre_segment:
             url = '{0}{1}'.format(pre_segment, url)
-        import aiohttp
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=params) as response:
-                return await response.json()
+        async with self.__get_session(url).post(url, json=params) as response:
+            return await response.json()
@@ -5,10 +5,13 @@ from ..db_manager.db import Db
 class SQLiteDb(Db):
     """SQLite implementation of Db wrapper"""
 
-    def __init__(self, connection_string: str) -> None:
+    def __init__(self, connection_string: str, **kwargs) -> None:
         super().__init__()
-        self.connection = sqlite3.connect(connection_string)
+        self.connection = sqlite3.connect(connection_string, **kwargs)
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.connection.close()
+        if self.pool is not None:
+            self.pool.release(self)
+        else:
+            self.connection.close()
         return super().__exit__(exc_type, exc_val, exc_tb)
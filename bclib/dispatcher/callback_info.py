@@ -32,6 +32,34 @@ class CallbackInfo:
         """
         self.__async_callback = async_callback
         self.__predicates = predicates
+        self.__is_route_only: bool = None
+        self.__url_patterns: tuple[str, ...] = None
+        # (check, is_async) per predicate; sync predicates are called without a coroutine
+        self.__checks = [(predicate.check_async, True) if predicate.is_async else (predicate.check, False)
+                         for predicate in predicates]
+        self.__is_sync = not any(is_async for _, is_async in self.__checks)
+
+    @property
+    def predicates(self) -> 'list[Predicate]':
+        """Get routing predicates of the handler"""
+        return self.__predicates
+
+    @property
+    def is_route_only(self) -> bool:
+        """
+        Check if handler selection depends on the URL only
+
+        True when every predicate is a Url predicate, so a match stays valid for
+        any context with the same URL (e.g. all messages of a WebSocket session).
+
+        Returns:
+            True if all predicates are Url predicates
+        """
+        if self.__is_route_only is None:
+            from bclib.predicate.url import Url
+            self.__is_route_only = all(isinstance(predicate, Url)
+                                       for predicate in self.__predicates)
+        return self.__is_route_only
 
     async def try_execute_async(self, context: 'Context') -> dict:
         """
@@ -42,18 +70,40 @@ class CallbackInfo:
 
         Returns:
             Result from handler execution, or error response if predicates fail
+
+        Note:
+            Synchronous predicates are called directly; only async ones
+            (e.g. Callback) are awaited. Handlers with only synchronous
+            predicates are matched without awaiting at all.
+        """
+        try:
+            if self.__is_sync:
+                for check, _ in self.__checks:
+                    if not check(context):
+                        return None
+            else:
+                for check, is_async in self.__checks:
+                    if not (await check(context) if is_async else check(context)):
+                        return None
+        except ShortCircuitErr as ex:
+            return context.generate_error_response(ex)
+        context.resolved_callback = self
+        return await self.__async_callback(context)
+
+    async def execute_async(self, context: 'Context') -> dict:
         """
-        result: dict = None
-        for predicate in self.__predicates:
-            try:
-                if not await predicate.check_async(context):
-                    break
-            except ShortCircuitErr as ex:
-                result = context.generate_error_response(ex)
-                break
-        else:
-            result = await self.__async_callback(context)
-        return result
+        Execute the handler without checking predicates
+
+        Used for contexts whose handler was already resolved (see
+        Context.resolved_callback).
+
+        Args:
+            context: The request context to pass to handler
+
+        Returns:
+            Result from handler execution
+        """
+        return await self.__async_callback(context)
 
     def get_url_patterns(self) -> list[str]:
         """
@@ -62,19 +112,24 @@ class CallbackInfo:
         Converts URL predicates with parameter placeholders (e.g., '/api/users/:id')
         into regex patterns (e.g., '/api/users/(?P<id>[^/]+)') for routing.
 
+        Patterns are extracted once; the router reads them again whenever a
+        handler is added or removed.
+
         Returns:
             List of regex patterns for URL matching
         """
-        from bclib.predicate.url import Url
-
-        patterns = []
-        for predicate in self.__predicates:
-            if isinstance(predicate, Url):
-                pattern = predicate.expression
-                # Convert :param to (?P<param>[^/]+) for named regex groups
-                regex_pattern = re.sub(r':(\w+)', r'(?P<\1>[^/]+)', pattern)
-                patterns.append(regex_pattern)
-        return patterns
+        if self.__url_patterns is None:
+            from bclib.predicate.url import Url
+
+            patterns = []
+            for predicate in self.__predicates:
+                if isinstance(predicate, Url):
+                    pattern = predicate.expression
+                    # Convert :param to (?P<param>[^/]+) for named regex groups
+                    regex_pattern = re.sub(r':(\w+)', r'(?P<\1>[^/]+)', pattern)
+                    patterns.append(regex_pattern)
+            self.__url_patterns = tuple(patterns)
+        return list(self.__url_patterns)
 
     def matches_handler(self, handler: Callable) -> bool:
         """
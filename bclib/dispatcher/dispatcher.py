@@ -44,7 +44,8 @@ import asyncio
 import inspect
 import signal
 from functools import wraps
-from typing import TYPE_CHECKING, Any, Callable, Coroutine, Optional, Type
+from typing import (TYPE_CHECKING, Any, Callable, Coroutine, Iterable,
+                    Optional, Type, get_args, get_origin)
 
 from bclib.cache import CacheFactory, CacheManager
 from bclib.context.context import Context
@@ -53,6 +54,8 @@ from bclib.options.app_options import AppOptions
 if TYPE_CHECKING:
     from bclib.context.context_factory import ContextFactory
 
+    from .rabbit_batcher import RabbitBatcher
+
 from bclib.di import (IHostedService, InjectionPlan, IServiceContainer,
                       IServiceProvider)
 from bclib.exception import HandlerNotFoundErr
@@ -62,6 +65,7 @@ from bclib.predicate import Predicate
 from bclib.utility.static_file_handler import StaticFileHandler
 
 from .callback_info import CallbackInfo
+from .handler_table import HandlerTable
 from .idispatcher import IDispatcher
 from .imessage_handler import IMessageHandler
 
@@ -115,6 +119,16 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
         self.__logger = logger
         self.__options = options
         self.__look_up: dict[Type, list[CallbackInfo]] = dict()
+        # Value-indexed view of __look_up per context type, rebuilt on first dispatch after a change
+        self.__handler_tables: dict[Type, HandlerTable] = dict()
+        # Incremented on every handler change; WebSocket sessions re-resolve their route when it moves
+        self.__routes_version: int = 0
+        # (context type, handler) pairs added during register_handlers, routed once at the end
+        self.__pending_routes: Optional[list[tuple[Type, CallbackInfo]]] = None
+        # Largest max_size of the registered rabbit batch handlers
+        self.__max_batch_size: int = 0
+        # Batchers of rabbit batch handlers, flushed on shutdown
+        self.__rabbit_batchers: list['RabbitBatcher'] = []
         self.__service_provider = service_provider
         self.__service_container = service_container
         cache_options = self.__options.get('cache')
@@ -125,6 +139,10 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
 
         self.name = self.__options.get('name')
 
+        # Max member contexts of a source command dispatched at once (<= 0: no limit)
+        self.__member_concurrency: int = self.__options.get(
+            'member_concurrency', 10)
+
         # Store listener factory for lazy loading in initialize_task
         self.__listeners: list[IListener] = []
 
@@ -164,6 +182,20 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
         """
         return self.__cache_manager
 
+    @property
+    def routes_version(self) -> int:
+        """Get version of registered handlers
+
+        Returns:
+            int: Number incremented whenever a handler is registered or unregistered
+        """
+        return self.__routes_version
+
+    @property
+    def max_batch_size(self) -> int:
+        """Get largest max_size of the registered rabbit batch handlers (0 if none)"""
+        return self.__max_batch_size
+
     def register_handler(
         self,
         context_type: Type['Context'],
@@ -222,18 +254,53 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
         if decorator is None:
             raise ValueError(f"Unsupported context type: {context_type}")
 
-        # Apply decorator to handler
-        decorator(*predicates)(handler)
+        # Apply decorator to handler; it adds the handler to the router
+        decorator(None, None, *predicates)(handler)
 
-        # Rebuild router if auto-generated
-        self.__context_factory.rebuild_router()
+        return self
+
+    def register_handlers(
+        self,
+        handlers: 'Iterable[tuple[Type[Context], Callable] | tuple[Type[Context], Callable, list[Predicate]]]'
+    ) -> 'Dispatcher':
+        """Register several handlers, updating the router once
+
+        Use when loading many handlers at runtime (e.g. plugins); registering
+        them one by one with register_handler updates the router per handler.
+
+        Args:
+            handlers: (context_type, handler) or (context_type, handler, predicates) tuples
+
+        Returns:
+            Dispatcher: Self for method chaining
 
+        Raises:
+            ValueError: If a context_type is not supported. Handlers registered
+                before the failing one stay registered.
+
+        Example:
+            ```python
+            dispatcher.register_handlers([
+                (RESTfulContext, list_users, [dispatcher.url("api/users")]),
+                (RESTfulContext, get_user, [dispatcher.url("api/users/:id")]),
+                (WebSocketContext, chat_handler, [dispatcher.url("ws/chat")]),
+            ])
+            ```
+        """
+        self.__pending_routes = []
+        try:
+            for item in handlers:
+                self.register_handler(*item)
+        finally:
+            routes, self.__pending_routes = self.__pending_routes, None
+            if self.__context_factory is not None:
+                self.__context_factory.add_routes(routes)
         return self
 
     def unregister_handler(
         self,
         context_type: Type['Context'],
-        handler: Optional[Callable]
+        handler: Optional[Callable] = None
     ) -> 'Dispatcher':
         """Unregister handler(s) for a specific context type
 
@@ -246,7 +313,8 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
             Dispatcher: Self for method chaining
 
         Note:
-            Automatically rebuilds the router after handler removal
+            Removed handlers are taken out of the router; requests already being
+            dispatched finish with the handlers they started with
 
         Example:
             ```python
@@ -261,16 +329,22 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
 
         if handler is None:
             # Remove all handlers for this context type
-            handlers.clear()
+            removed = list(handlers)
         else:
             # Remove specific handler using CallbackInfo's matches_handler method
-            handlers[:] = [
-                callback_info for callback_info in handlers
-                if not callback_info.matches_handler(handler)
-            ]
-
-        # Rebuild router if auto-generated
-        self.__context_factory.rebuild_router()
+            removed = [callback_info for callback_info in handlers
+                       if callback_info.matches_handler(handler)]
+        if not removed:
+            return self
+
+        removed_ids = {id(callback_info) for callback_info in removed}
+        handlers[:] = [callback_info for callback_info in handlers
+                       if id(callback_info) not in removed_ids]
+        self.__handler_tables.pop(context_type, None)
+        self.__routes_version += 1
+        if self.__context_factory is not None:
+            self.__context_factory.remove_routes(
+                (context_type, callback_info) for callback_info in removed)
 
         return self
 
@@ -323,7 +397,7 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
         # Build predicates using helper method
         combined_predicates = PredicateHelper.build_predicates(
             route,
-            method=method,
+            method,
             *predicates
         )
 
@@ -340,10 +414,9 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
                               **(context.query or {})}
                 action_result = await injection_plan.execute_async(
                     context.services, self.__event_loop, **kwargs)
-                return None if action_result is None else context.generate_response(action_result)
+                return None if action_result is None else await context.generate_response_async(action_result)
 
-            self._get_context_lookup(RESTfulContext)\
-                .append(CallbackInfo(combined_predicates, wrapper))
+            self.__add_handler(RESTfulContext, CallbackInfo(combined_predicates, wrapper))
             return restful_handler_fn
         return _decorator
 
@@ -395,7 +468,7 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
         # Build predicates using helper method
         combined_predicates = PredicateHelper.build_predicates(
             route,
-            method=method,
+            method,
             *predicates
         )
 
@@ -410,10 +483,9 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
                 if injection_plan.has_value_parameters:
                     kwargs = context.url_segments if context.url_segments else {}
                 action_result = await injection_plan.execute_async(context.services, self.__event_loop, **kwargs)
-                return None if action_result is None else context.generate_response(action_result)
+                return None if action_result is None else await context.generate_response_async(action_result)
 
-            self._get_context_lookup(HttpContext)\
-                .append(CallbackInfo(combined_predicates, wrapper))
+            self.__add_handler(HttpContext, CallbackInfo(combined_predicates, wrapper))
             return web_handler_fn
         return _decorator
 
@@ -437,7 +509,7 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
         # Build predicates using helper method
         combined_predicates = PredicateHelper.build_predicates(
             route,
-            method=method,
+            method,
             *predicates
         )
 
@@ -453,8 +525,7 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
                     kwargs = context.url_segments if context.url_segments else {}
                 return await injection_plan.execute_async(context.services, self.__event_loop, **kwargs)
 
-            self._get_context_lookup(WebSocketContext)\
-                .append(CallbackInfo(combined_predicates, wrapper))
+            self.__add_handler(WebSocketContext, CallbackInfo(combined_predicates, wrapper))
             return websocket_handler_fn
         return _decorator
 
@@ -479,7 +550,7 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
         # Build predicates using helper method
         combined_predicates = PredicateHelper.build_predicates(
             route,
-            method=method,
+            method,
             *predicates
         )
 
@@ -494,23 +565,9 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
                 if injection_plan.has_value_parameters:
                     kwargs = context.url_segments if context.url_segments else {}
                 data = await injection_plan.execute_async(context.services, self.__event_loop, **kwargs)
-                result_set = list()
                 if data is not None:
-                    for member in context.command.member:
-                        member_context = ClientSourceMemberContext(
-                            context, data, member)
-                        dispatch_result = await self.dispatch_async(member_context)
-                        result = {
-                            "options": {
-                                "tableName": member_context.table_name,
-                                "keyFieldName": member_context.key_field_name,
-                                "statusFieldName": member_context.status_field_name,
-                                "mergeType": member_context.merge_type.value,
-                                "columnNames": member_context.column_names,
-                            },
-                            "data": dispatch_result
-                        }
-                        result_set.append(result)
+                    result_set = await self.__dispatch_members_async(
+                        context, data, ClientSourceMemberContext)
                     ret_val = {
                         "setting": {
                             "keepalive": False,
@@ -521,8 +578,7 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
                 else:
                     return None
 
-            self._get_context_lookup(ClientSourceContext)\
-                .append(CallbackInfo(combined_predicates, wrapper))
+            self.__add_handler(ClientSourceContext, CallbackInfo(combined_predicates, wrapper))
 
             return client_source_handler_fn
         return _decorator
@@ -547,7 +603,7 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
         # Build predicates using helper method
         combined_predicates = PredicateHelper.build_predicates(
             route,
-            method=method,
+            method,
             *predicates
         )
 
@@ -563,8 +619,7 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
                     kwargs = context.url_segments if context.url_segments else {}
                 return await injection_plan.execute_async(context.services, self.__event_loop, **kwargs)
 
-            self._get_context_lookup(ClientSourceMemberContext)\
-                .append(CallbackInfo(combined_predicates, wrapper))
+            self.__add_handler(ClientSourceMemberContext, CallbackInfo(combined_predicates, wrapper))
             return client_source_member_handler_fn
         return _decorator
 
@@ -589,7 +644,7 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
         # Build predicates using helper method
         combined_predicates = PredicateHelper.build_predicates(
             route,
-            method=method,
+            method,
             *predicates
         )
 
@@ -604,23 +659,9 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
                 if injection_plan.has_value_parameters:
                     kwargs = context.url_segments if context.url_segments else {}
                 data = await injection_plan.execute_async(context.services, self.__event_loop, **kwargs)
-                result_set = list()
                 if data is not None:
-                    for member in context.command.member:
-                        member_context = ServerSourceMemberContext(
-                            context, data, member)
-                        dispatch_result = await self.dispatch_async(member_context)
-                        result = {
-                            "options": {
-                                "tableName": member_context.table_name,
-                                "keyFieldName": member_context.key_field_name,
-                                "statusFieldName": member_context.status_field_name,
-                                "mergeType": member_context.merge_type.value,
-                                "columnNames": member_context.column_names,
-                            },
-                            "data": dispatch_result
-                        }
-                        result_set.append(result)
+                    result_set = await self.__dispatch_members_async(
+                        context, data, ServerSourceMemberContext)
                     ret_val = {
                         "setting": {
                             "keepalive": False,
@@ -631,8 +672,7 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
                 else:
                     return None
 
-            self._get_context_lookup(ServerSourceContext)\
-                .append(CallbackInfo(combined_predicates, wrapper))
+            self.__add_handler(ServerSourceContext, CallbackInfo(combined_predicates, wrapper))
 
             return server_source_handler_fn
         return _decorator
@@ -657,7 +697,7 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
         # Build predicates using helper method
         combined_predicates = PredicateHelper.build_predicates(
             route,
-            method=method,
+            method,
             *predicates
         )
 
@@ -673,8 +713,7 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
                     kwargs = context.url_segments if context.url_segments else {}
                 return await injection_plan.execute_async(context.services, self.__event_loop, **kwargs)
 
-            self._get_context_lookup(ServerSourceMemberContext)\
-                .append(CallbackInfo(combined_predicates, wrapper))
+            self.__add_handler(ServerSourceMemberContext, CallbackInfo(combined_predicates, wrapper))
             return server_source_member_handler_fn
         return _decorator
 
@@ -687,6 +726,11 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
         - Skip context and use only services: def handler(logger: ILogger)
         - Mix both: def handler(context: RabbitContext, logger: ILogger)
 
+        Request/reply: when the message carries a reply_to property (see
+        IRabbitConnection.request_async), the handler return value is published
+        back to that queue with the request correlation_id. If the handler raises,
+        the error response is sent as the reply.
+
         Args:
             route: Optional URL route pattern
             method: Optional HTTP method filter
@@ -698,7 +742,7 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
         # Build predicates using helper method
         combined_predicates = PredicateHelper.build_predicates(
             route,
-            method=method,
+            method,
             *predicates
         )
 
@@ -708,14 +752,112 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
 
             @wraps(rabbit_handler_fn)
             async def wrapper(context: RabbitContext):
-                return await injection_plan.execute_async(context.services, self.__event_loop)
+                message = context.message
+                if not message.reply_to or message.connection is None:
+                    return await injection_plan.execute_async(context.services, self.__event_loop)
+                try:
+                    result = await injection_plan.execute_async(context.services, self.__event_loop)
+                except Exception as ex:
+                    await message.connection.reply_async(message, context.generate_error_response(ex))
+                    raise
+                await message.connection.reply_async(message, result)
+                return result
 
-            self._get_context_lookup(RabbitContext)\
-                .append(CallbackInfo(combined_predicates, wrapper))
+            self.__add_handler(RabbitContext, CallbackInfo(combined_predicates, wrapper))
 
             return rabbit_handler_fn
         return _decorator
 
+    def rabbit_batch_handler(self, route: Optional[str] = None, method: Optional[str | list[str]] = None, *predicates: (Predicate),
+                             max_size: int = 500, max_wait_ms: float = 50, requeue: bool = False):
+        """
+        Decorator for RabbitMQ batch handler with automatic DI
+
+        Matching messages are collected into batches of up to max_size messages
+        (or whatever arrived within max_wait_ms) and the handler is called once
+        per batch. The handler receives the batch through a parameter annotated
+        as list[RabbitMessage] or list[RabbitContext]; other parameters are
+        injected from a DI scope shared by the whole batch.
+
+        The handler result decides acknowledgement:
+        - None or True: ack the whole batch
+        - False or an exception: nack the whole batch
+        - list of bool, one per message: ack/nack individual messages
+
+        Note:
+            Messages are collected from concurrently processed deliveries, so
+            RabbitMQ listeners raise their concurrency and prefetch_count to
+            max_size when they are lower. The per-message contexts only match
+            predicates; no DI scope is created for them unless the handler uses
+            context.services. Request/reply is not supported for batches.
+
+        Example:
+            ```python
+            @app.rabbit_batch_handler(max_size=500, max_wait_ms=50)
+            async def ingest(messages: list[RabbitMessage], db: IMongoConnection['database.main']):
+                await db.get_async_collection('events').insert_many(
+                    [json.loads(message.message_text) for message in messages])
+            ```
+
+        Args:
+            route: Optional URL route pattern
+            method: Optional HTTP method filter
+            *predicates: Variable number of Predicate objects for additional matching rules
+            max_size: Maximum number of messages per batch
+            max_wait_ms: Maximum time in milliseconds to wait for a batch to fill
+            requeue: Whether nacked messages are requeued by the broker
+        """
+        from bclib.context import RabbitContext
+        from bclib.listener.rabbit.rabbit_message import RabbitMessage
+        from bclib.predicate import PredicateHelper
+
+        from .rabbit_batcher import RabbitBatcher
+
+        # Build predicates using helper method
+        combined_predicates = PredicateHelper.build_predicates(
+            route,
+            method,
+            *predicates
+        )
+
+        def _decorator(rabbit_batch_handler_fn: Callable):
+            # Pre-compile injection plan at decoration time (once)
+            injection_plan = InjectionPlan(rabbit_batch_handler_fn)
+
+            # Find the parameter that receives the batch
+            batch_param = None
+            for param_name, strategy in injection_plan.param_strategies.items():
+                if get_origin(strategy.target_type) is list and \
+                        get_args(strategy.target_type)[:1] in ((RabbitMessage,), (RabbitContext,)):
+                    batch_param = param_name
+                    pass_messages = get_args(strategy.target_type)[0] is RabbitMessage
+                    break
+            if batch_param is None:
+                raise TypeError(
+                    f"{rabbit_batch_handler_fn.__name__} must have a list[RabbitMessage] or list[RabbitContext] parameter")
+
+            async def process_batch_async(contexts: list[RabbitContext]):
+                batch = [context.message for context in contexts] if pass_messages else contexts
+                services = self.__service_provider.create_scope()
+                try:
+                    return await injection_plan.execute_async(services, self.__event_loop, **{batch_param: batch})
+                finally:
+                    services.clear_scope()
+
+            batcher = RabbitBatcher(
+                process_batch_async, max_size, max_wait_ms, self.__event_loop, self.__logger, requeue)
+            self.__max_batch_size = max(self.__max_batch_size, max_size)
+            self.__rabbit_batchers.append(batcher)
+
+            @wraps(rabbit_batch_handler_fn)
+            async def wrapper(context: RabbitContext):
+                return await batcher.add_async(context)
+
+            self.__add_handler(RabbitContext, CallbackInfo(combined_predicates, wrapper))
+
+            return rabbit_batch_handler_fn
+        return _decorator
+
     def handler(self, route: Optional[str] = None, method: Optional[str | list[str]] = None, *predicates: (Predicate)):
         """
         Universal handler decorator that automatically determines the action type based on handler's context parameter
@@ -840,16 +982,49 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
             self.__look_up[key] = ret_val
         return ret_val
 
+    def __add_handler(self, context_type: Type, callback_info: CallbackInfo) -> None:
+        """Append handler to the lookup of its context type and add its URL patterns to the router
+
+        Args:
+            context_type (Type): Context type class
+            callback_info (CallbackInfo): Handler with its predicates
+        """
+        self._get_context_lookup(context_type).append(callback_info)
+        self.__handler_tables.pop(context_type, None)
+        self.__routes_version += 1
+        if self.__pending_routes is not None:
+            self.__pending_routes.append((context_type, callback_info))
+        elif self.__context_factory is not None:
+            self.__context_factory.add_routes([(context_type, callback_info)])
+
+    def __get_handler_table(self, context_type: Type) -> HandlerTable:
+        """Get handler table of a context type, building it for handlers added since the last build"""
+        handlers = self._get_context_lookup(context_type)
+        table = self.__handler_tables.get(context_type)
+        if table is None or len(table.handlers) != len(handlers):
+            table = self.__handler_tables[context_type] = HandlerTable(handlers)
+        return table
+
+    def __rebuild_handler_tables(self) -> None:
+        """Rebuild handler tables of all context types"""
+        self.__handler_tables = {context_type: HandlerTable(handlers)
+                                 for context_type, handlers in self.__look_up.items()}
+
     async def dispatch_async(self, context: 'Context') -> dict:
         """Dispatch context and get result from related action method"""
 
         result: Any = None
         context_type = type(context)
         try:
-            items = self._get_context_lookup(context_type)
+            resolved_callback = context.resolved_callback
+            if resolved_callback is not None:
+                # Handler already resolved for this connection, skip search
+                return await resolved_callback.execute_async(context)
+            items = self.__get_handler_table(context_type).candidates(context)
             for item in items:
                 result = await item.try_execute_async(context)
-                if result is not None:
+                # A handler cached for the connection counts as found even if it returns None
+                if result is not None or context.resolved_callback is item:
                     break
             else:
                 raise HandlerNotFoundErr(context_type.__name__)
@@ -858,6 +1033,66 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
             result = context.generate_error_response(ex)
         return result
 
+    async def __dispatch_members_async(self, context: 'Context', data: Any, member_context_type: Type) -> list:
+        """Dispatch member contexts of a source command concurrently
+
+        At most member_concurrency members are dispatched at once. Results keep
+        the order of the members in the command. ColumnarResult results are
+        projected by the member's column_names and written as array rows.
+
+        Args:
+            context: Client or server source context
+            data: Data returned by the source handler
+            member_context_type: ClientSourceMemberContext or ServerSourceMemberContext
+
+        Returns:
+            list: Source result objects, one per member
+        """
+        from bclib.context import ColumnarResult
+
+        semaphore = asyncio.Semaphore(self.__member_concurrency)\
+            if self.__member_concurrency > 0 else None
+
+        async def dispatch_member_async(member) -> dict:
+            member_context = member_context_type(context, data, member)
+            if semaphore is None:
+                dispatch_result = await self.__dispatch_member_async(member_context)
+            else:
+                async with semaphore:
+                    dispatch_result = await self.__dispatch_member_async(member_context)
+            options = {
+                "tableName": member_context.table_name,
+                "keyFieldName": member_context.key_field_name,
+                "statusFieldName": member_context.status_field_name,
+                "mergeType": member_context.merge_type.value,
+                "columnNames": member_context.column_names,
+            }
+            if isinstance(dispatch_result, ColumnarResult):
+                if member_context.column_names:
+                    dispatch_result = dispatch_result.select(member_context.column_names)
+                return dispatch_result.to_source(options)
+            return {
+                "options": options,
+                "data": dispatch_result
+            }
+
+        members = context.command.member
+        if len(members) == 1:
+            return [await dispatch_member_async(members[0])]
+        return list(await asyncio.gather(*(dispatch_member_async(member) for member in members)))
+
+    async def __dispatch_member_async(self, member_context: 'Context') -> Any:
+        """Dispatch a member context to the first matching handler in registration order"""
+        try:
+            for item in self.__get_handler_table(type(member_context)).candidates(member_context):
+                result = await item.try_execute_async(member_context)
+                if result is not None:
+                    return result
+            raise HandlerNotFoundErr(type(member_context).__name__)
+        except Exception as ex:
+            self.__logger.error(f"Error in dispatch_async {ex}", exc_info=True)
+            return member_context.generate_error_response(ex)
+
     def dispatch_in_background(self, context: 'Context') -> asyncio.Future:
         """Dispatch context in background"""
 
@@ -915,6 +1150,22 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
         """
         self.__listeners.append(listener)
 
+    def build_router(self) -> 'ContextFactory':
+        """Create the context factory and build the router from registered handlers
+
+        Called by initialize_task_async() before listeners start; handlers
+        registered afterwards update the router incrementally.
+
+        Returns:
+            ContextFactory: Context factory used to create contexts of messages
+        """
+        from bclib.context.context_factory import ContextFactory
+        self.__context_factory = self.service_provider.create_instance(
+            ContextFactory, lookup=self.__look_up)
+        self.__context_factory.rebuild_router()
+        self.__rebuild_handler_tables()
+        return self.__context_factory
+
     async def initialize_task_async(self):
         """Initialize all listeners and tasks
 
@@ -928,11 +1179,8 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
             - Initializes endpoint listener if configured
             - Called automatically by listening() method
         """
-        from bclib.context.context_factory import ContextFactory
-        self.__context_factory = self.service_provider.create_instance(
-            ContextFactory, lookup=self.__look_up)
         # Ensure router is ready before server starts
-        self.__context_factory.rebuild_router()
+        self.build_router()
 
         # Initialize all hosted services (async)
         await self.__service_container.initialize_hosted_services_async()
@@ -985,7 +1233,14 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
                 self.__logger.info("Stopping hosted services...")
                 await self.__service_container.stop_hosted_services_async()
 
-                # 2. Close all listeners
+                # 2. Process collected rabbit batches so their messages are acked
+                if self.__rabbit_batchers:
+                    self.__logger.info("Flushing rabbit batches...")
+                    await asyncio.gather(
+                        *(batcher.close_async() for batcher in self.__rabbit_batchers),
+                        return_exceptions=True)
+
+                # 3. Close all listeners
                 self.__logger.info("Closing listeners...")
                 close_tasks = []
                 for listener in self.__listeners:
@@ -1005,7 +1260,7 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
                     except Exception as e:
                         self.__logger.error(f"Error closing listeners: {e}")
 
-                # 3. Cancel all remaining tasks (except this one)
+                # 4. Cancel all remaining tasks (except this one)
                 self.__logger.info("Cancelling remaining tasks...")
                 tasks = [t for t in asyncio.all_tasks(loop=self.__event_loop)
                          if t is not asyncio.current_task() and not t.done()]
@@ -1013,7 +1268,7 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
                 for task in tasks:
                     task.cancel()
 
-                # 4. Wait for tasks to complete cancellation
+                # 5. Wait for tasks to complete cancellation
                 if tasks:
                     self.__logger.info(
                         f"Waiting for {len(tasks)} tasks to complete...")
@@ -1077,8 +1332,7 @@ class Dispatcher(IDispatcher, IMessageHandler, IHostedService):
             handler_result = await handler.handle(context)
             return None if handler_result is None else context.generate_response(handler_result)
 
-        self._get_context_lookup(HttpContext)\
-            .append(CallbackInfo([], async_wrapper))
+        self.__add_handler(HttpContext, CallbackInfo([], async_wrapper))
 
     def cache(self, life_time: int = 0, key: Optional[str] = None):
         """Decorator to cache function results
@@ -0,0 +1,111 @@
+"""HandlerTable - Handlers of a context type indexed by a shared Equal/InList expression"""
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence
+
+if TYPE_CHECKING:
+    from bclib.context.context import Context
+    from bclib.dispatcher.callback_info import CallbackInfo
+
+
+class HandlerTable:
+    """
+    Registered handlers of one context type with a value index
+
+    Endpoints often have many handlers that differ only by an Equal or InList
+    predicate on the same expression (e.g. one handler per
+    'context.query.action'). The table picks the expression shared by most
+    handlers and maps each of its constant values to the handlers that can
+    still match it, so dispatch evaluates those candidates only instead of
+    every handler in turn.
+
+    Handlers without a predicate on the indexed expression are candidates for
+    every value. Candidates keep registration order and are still checked
+    with all of their predicates, so the index only skips handlers that
+    cannot match.
+
+    Example:
+        ```python
+        table = HandlerTable(handlers)
+        for callback_info in table.candidates(context):
+            result = await callback_info.try_execute_async(context)
+        ```
+    """
+
+    def __init__(self, handlers: 'Sequence[CallbackInfo]') -> None:
+        """
+        Build the table
+
+        Args:
+            handlers: Handlers in registration order
+        """
+        self.handlers = tuple(handlers)
+        self.expression: Optional[str] = None
+        self.__accessor: Optional[Callable[['Context'], Any]] = None
+        self.__by_value: dict[Any, tuple] = {}
+        self.__default: tuple = self.handlers
+        self.__build()
+
+    @property
+    def indexed_values(self) -> int:
+        """Get number of values in the index (0 if nothing is indexed)"""
+        return len(self.__by_value)
+
+    def candidates(self, context: 'Context') -> 'Sequence[CallbackInfo]':
+        """
+        Get handlers that may match the context, in registration order
+
+        Args:
+            context: Context to dispatch
+
+        Returns:
+            Sequence[CallbackInfo]: Candidate handlers
+        """
+        if self.__accessor is None:
+            return self.handlers
+        try:
+            return self.__by_value.get(self.__accessor(context), self.__default)
+        except (KeyError, AttributeError, TypeError):
+            return self.__default
+
+    def __build(self) -> None:
+        """Choose the indexed expression and group handlers by its values"""
+        # expression -> {handler position: allowed values}
+        groups: dict[str, dict[int, tuple]] = {}
+        accessors: dict[str, Callable] = {}
+        for position, callback_info in enumerate(self.handlers):
+            for predicate in callback_info.predicates:
+                values = predicate.matching_values
+                if values is None or not HandlerTable.__is_hashable(values):
+                    continue
+                group = groups.setdefault(predicate.expression, {})
+                if position not in group:
+                    group[position] = values
+                    accessors.setdefault(predicate.expression, predicate._accessor)
+
+        # Index the expression discriminating the most handlers, then the most values
+        best = max(groups.items(), default=None,
+                   key=lambda item: (len(item[1]), len({v for values in item[1].values() for v in values})))
+        if best is None or len(best[1]) < 2:
+            return
+        expression, group = best
+
+        positions_by_value: dict[Any, set[int]] = {}
+        for position, values in group.items():
+            for value in values:
+                positions_by_value.setdefault(value, set()).add(position)
+        others = [position for position in range(len(self.handlers)) if position not in group]
+
+        self.expression = expression
+        self.__accessor = accessors[expression]
+        self.__default = tuple(self.handlers[position] for position in others)
+        self.__by_value = {
+            value: tuple(self.handlers[position] for position in sorted(positions.union(others)))
+            for value, positions in positions_by_value.items()
+        }
+
+    @staticmethod
+    def __is_hashable(values: tuple) -> bool:
+        try:
+            hash(values)
+            return True
+        except TypeError:
+            return False
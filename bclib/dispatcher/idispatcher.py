@@ -35,6 +35,12 @@ class IDispatcher(PredicateHelper, ABC):
         """Get the root service provider (DI container)"""
         pass
 
+    @property
+    @abstractmethod
+    def routes_version(self) -> int:
+        """Get version of registered handlers, changed on every register/unregister"""
+        pass
+
     @abstractmethod
     async def dispatch_async(self, context: 'Context') -> Any:
         """Dispatch context and get result from related action method"""
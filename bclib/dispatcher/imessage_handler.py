@@ -25,3 +25,12 @@ class IMessageHandler(ABC):
             via message.set_response_async().
         """
         pass
+
+    @property
+    def max_batch_size(self) -> int:
+        """Get largest number of concurrently received messages a handler batches (0 if none)
+
+        Listeners that process messages concurrently use it as their minimum
+        concurrency, so batches can fill up.
+        """
+        return 0
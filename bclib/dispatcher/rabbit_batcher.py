@@ -0,0 +1,142 @@
+"""RabbitBatcher - Collects RabbitMQ message contexts into batches for bulk handlers"""
+import asyncio
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
+
+if TYPE_CHECKING:
+    from bclib.context import RabbitContext
+    from bclib.logger import ILogger
+
+
+class RabbitBatcher:
+    """
+    Accumulates RabbitContext objects and hands them to a batch callback
+
+    A batch is flushed when it reaches max_size items or when max_wait_ms has
+    elapsed since its first item arrived, whichever comes first. Every caller
+    of add_async waits until its batch has been processed and receives whether
+    its message was accepted.
+
+    The batch callback result decides acknowledgement:
+        - None or True: every message in the batch is acked
+        - False: every message in the batch is nacked
+        - list/tuple of bool (same length as the batch): per-message ack/nack
+        - an exception: every message in the batch is nacked
+
+    Nacked messages are flagged through RabbitMessage.nack(), the connection
+    rejects them once dispatch returns.
+
+    Attributes:
+        max_size: Maximum number of messages per batch
+        max_wait: Maximum time in seconds a message waits for its batch to fill
+    """
+
+    def __init__(
+        self,
+        callback: Callable[['list[RabbitContext]'], Awaitable[Any]],
+        max_size: int,
+        max_wait_ms: float,
+        loop: asyncio.AbstractEventLoop,
+        logger: 'ILogger',
+        requeue: bool = False
+    ) -> None:
+        """
+        Initialize RabbitBatcher
+
+        Args:
+            callback: Async function called once per batch with the list of contexts
+            max_size: Maximum number of messages per batch
+            max_wait_ms: Maximum time in milliseconds to wait for a batch to fill
+            loop: Event loop used for the flush timer
+            logger: Logger for batch handler errors
+            requeue: Whether nacked messages are requeued by the broker
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.max_wait = max(0, max_wait_ms) / 1000
+        self.__callback = callback
+        self.__event_loop = loop
+        self.__logger = logger
+        self.__requeue = requeue
+        self.__pending: list[tuple['RabbitContext', asyncio.Future]] = []
+        self.__timer: Optional[asyncio.TimerHandle] = None
+        # Running batches, referenced so they are not garbage collected mid-batch
+        self.__tasks: set[asyncio.Task] = set()
+
+    async def add_async(self, context: 'RabbitContext') -> bool:
+        """
+        Add a context to the current batch and wait for the batch result
+
+        Args:
+            context: RabbitMQ message context
+
+        Returns:
+            True if the message was acked, False if it was nacked
+        """
+        future = self.__event_loop.create_future()
+        self.__pending.append((context, future))
+        if len(self.__pending) >= self.max_size:
+            self.flush()
+        elif self.__timer is None:
+            self.__timer = self.__event_loop.call_later(
+                self.max_wait, self.flush)
+        return await future
+
+    def flush(self) -> None:
+        """Hand the pending contexts to the batch callback now"""
+        if self.__timer is not None:
+            self.__timer.cancel()
+            self.__timer = None
+        if not self.__pending:
+            return
+        batch, self.__pending = self.__pending, []
+        task = self.__event_loop.create_task(self.__process_async(batch))
+        self.__tasks.add(task)
+        task.add_done_callback(self.__tasks.discard)
+
+    async def close_async(self, timeout: float = 5.0) -> None:
+        """
+        Flush the pending batch and wait for running batches (call on shutdown)
+
+        Batches still running after timeout are cancelled; their messages are nacked.
+
+        Args:
+            timeout: Seconds to wait for running batches
+        """
+        self.flush()
+        if not self.__tasks:
+            return
+        _, not_done = await asyncio.wait(set(self.__tasks), timeout=timeout)
+        for task in not_done:
+            task.cancel()
+        await asyncio.gather(*not_done, return_exceptions=True)
+
+    async def __process_async(self, batch: 'list[tuple[RabbitContext, asyncio.Future]]') -> None:
+        """Run the callback for a batch and resolve every waiter with its outcome"""
+        outcomes = [False] * len(batch)
+        try:
+            result = await self.__callback([context for context, _ in batch])
+            outcomes = self.__get_outcomes(result, len(batch))
+        except Exception as ex:
+            self.__logger.error(
+                f"Error in rabbit batch handler, {len(batch)} message(s) nacked: {ex}", exc_info=True)
+        finally:
+            for (context, future), accepted in zip(batch, outcomes):
+                if not accepted:
+                    context.message.nack(self.__requeue)
+                if not future.done():
+                    future.set_result(accepted)
+
+    @staticmethod
+    def __get_outcomes(result: Any, size: int) -> list[bool]:
+        """Translate a batch callback result into per-message ack flags"""
+        if result is None or result is True:
+            return [True] * size
+        if result is False:
+            return [False] * size
+        if isinstance(result, (list, tuple)):
+            if len(result) != size:
+                raise ValueError(
+                    f"Batch handler returned {len(result)} results for {size} messages")
+            return [bool(item) for item in result]
+        return [True] * size
@@ -218,8 +218,11 @@ def from_options(options: dict, loop: asyncio.AbstractEventLoop = None) -> IDisp
     add_log_service(service_container)
 
     # Register database manager in DI container
-    from bclib.db_manager import DbManager, IDbManager
-    service_container.add_singleton(IDbManager, DbManager)
+    from bclib.db_manager import DbManager, IDbManager, RESTfulSessionPool
+    service_container.add_singleton(
+        RESTfulSessionPool,
+        factory=lambda sp, **kwargs: RESTfulSessionPool(options.get('restful_session')))
+    service_container.add_singleton(IDbManager, DbManager, is_hosted=True)
 
     # Register listener factory in DI container
     from bclib.listener import adding_listener_services
@@ -24,9 +24,16 @@ def adding_listener_services(service_container: IServiceContainer) -> None:
         service_container: The service container instance to which listener services
                           will be added.
     """
-    from .http import IWebSocketSessionManager, WebSocketSessionManager
+    from bclib.di import IServiceProvider
+
+    from .http.iwebsocket_session_manager import IWebSocketSessionManager
     from .listener_factory import ListenerFactory
 
+    def create_websocket_session_manager(service_provider: IServiceProvider, **kwargs):
+        """Factory importing WebSocketSessionManager (and aiohttp) on first use"""
+        from .http.websocket_session_manager import WebSocketSessionManager
+        return service_provider.create_instance(WebSocketSessionManager, **kwargs)
+
     return service_container\
         .add_transient(IListenerFactory, ListenerFactory)\
-        .add_singleton(IWebSocketSessionManager, WebSocketSessionManager)
+        .add_singleton(IWebSocketSessionManager, factory=create_websocket_session_manager)
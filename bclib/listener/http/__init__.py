@@ -1,13 +1,41 @@
+"""HTTP listener module - aiohttp based HTTP and WebSocket handling
+
+Exports are imported on first access, so importing message types (e.g. for
+isinstance checks) does not load aiohttp or cryptography until a listener or
+WebSocket session is actually used.
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from bclib.utility.http_base_data_name import HttpBaseDataName
 from bclib.utility.http_base_data_type import HttpBaseDataType
 
-from .http_listener import HttpListener
-from .http_message import HttpMessage
-from .iwebsocket_session_manager import IWebSocketSessionManager
-from .websocket_message import WebSocketMessage, WSMessageType
-from .websocket_session import WebSocketSession
-from .websocket_session_manager import WebSocketSessionManager
+if TYPE_CHECKING:
+    from .http_listener import HttpListener
+    from .http_message import HttpMessage
+    from .iwebsocket_session_manager import IWebSocketSessionManager
+    from .websocket_message import WebSocketMessage, WSMessageType
+    from .websocket_session import WebSocketSession
+    from .websocket_session_manager import WebSocketSessionManager
 
 __all__ = ['HttpListener', 'HttpBaseDataName', 'HttpBaseDataType',
            'HttpMessage', 'IWebSocketSessionManager', 'WebSocketMessage', 'WSMessageType', 'WebSocketSession',
            'WebSocketSessionManager']
+
+__lazy_exports = {
+    'HttpListener': '.http_listener',
+    'HttpMessage': '.http_message',
+    'IWebSocketSessionManager': '.iwebsocket_session_manager',
+    'WebSocketMessage': '.websocket_message',
+    'WSMessageType': '.websocket_message',
+    'WebSocketSession': '.websocket_session',
+    'WebSocketSessionManager': '.websocket_session_manager',
+}
+
+
+def __getattr__(name: str):
+    if name in __lazy_exports:
+        value = getattr(import_module(__lazy_exports[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -1,13 +1,14 @@
 import json
-from typing import Any, Coroutine, Optional, Union
-
-from aiohttp import web
-from aiohttp.web_response import ContentCoding
+from typing import TYPE_CHECKING, Any, Coroutine, Optional, Union
 
 from bclib.listener.icms_base_message import ICmsBaseMessage
 from bclib.listener.iresponse_base_message import IResponseBaseMessage
 from bclib.listener.message import Message
 
+if TYPE_CHECKING:
+    from aiohttp import web
+    from aiohttp.web_response import ContentCoding
+
 
 class HttpMessage(Message, ICmsBaseMessage, IResponseBaseMessage):
     """Message specialization for HTTP (dev server) flow.
@@ -61,12 +62,13 @@ class HttpMessage(Message, ICmsBaseMessage, IResponseBaseMessage):
         """Start streaming response for chunked data transfer"""
         if self.Response is not None:
             raise Exception('StreamResponse already started')
-        if self.__request is None:
+        if self.request is None:
             raise Exception('Request not available for streaming')
+        from aiohttp import web
         self.Response = web.StreamResponse(status=status,
                                            reason=reason,
                                            headers=headers)
-        await self.Response.prepare(self.__request)
+        await self.Response.prepare(self.request)
 
     async def write_async(self, data: bytes) -> Coroutine[Any, Any, None]:
         """Write data chunk to streaming response"""
@@ -80,7 +82,7 @@ class HttpMessage(Message, ICmsBaseMessage, IResponseBaseMessage):
             raise Exception('StreamResponse not started')
         await self.Response.drain()
 
-    async def enable_compression(self, force: Optional[Union[bool, ContentCoding]] = None) -> None:
+    async def enable_compression(self, force: Optional[Union[bool, 'ContentCoding']] = None) -> None:
         """Enable compression for streaming response"""
         if self.Response is None:
             raise Exception('StreamResponse not started')
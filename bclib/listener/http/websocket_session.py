@@ -34,7 +34,7 @@ Example:
 """
 import asyncio
 import logging
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, Type
 
 from aiohttp import WSMsgType
 
@@ -43,7 +43,10 @@ from bclib.listener.message_type import MessageType
 if TYPE_CHECKING:
     from aiohttp import web
 
+    from bclib.context import Context
+    from bclib.di import IServiceProvider
     from bclib.dispatcher import IMessageHandler
+    from bclib.dispatcher.callback_info import CallbackInfo
 
     from .websocket_message import WebSocketMessage
     from .websocket_session_manager import WebSocketSessionManager
@@ -63,6 +66,13 @@ class WebSocketSession:
         url (str): WebSocket URL from CMS request data
         data (dict): Custom data dictionary for storing user-defined session data
         session_manager (Optional[WebSocketSessionManager]): Parent session manager
+        services (Optional[IServiceProvider]): Session-lifetime DI scope, created with
+            the first context of the connection and cleared on disconnect
+        context_type (Optional[Type[Context]]): Context type matched for the session URL
+        callback_info (Optional[CallbackInfo]): Handler resolved for the session URL
+        routes_version (int): Dispatcher routes_version the route was resolved with;
+            route and handler are resolved again after handlers change
+        url_segments (Optional[dict]): URL segments extracted when the handler was resolved
         _message_handler (IMessageHandler): Message handler instance
         _heartbeat_interval (float): Ping interval in seconds
         _lifecycle_task (Optional[asyncio.Task]): Main lifecycle task
@@ -142,6 +152,12 @@ class WebSocketSession:
         self._message_handler = message_handler
         self._heartbeat_interval = heartbeat_interval
         self.session_manager = session_manager
+        # Route and handler are resolved once per connection (URL never changes)
+        self.services: Optional['IServiceProvider'] = None
+        self.context_type: Optional[Type['Context']] = None
+        self.callback_info: Optional['CallbackInfo'] = None
+        self.routes_version: int = -1
+        self.url_segments: Optional[dict] = None
         self._lifecycle_task: Optional[asyncio.Task] = asyncio.create_task(
             self._start_async())
 
@@ -322,6 +338,10 @@ class WebSocketSession:
             # Send DISCONNECT message
             await self._send_disconnect(exit_code)
 
+            # Release session-lifetime scoped services
+            if self.services is not None:
+                self.services.clear_scope()
+
             # Cancel heartbeat task
             if heartbeat_task:
                 heartbeat_task.cancel()
@@ -5,10 +5,7 @@ from typing import TYPE_CHECKING
 from bclib.di.iservice_provider import IServiceProvider
 from bclib.options.app_options import AppOptions
 
-from .http.http_listener import HttpListener
 from .ilistener_factory import IListenerFactory
-from .rabbit.rabbit_listener import RabbitListener
-from .tcp.tcp_listener import TcpListener
 
 if TYPE_CHECKING:
     from .ilistener import IListener
@@ -23,6 +20,9 @@ class ListenerFactory(IListenerFactory):
     - TCP listener (if 'tcp' option exists)
     - RabbitMQ listeners (if 'router.rabbit' option exists)
 
+    Listener modules are imported only for configured listener types, so e.g.
+    a TCP-only application never loads aiohttp or the RabbitMQ client.
+
     Example:
         ```python
         options = {
@@ -80,6 +80,7 @@ class ListenerFactory(IListenerFactory):
 
         # Add HTTP/HTTPS listener(s) if http configured
         if "http" in self.__options:
+            from .http.http_listener import HttpListener
             http_config = self.__options.get('http')
 
             # Normalize to list - only handle array vs single item
@@ -99,6 +100,7 @@ class ListenerFactory(IListenerFactory):
 
         # Add TCP listener(s) if tcp configured
         if "tcp" in self.__options:
+            from .tcp.tcp_listener import TcpListener
             tcp_config = self.__options.get('tcp')
 
             # Normalize to list - only handle array vs single item
@@ -118,6 +120,7 @@ class ListenerFactory(IListenerFactory):
 
         # Add RabbitMQ listener(s) if configured
         if "rabbitmq" in self.__options:
+            from .rabbit.rabbit_listener import RabbitListener
             rabbit_config = self.__options.get('rabbitmq')
 
             # Normalize to list - only handle array vs single item
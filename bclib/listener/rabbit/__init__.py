@@ -1,5 +1,26 @@
-"""Rabbit listener module - RabbitMQ message handling"""
-from bclib.listener.rabbit.rabbit_listener import RabbitListener
-from bclib.listener.rabbit.rabbit_message import RabbitMessage
+"""Rabbit listener module - RabbitMQ message handling
+
+RabbitListener is imported on first access, so the RabbitMQ client library
+is only loaded by applications that listen to a queue.
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from bclib.listener.rabbit.rabbit_listener import RabbitListener
+    from bclib.listener.rabbit.rabbit_message import RabbitMessage
 
 __all__ = ['RabbitListener', 'RabbitMessage']
+
+__lazy_exports = {
+    'RabbitListener': 'bclib.listener.rabbit.rabbit_listener',
+    'RabbitMessage': 'bclib.listener.rabbit.rabbit_message',
+}
+
+
+def __getattr__(name: str):
+    if name in __lazy_exports:
+        value = getattr(import_module(__lazy_exports[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -73,4 +73,26 @@ class RabbitListener(RabbitConnection[T], IListener):
 
     def initialize_task(self) -> asyncio.Future:
         """Initialize listener task on event loop."""
+        self._apply_batch_size(self._message_handler.max_batch_size)
         return self._event_loop.create_task(self.listening_async())
+
+    def _apply_batch_size(self, batch_size: int) -> None:
+        """
+        Raise concurrency and prefetch_count to the largest handler batch size.
+
+        Batch handlers collect concurrently processed messages, so with a lower
+        concurrency a batch could never fill up and every message would wait
+        max_wait_ms.
+
+        Args:
+            batch_size: Largest batch size of the registered handlers (0 if none)
+        """
+        if batch_size <= self._concurrency:
+            return
+        if self._logger:
+            self._logger.warning(
+                f"Rabbit listener concurrency raised from {self._concurrency} to {batch_size} "
+                "for batch handlers")
+        self._concurrency = batch_size
+        if self._prefetch_count is None or self._prefetch_count < batch_size:
+            self._prefetch_count = batch_size
@@ -1,11 +1,14 @@
 """Rabbit Message - Message implementation for RabbitMQ communications"""
-from typing import Any, Optional
-
-from pika import spec
-from pika.adapters.blocking_connection import BlockingChannel
+from typing import TYPE_CHECKING, Any, Optional
 
 from bclib.listener.message import Message
 
+if TYPE_CHECKING:
+    from pika import spec
+    from pika.adapters.blocking_connection import BlockingChannel
+
+    from bclib.connections.rabbit.irabbit_connection import IRabbitConnection
+
 
 class RabbitMessage(Message):
     """
@@ -26,6 +29,11 @@ class RabbitMessage(Message):
         exchange: Exchange name the message was published to
         content_type: Message content type (e.g., 'application/json')
         headers: Message headers dictionary
+        reply_to: Reply queue name for request/reply (RPC) messages
+        correlation_id: Correlation id to echo back in the reply
+        connection: Connection the message was received on (used to publish replies)
+        nacked: True if the message should be rejected instead of acked after dispatch
+        requeue: Whether a nacked message is requeued by the broker
 
     Example:
         ```python
@@ -46,10 +54,11 @@ class RabbitMessage(Message):
         host: str,
         queue: str,
         body: bytes,
-        channel: Optional[BlockingChannel] = None,
-        method: Optional[spec.Basic.Deliver] = None,
-        properties: Optional[spec.BasicProperties] = None,
-        routing_key: Optional[str] = None
+        channel: Optional['BlockingChannel'] = None,
+        method: Optional['spec.Basic.Deliver'] = None,
+        properties: Optional['spec.BasicProperties'] = None,
+        routing_key: Optional[str] = None,
+        connection: Optional['IRabbitConnection'] = None
     ) -> None:
         """
         Initialize RabbitMessage
@@ -62,6 +71,7 @@ class RabbitMessage(Message):
             method: Pika method object containing delivery information
             properties: Pika properties object containing message metadata
             routing_key: Optional routing key for exchange-based routing
+            connection: Optional connection the message was received on
         """
         # RabbitMessage doesn't need session_id or type
         self.host = host
@@ -71,6 +81,7 @@ class RabbitMessage(Message):
         self.method = method
         self.properties = properties
         self.routing_key = routing_key
+        self.connection = connection
 
         # Extract commonly used fields for convenience
         self.delivery_tag = method.delivery_tag if method else None
@@ -78,6 +89,22 @@ class RabbitMessage(Message):
         self.content_type = properties.content_type if properties else None
         self.headers = dict(
             properties.headers) if properties and properties.headers else {}
+        self.reply_to: Optional[str] = getattr(
+            properties, 'reply_to', None) if properties else None
+        self.correlation_id: Optional[str] = getattr(
+            properties, 'correlation_id', None) if properties else None
+        self.nacked = False
+        self.requeue = False
+
+    def nack(self, requeue: bool = False) -> None:
+        """
+        Mark the message to be rejected instead of acked once dispatch completes
+
+        Args:
+            requeue: Whether the broker should requeue the message
+        """
+        self.nacked = True
+        self.requeue = requeue
 
     @property
     def message_text(self) -> str:
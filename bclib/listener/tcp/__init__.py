@@ -1,5 +1,22 @@
 """TCP listener module."""
-from bclib.listener.tcp.tcp_listener import TcpListener
-from bclib.listener.tcp.tcp_message import TcpMessage
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from bclib.listener.tcp.tcp_listener import TcpListener
+    from bclib.listener.tcp.tcp_message import TcpMessage
 
 __all__ = ['TcpListener', 'TcpMessage']
+
+__lazy_exports = {
+    'TcpListener': 'bclib.listener.tcp.tcp_listener',
+    'TcpMessage': 'bclib.listener.tcp.tcp_message',
+}
+
+
+def __getattr__(name: str):
+    if name in __lazy_exports:
+        value = getattr(import_module(__lazy_exports[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -17,6 +17,7 @@ def add_log_service(service_provider: IServiceProvider) -> None:
     Register Log Service in DI Container
 
     Adds LogService as the implementation for ILogService in the service provider.
+    LogService is hosted so buffered log records are flushed on shutdown.
 
     Args:
         service_provider: The service provider to register services with
@@ -37,4 +38,4 @@ def add_log_service(service_provider: IServiceProvider) -> None:
         ```
     """
 
-    service_provider.add_singleton(ILogService, LogService)
+    service_provider.add_singleton(ILogService, LogService, is_hosted=True)
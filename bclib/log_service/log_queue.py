@@ -0,0 +1,139 @@
+"""Bounded background queue for log records"""
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+
+from bclib.log_service.log_object import LogObject
+
+
+class LogQueue:
+    """
+    Bounded queue of log records drained by a fixed set of worker tasks
+
+    Used by LogService and SchemaBaseLogger for background logging, so a burst
+    of records never creates one task per record. When the queue is full the
+    'overflow' policy applies:
+        - block: put returns a task that waits for free space
+        - drop_oldest: the oldest queued record is dropped (default)
+        - drop_new: the new record is dropped
+        - sample: once the queue is half full only every 'sample_rate'-th
+          record is kept; when full, new records are dropped
+
+    Options (the 'logger' section):
+        - queue_size: Max queued records (default: 10000)
+        - workers: Number of worker tasks (default: 4)
+        - overflow: Overflow policy (default: 'drop_oldest')
+        - sample_rate: Keep 1 of N records under pressure (default: 10)
+        - flush_timeout: Seconds to wait for the queue on stop (default: 10)
+    """
+
+    OVERFLOW_POLICIES = ('block', 'drop_oldest', 'drop_new', 'sample')
+
+    def __init__(self,
+                 sink: Callable[[LogObject], Awaitable[Any]],
+                 options: dict,
+                 loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Initialize log queue
+
+        Args:
+            sink: Async function writing one record, called by the workers
+            options: Queue options (see class docstring)
+            loop: Event loop running the worker tasks
+
+        Raises:
+            Exception: If the overflow policy is not supported
+        """
+        self.__sink = sink
+        self.__event_loop = loop
+        self.__overflow: str = options.get('overflow', 'drop_oldest').lower()
+        if self.__overflow not in LogQueue.OVERFLOW_POLICIES:
+            raise Exception(
+                f"Overflow policy '{self.__overflow}' not support for logger")
+        self.__queue_size: int = max(1, int(options.get('queue_size', 10000)))
+        self.__worker_count: int = max(1, int(options.get('workers', 4)))
+        self.__sample_rate: int = max(1, int(options.get('sample_rate', 10)))
+        self.__flush_timeout: float = float(options.get('flush_timeout', 10))
+        self.__queue: Optional['asyncio.Queue[LogObject]'] = None
+        self.__workers: Optional[list[asyncio.Task]] = None
+        self.__sample_counter = 0
+
+        self.enqueued_count = 0
+        self.dropped_count = 0
+        self.flushed_count = 0
+
+    def put(self, log_object: LogObject) -> asyncio.Future:
+        """
+        Queue a record, applying the overflow policy when the queue is full
+
+        Args:
+            log_object: Record to write in background
+
+        Returns:
+            asyncio.Future: Resolved with True if the record was queued or
+            False if it was dropped
+        """
+        result = self.__event_loop.create_future()
+        queue = self.__get_queue()
+        if self.__overflow == 'sample' and queue.qsize() * 2 >= self.__queue_size:
+            self.__sample_counter += 1
+            if self.__sample_counter % self.__sample_rate != 0:
+                self.dropped_count += 1
+                result.set_result(False)
+                return result
+        if queue.full():
+            if self.__overflow == 'block':
+                return self.__event_loop.create_task(self.__put_async(log_object))
+            if self.__overflow == 'drop_oldest':
+                queue.get_nowait()
+                queue.task_done()
+            self.dropped_count += 1
+            if self.__overflow != 'drop_oldest':
+                result.set_result(False)
+                return result
+        queue.put_nowait(log_object)
+        self.enqueued_count += 1
+        result.set_result(True)
+        return result
+
+    async def stop_async(self) -> None:
+        """Wait for queued records (up to flush_timeout), then stop the workers"""
+        if self.__queue is None:
+            return
+        queue, workers = self.__queue, self.__workers
+        self.__queue = self.__workers = None
+        try:
+            await asyncio.wait_for(queue.join(), self.__flush_timeout)
+        except asyncio.TimeoutError:
+            print(
+                f"Log queue not drained in {self.__flush_timeout}s, {queue.qsize()} record(s) lost")
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    def __get_queue(self) -> 'asyncio.Queue[LogObject]':
+        """Get the queue, starting the worker tasks on first use"""
+        if self.__queue is None:
+            self.__queue = asyncio.Queue(self.__queue_size)
+            self.__workers = [
+                self.__event_loop.create_task(self.__worker_async(self.__queue))
+                for _ in range(self.__worker_count)
+            ]
+        return self.__queue
+
+    async def __put_async(self, log_object: LogObject) -> bool:
+        """Wait for free space in the queue ('block' policy)"""
+        await self.__get_queue().put(log_object)
+        self.enqueued_count += 1
+        return True
+
+    async def __worker_async(self, queue: 'asyncio.Queue[LogObject]') -> None:
+        """Hand queued records to the sink until cancelled"""
+        while True:
+            log_object = await queue.get()
+            try:
+                await self.__sink(log_object)
+            except Exception as ex:
+                print(f"Error in background logging: {repr(ex)}")
+            finally:
+                self.flushed_count += 1
+                queue.task_done()
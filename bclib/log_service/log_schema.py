@@ -1,4 +1,17 @@
-from typing import Any, Dict, List, Tuple
+import ast
+import builtins
+from types import CodeType
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# Builtins available to source expressions
+_SOURCE_BUILTINS = {
+    name: getattr(builtins, name)
+    for name in ('abs', 'all', 'any', 'bool', 'dict', 'enumerate', 'float', 'int',
+                 'isinstance', 'len', 'list', 'max', 'min', 'range', 'round', 'set',
+                 'sorted', 'str', 'sum', 'tuple', 'zip')
+}
+# str methods whose format fields can reach attributes of their arguments
+_FORMAT_METHODS = ('format', 'format_map')
 
 
 class LogSchema:
@@ -15,6 +28,14 @@ class LogSchema:
         - Support for multi-part and multi-value properties
         - Dynamic value calculation via source expressions
 
+    Source expressions are parsed and compiled once when the schema loads;
+    expressions that name dunder names or attributes, call str.format or
+    format_map, or contain format fields with dunders are rejected, and the
+    rest are evaluated with an allow-list of builtins only. Each
+    property is turned into a prebuilt template, so formatting a record is a
+    loop over those templates. Properties that fail to format are skipped and
+    counted in `error_count`.
+
     Attributes:
         schema_name (str): Schema name
         schema_version: Schema version
@@ -24,6 +45,8 @@ class LogSchema:
         properties (Dict[str, Tuple]): Property definitions mapping
             - Key: Property title
             - Value: (prpId, multi, parts_count, TypeID, source)
+        error_count (int): Number of properties that failed to format
+        last_error (Exception): Most recent formatting error
 
     Example:
         ```python
@@ -67,13 +90,65 @@ class LogSchema:
             ]
         )
 
+        self.error_count: int = 0
+        self.last_error: Optional[Exception] = None
+        self.__header = {
+            "schemaName": self.schema_name,
+            "paramUrl": self.paramUrl,
+            "schemaVersion": self.schema_version,
+            "lid": self.lid,
+            "schemaId": self.schemaId,
+        }
+        # (title, prpId, TypeID, values limit, parts_count, compiled source)
+        self.__templates: List[Tuple[str, int, int, Optional[int], int, Union[CodeType, Exception, None]]] = [
+            (
+                title,
+                prp_id,
+                typeid,
+                None if multi else 1,
+                parts_count,
+                self.__compile_source(title, source) if source is not None else None
+            )
+            for title, (prp_id, multi, parts_count, typeid, source) in self.properties.items()
+        ]
+
+    def __compile_source(self, title: str, source: str) -> Union[CodeType, Exception]:
+        """
+        Compile a property source expression once
+
+        Args:
+            title: Property title (used in the code object file name)
+            source: Python expression evaluated against the log properties
+
+        Returns:
+            Compiled code object, or the error if the expression is invalid,
+            names dunder names/attributes or uses str formatting to reach them
+        """
+        try:
+            tree = ast.parse(source.strip(), mode="eval")
+            for node in ast.walk(tree):
+                name = node.id if isinstance(node, ast.Name) else \
+                    node.attr if isinstance(node, ast.Attribute) else None
+                if name is not None and name.startswith("__") or \
+                        isinstance(node, ast.Attribute) and name in _FORMAT_METHODS:
+                    raise ValueError(
+                        f"'{name}' not allowed in source of '{title}'")
+                # Format fields like "{0.__class__}" reach attributes at runtime
+                if isinstance(node, ast.Constant) and isinstance(node.value, str) and \
+                        "{" in node.value and "__" in node.value:
+                    raise ValueError(
+                        f"Format field with dunder not allowed in source of '{title}'")
+            return compile(tree, f"<log schema {self.schema_name}.{title}>", "eval")
+        except Exception as ex:
+            return ex
+
     def get_answer(self, params: Dict[str, List[List]]):
         """
         Convert log properties to schema-formatted answer
 
-        Processes raw log properties according to schema definitions,
-        handling multi-value properties, multi-part answers, and
-        dynamic source expressions.
+        Processes raw log properties according to the prebuilt property
+        templates, handling multi-value properties, multi-part answers, and
+        compiled source expressions.
 
         Args:
             params: Dictionary of property names to nested value lists
@@ -91,67 +166,33 @@ class LogSchema:
             - Properties with source expressions are evaluated dynamically
             - Multi-value properties controlled by 'multi' flag
             - Parts are limited by 'parts_count'
-            - Missing or error properties are silently skipped
+            - Missing properties are skipped; properties that fail to format
+              are skipped and counted in error_count
         """
         properties = list()
-        for key, (id, multi, parts_count, typeid, source) in self.properties.items():
+        for title, prp_id, typeid, values_limit, parts_count, code in self.__templates:
             try:
-                if source is not None:
-                    value = eval(source, {}, params)
-                    properties.append({
-                        "prpId": id,
-                        "TypeID": typeid,
-                        "answers": [
-                            {
-                                "parts": [
-                                    {
-                                        "part": 1,
-                                        "values": [
-                                            {
-                                                "value": value
-                                            }
-                                        ]
-                                    }
-                                ]
-                            }
-                        ]
-                    })
+                if code is not None:
+                    if isinstance(code, Exception):
+                        raise code
+                    answers = [{"parts": [{"part": 1, "values": [
+                        {"value": eval(code, {"__builtins__": _SOURCE_BUILTINS}, params)}]}]}]
+                elif title in params:
+                    answers = [
+                        {"parts": [
+                            {"part": index, "values": [{"value": part_val}]}
+                            for index, part_val in enumerate(parts_val[:parts_count], 1)
+                        ]}
+                        for parts_val in params[title][:values_limit]
+                    ]
                 else:
-                    if key in params:
-                        values = params[key]
-                        if not multi:
-                            values = values[:1]
-                        prp_answers = list()
-                        for parts_val in values:
-                            answer_parts = list()
-                            part_index = 1
-                            parts_val = parts_val[:parts_count]
-                            for part_val in parts_val:
-                                answer_parts.append({
-                                    "part": part_index,
-                                    "values": [
-                                        {
-                                            "value": part_val
-                                        }
-                                    ]
-                                })
-                                part_index += 1
-                            prp_answers.append({
-                                "parts": answer_parts
-                            })
-                        properties.append({
-                            "prpId": id,
-                            "TypeID": typeid,
-                            "answers": prp_answers
-                        })
-
-            except:
-                pass
-        return {
-            "schemaName": self.schema_name,
-            "paramUrl": self.paramUrl,
-            "schemaVersion": self.schema_version,
-            "lid": self.lid,
-            "schemaId": self.schemaId,
-            "properties": properties
-        }
+                    continue
+                properties.append({
+                    "prpId": prp_id,
+                    "TypeID": typeid,
+                    "answers": answers
+                })
+            except Exception as ex:
+                self.error_count += 1
+                self.last_error = ex
+        return {**self.__header, "properties": properties}
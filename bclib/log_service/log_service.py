@@ -2,15 +2,18 @@
 import asyncio
 from typing import Coroutine, Optional
 
+from bclib.di.ihosted_service import IHostedService
 from bclib.log_service.ilog_service import ILogService
 from bclib.log_service.log_object import LogObject
+from bclib.log_service.log_queue import LogQueue
 from bclib.log_service.rabbit_schema_base_logger import RabbitSchemaBaseLogger
 from bclib.log_service.restful_schema_base_logger import \
     RESTfulSchemaBaseLogger
+from bclib.log_service.schema_base_logger import SchemaBaseLogger
 from bclib.options.app_options import AppOptions
 
 
-class LogService(ILogService):
+class LogService(ILogService, IHostedService):
     """
     Logging service implementation
 
@@ -23,6 +26,14 @@ class LogService(ILogService):
         - schema.rabbit: RabbitMQ-based logging
         - None: No logging (logger disabled)
 
+    Background logging goes through a bounded LogQueue drained by a fixed set
+    of worker tasks (see LogQueue for the 'overflow' policies and the queue
+    options of the 'logger' section). Schema loggers created by the service
+    use the same queue for their own log_in_background.
+
+    Registered as a hosted service so queued and buffered log records are
+    flushed on shutdown (stop_hosted_services_async).
+
     Example:
         ```python
         @app.restful_handler(app.url("api/process"))
@@ -36,6 +47,8 @@ class LogService(ILogService):
         ```
     """
 
+    OVERFLOW_POLICIES = LogQueue.OVERFLOW_POLICIES
+
     def __init__(self, options: AppOptions, loop: asyncio.AbstractEventLoop):
         """
         Initialize log service
@@ -45,18 +58,24 @@ class LogService(ILogService):
             loop: The asyncio event loop for async operations
         """
         # Create logger based on configuration (integrated factory logic)
-        self.__logger: ILogService = self.__create_logger(options)
+        self.__logger: ILogService = self.__create_logger(options, loop)
         self.__log_error: bool = options.get('log_error', False)
         self.__log_request: bool = options.get('log_request', True)
         self.__event_loop = loop
 
+        self.__queue = LogQueue(self.__log_queued_async,
+                                options.get('logger') or {}, loop)
+        if isinstance(self.__logger, SchemaBaseLogger):
+            self.__logger.use_background_queue(self.__queue)
+
     @staticmethod
-    def __create_logger(options: AppOptions) -> ILogService:
+    def __create_logger(options: AppOptions, loop: asyncio.AbstractEventLoop) -> ILogService:
         """
         Create a logger instance based on configuration (factory method)
 
         Args:
             options: Application configuration (AppOptions type alias for dict)
+            loop: The asyncio event loop for loggers with their own connection
 
         Returns:
             ILogService: Configured logger instance
@@ -76,7 +95,7 @@ class LogService(ILogService):
                 if logger_type == 'schema.restful':
                     logger = RESTfulSchemaBaseLogger(logger_option)
                 elif logger_type == "schema.rabbit":
-                    logger = RabbitSchemaBaseLogger(logger_option)
+                    logger = RabbitSchemaBaseLogger(logger_option, loop)
                 else:
                     raise Exception(
                         f"Type '{logger_type}' not support for logger")
@@ -93,6 +112,32 @@ class LogService(ILogService):
         """Get log request setting"""
         return self.__log_request
 
+    @property
+    def enqueued_count(self) -> int:
+        """Get number of records accepted into the background queue"""
+        return self.__queue.enqueued_count
+
+    @property
+    def dropped_count(self) -> int:
+        """Get number of records dropped by the overflow policy"""
+        return self.__queue.dropped_count
+
+    @property
+    def flushed_count(self) -> int:
+        """Get number of queued records handed to the logger"""
+        return self.__queue.flushed_count
+
+    async def start_async(self) -> None:
+        """Preload configured log schemas on startup"""
+        if isinstance(self.__logger, SchemaBaseLogger):
+            await self.__logger.start_async()
+
+    async def stop_async(self) -> None:
+        """Drain the background queue, then flush and close the logger on shutdown"""
+        await self.__queue.stop_async()
+        if isinstance(self.__logger, SchemaBaseLogger):
+            await self.__logger.close_async()
+
     def new_object_log(self, schema_name: str, routing_key: Optional[str] = None, **kwargs) -> LogObject:
         """
         Create a new log object
@@ -133,16 +178,28 @@ class LogService(ILogService):
         """
         Log in background process
 
+        The record is put on the bounded background queue; see LogQueue for
+        the overflow policies.
+
         Args:
             log_object: Pre-created log object. If None, creates from kwargs
             **kwargs: Log parameters
 
         Returns:
-            Coroutine: Task for background logging
+            Coroutine: Future resolved with True if the record was queued or
+            False if it was dropped
         """
         if self.__logger is None:
-            import asyncio
-            return self.__event_loop.create_task(asyncio.sleep(0))
-        return self.__event_loop.create_task(
-            self.log_async(log_object, **kwargs)
-        )
+            result = self.__event_loop.create_future()
+            result.set_result(False)
+            return result
+        if log_object is None:
+            if "schema_name" not in kwargs:
+                raise Exception("'schema_name' not set for apply logging!")
+            schema_name = kwargs.pop("schema_name")
+            log_object = self.new_object_log(schema_name, **kwargs)
+        return self.__queue.put(log_object)
+
+    async def __log_queued_async(self, log_object: LogObject) -> None:
+        """Write a record taken from the background queue"""
+        await self.__logger.log_async(log_object)
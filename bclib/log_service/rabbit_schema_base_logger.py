@@ -1,5 +1,4 @@
 import asyncio
-import json
 from typing import Optional
 
 from bclib.log_service.schema_base_logger import SchemaBaseLogger
@@ -22,7 +21,9 @@ class RabbitSchemaBaseLogger(SchemaBaseLogger):
         - Direct queue publishing
         - Exchange-based routing with routing keys
         - Queue declaration with configurable options
-        - Async execution via thread pool
+        - One long-lived aio_pika connection (RabbitConnection) for all records
+        - Records buffered in memory and published in batches by size or interval
+        - Buffer flushed on shutdown (close_async)
 
     Example:
         ```python
@@ -32,7 +33,9 @@ class RabbitSchemaBaseLogger(SchemaBaseLogger):
                 'url': 'amqp://localhost',
                 'exchange': 'logs',
                 'durable': True
-            }
+            },
+            'batch_size': 200,
+            'flush_interval': 0.5
         }
         logger = RabbitSchemaBaseLogger(options)
 
@@ -41,12 +44,14 @@ class RabbitSchemaBaseLogger(SchemaBaseLogger):
         ```
     """
 
-    def __init__(self, options: dict) -> None:
+    def __init__(self, options: dict, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
         """
         Initialize RabbitMQ schema logger
 
         Args:
             options: Logger configuration dictionary containing:
+                - batch_size, buffer_size, flush_interval: (optional) buffering
+                  settings, see SchemaBaseLogger
                 - connection:
                     - url: RabbitMQ connection URL
                     - queue: Queue name (for direct publishing)
@@ -55,6 +60,8 @@ class RabbitSchemaBaseLogger(SchemaBaseLogger):
                     - durable: (optional) Durable queue
                     - exclusive: (optional) Exclusive queue
                     - auto_delete: (optional) Auto-delete queue
+                    - any other RabbitConnection option (e.g. publish_channels)
+            loop: Optional event loop passed to the underlying RabbitConnection
 
         Raises:
             Exception: If connection configuration is missing or invalid
@@ -73,13 +80,21 @@ class RabbitSchemaBaseLogger(SchemaBaseLogger):
             raise Exception(
                 "'exchange' or 'queue' must be set in connection option")
 
+        connection_options = dict(self.__connection_options)
+        if "exchange" in connection_options:
+            # Log exchange is owned by the log consumer, only check that it exists
+            connection_options.setdefault("passive", True)
+        from bclib.connections.rabbit.rabbit_connection import \
+            RabbitConnection
+        self.__connection = RabbitConnection(connection_options, loop, None)
+
     async def _save_schema_async(self, schema: dict, routing_key: Optional[str] = None):
         """
-        Save schema data to RabbitMQ
+        Buffer schema data for publishing to RabbitMQ
 
-        Publishes formatted schema to RabbitMQ using either direct queue
-        or exchange-based routing. Runs in a thread pool to avoid blocking
-        the async event loop.
+        Records are published in batches over a long-lived connection, either when
+        batch_size records are buffered or every flush_interval seconds. If the
+        buffer is full the caller waits until pending records are published.
 
         Args:
             schema: Formatted schema data to publish
@@ -87,44 +102,27 @@ class RabbitSchemaBaseLogger(SchemaBaseLogger):
 
         Raises:
             Exception: If routing_key is provided for direct queue publishing
-            pika exceptions: If RabbitMQ connection or publishing fails
-
-        Note:
-            Uses blocking pika client in thread pool executor for compatibility
-            with asyncio.
         """
         if routing_key is not None and "queue" in self.__connection_options:
             raise Exception(
                 "'routing key' is not acceptable when 'queue' is in options")
 
-        def send_to_rabbit():
-            import pika
-            connection = pika.BlockingConnection(
-                pika.URLParameters(
-                    self.__connection_options["url"]
-                )
-            )
-            channel = connection.channel()
-            queue = self.__connection_options.get("queue")
-            if queue is not None:
-                channel.queue_declare(
-                    queue=queue,
-                    passive=self.__connection_options.get("passive", False),
-                    durable=self.__connection_options.get("durable", False),
-                    exclusive=self.__connection_options.get(
-                        "exclusive", False),
-                    auto_delete=self.__connection_options.get(
-                        "auto_delete", False)
-                )
-            channel.basic_publish(
-                exchange=self.__connection_options.get("exchange", ""),
-                routing_key=routing_key or queue or "",
-                body=json.dumps(schema, ensure_ascii=False),
-                properties=pika.BasicProperties(
-                    content_type="application/json",
-                    content_encoding="utf-8"
-                )
-            )
-        loop = asyncio.get_running_loop()
-        future = loop.run_in_executor(None, send_to_rabbit)
-        await future
+        await self._enqueue_schema_async(schema, routing_key)
+
+    async def _save_schema_batch_async(self, records: list[tuple[dict, Optional[str]]]):
+        """
+        Publish a batch of schema data, grouped by routing key
+
+        Args:
+            records: List of (schema, routing_key) tuples in arrival order
+        """
+        groups: dict[Optional[str], list[dict]] = {}
+        for schema, routing_key in records:
+            groups.setdefault(routing_key, []).append(schema)
+        for routing_key, schemas in groups.items():
+            await self.__connection.publish_many_async(schemas, routing_key)
+
+    async def close_async(self) -> None:
+        """Publish buffered records and close the connection"""
+        await super().close_async()
+        await self.__connection.close_async()
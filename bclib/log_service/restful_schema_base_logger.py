@@ -1,3 +1,5 @@
+from typing import Optional
+
 from bclib.log_service.schema_base_logger import SchemaBaseLogger
 
 
@@ -13,12 +15,20 @@ class RESTfulSchemaBaseLogger(SchemaBaseLogger):
             - 'url': Direct POST endpoint URL
             - 'post_url': POST endpoint URL
             - 'get_url' or 'url': Schema API URL (inherited from SchemaBaseLogger)
+        optional:
+            - 'bulk': Buffer answers and POST them as one array per batch,
+              for log APIs that accept {"schemas": [...]} (default: False)
+            - 'batch_size', 'buffer_size', 'flush_interval': buffering settings
+              used in bulk mode (see SchemaBaseLogger)
+
+    Requests share the pooled, keep-alive session of SchemaBaseLogger.
 
     Example:
         ```python
         options = {
             'url': 'http://api.example.com/schema',
-            'post_url': 'http://api.example.com/logs'
+            'post_url': 'http://api.example.com/logs',
+            'bulk': True
         }
         logger = RESTfulSchemaBaseLogger(options)
 
@@ -35,6 +45,7 @@ class RESTfulSchemaBaseLogger(SchemaBaseLogger):
             options: Logger configuration dictionary containing:
                 - url or post_url: POST endpoint for log submission
                 - get_url or url: Schema API endpoint (for parent class)
+                - bulk: (optional) POST answers in batches
 
         Raises:
             Exception: If neither 'url' nor 'post_url' is configured
@@ -47,12 +58,14 @@ class RESTfulSchemaBaseLogger(SchemaBaseLogger):
         else:
             raise Exception(
                 "url part of schema logger not set. set 'url' or 'post_url'")
+        self.__bulk: bool = bool(options.get("bulk", False))
 
     async def _save_schema_async(self, schema: dict, routing_key: str = None):
         """
         Save schema data via HTTP POST
 
-        Sends formatted schema data to the configured REST API endpoint.
+        Sends formatted schema data to the configured REST API endpoint,
+        or buffers it for a bulk POST when 'bulk' is enabled.
 
         Args:
             schema: Formatted schema data to send
@@ -62,9 +75,23 @@ class RESTfulSchemaBaseLogger(SchemaBaseLogger):
             Exception: If HTTP response status is not 200
             aiohttp exceptions: If network request fails
         """
-        import aiohttp
-        async with aiohttp.ClientSession() as session:
-            async with session.post(self.__post_url, json={"schema": schema}) as response:
-                if response.status != 200:
-                    raise Exception(
-                        f"Error in send answer schema to server.(status code ={response.status}) :{await response.text()}")
+        if self.__bulk:
+            await self._enqueue_schema_async(schema)
+        else:
+            await self.__post_async({"schema": schema})
+
+    async def _save_schema_batch_async(self, records: list[tuple[dict, Optional[str]]]):
+        """
+        Save a batch of schema data with one HTTP POST
+
+        Args:
+            records: List of (schema, routing_key) tuples in arrival order
+        """
+        await self.__post_async({"schemas": [schema for schema, _ in records]})
+
+    async def __post_async(self, body: dict):
+        """POST body to the log API and check the response status"""
+        async with self._get_session().post(self.__post_url, json=body) as response:
+            if response.status != 200:
+                raise Exception(
+                    f"Error in send answer schema to server.(status code ={response.status}) :{await response.text()}")
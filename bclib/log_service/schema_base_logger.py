@@ -1,11 +1,17 @@
+import asyncio
+import time
 from abc import abstractmethod
-from typing import Coroutine, Optional
+from typing import TYPE_CHECKING, Coroutine, Optional
 from urllib.parse import urljoin
 
 from bclib.log_service.ilog_service import ILogService
 from bclib.log_service.log_object import LogObject
+from bclib.log_service.log_queue import LogQueue
 from bclib.log_service.log_schema import LogSchema
 
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+
 
 class SchemaBaseLogger(ILogService):
     """
@@ -19,14 +25,35 @@ class SchemaBaseLogger(ILogService):
 
     Features:
         - Automatic schema loading from configured URL
-        - Schema caching to reduce API calls
+        - Schema caching with single-flight loading (one fetch per name at a time)
+        - Optional preloading, TTL refresh in background and negative caching
         - Conversion of LogObject to schema format
         - Error handling with logging
+        - One pooled, keep-alive HTTP session shared by all requests
+        - Optional record buffering with batch flush by size or interval
+        - Background logging through a bounded LogQueue
 
     Configuration:
         options must contain either:
             - 'url': Direct schema API URL
             - 'get_url': Schema API base URL
+        optional:
+            - 'timeout': HTTP request timeout in seconds (default: 30)
+            - 'connection_limit': Max pooled HTTP connections (default: 100)
+            - 'batch_size': Records per batch when buffering (default: 100)
+            - 'buffer_size': Max buffered records; when full, callers wait
+              for a flush (default: 10000)
+            - 'flush_interval': Seconds between periodic flushes (default: 1)
+            - 'preload': Schema names loaded at startup (start_async)
+            - 'schema_ttl': Seconds after which a cached schema is refreshed in
+              background; the cached version is served until the new one is
+              loaded (default: never refresh)
+            - 'negative_ttl': Seconds an unknown schema name is remembered
+              before it is fetched again (default: 60)
+
+    Buffering:
+        Subclasses that call `_enqueue_schema_async` from `_save_schema_async`
+        get buffered records handed to `_save_schema_batch_async` in batches.
 
     Example:
         ```python
@@ -58,7 +85,55 @@ class SchemaBaseLogger(ILogService):
         else:
             raise Exception(
                 "url part of schema logger not set. set 'url' or 'get_url'")
-        self.__schemas: 'dict[str,dict]' = dict()
+        # name -> (schema, loaded at), unknown name -> (error, failed at)
+        self.__schemas: 'dict[str, tuple[LogSchema, float]]' = dict()
+        self.__unknown_schemas: 'dict[str, tuple[Exception, float]]' = dict()
+        self.__schema_loads: 'dict[str, asyncio.Task]' = dict()
+        self.__preload: list[str] = list(options.get("preload", []))
+        schema_ttl = options.get("schema_ttl")
+        self.__schema_ttl: Optional[float] = float(
+            schema_ttl) if schema_ttl is not None else None
+        self.__negative_ttl: float = float(options.get("negative_ttl", 60))
+        self.__timeout: float = float(options.get("timeout", 30))
+        self.__connection_limit: int = int(
+            options.get("connection_limit", 100))
+        self.__session: Optional['ClientSession'] = None
+
+        self.__batch_size: int = max(1, int(options.get("batch_size", 100)))
+        self.__buffer_size: int = max(
+            self.__batch_size, int(options.get("buffer_size", 10000)))
+        self.__flush_interval: float = float(options.get("flush_interval", 1))
+        self.__buffer: list[tuple[dict, Optional[str]]] = []
+        self.__flush_lock: Optional[asyncio.Lock] = None
+        self.__flush_task: Optional[asyncio.Task] = None
+        self.__timer_task: Optional[asyncio.Task] = None
+        # Queue of log_in_background; LogService shares its own, else created on first use
+        self.__background_queue: Optional[LogQueue] = None
+        self.__owns_background_queue = False
+
+    def use_background_queue(self, queue: LogQueue) -> None:
+        """
+        Send log_in_background records to a queue owned by the caller (e.g. LogService)
+
+        Args:
+            queue: Background queue whose workers write the records
+        """
+        self.__background_queue = queue
+        self.__owns_background_queue = False
+
+    def _get_session(self) -> 'ClientSession':
+        """
+        Get the pooled HTTP session (created on first use)
+
+        Returns:
+            ClientSession: Long-lived session with keep-alive connections
+        """
+        if self.__session is None or self.__session.closed:
+            import aiohttp
+            self.__session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.__timeout),
+                connector=aiohttp.TCPConnector(limit=self.__connection_limit))
+        return self.__session
 
     async def __load_schema_async(self, schema_name: str) -> LogSchema:
         """
@@ -72,14 +147,33 @@ class SchemaBaseLogger(ILogService):
 
         Raises:
             aiohttp exceptions: If API request fails
-            KeyError: If schema response format is invalid
+            KeyError: If schema is unknown (404 or no schema in response)
         """
-        import aiohttp
-        async with aiohttp.ClientSession() as session:
-            url = urljoin(self.__get_url+"/", schema_name)
-            async with session.get(url) as response:
-                schema_source = await response.json()
-                return LogSchema(schema_source["sources"][0]["data"][0])
+        url = urljoin(self.__get_url+"/", schema_name)
+        async with self._get_session().get(url) as response:
+            if response.status == 404:
+                raise KeyError(f"Log schema '{schema_name}' not found")
+            schema_source = await response.json()
+        try:
+            schema_data = schema_source["sources"][0]["data"][0]
+        except (KeyError, IndexError, TypeError):
+            raise KeyError(f"Log schema '{schema_name}' not found")
+        return LogSchema(schema_data)
+
+    async def start_async(self) -> None:
+        """
+        Preload configured schemas (called on startup)
+
+        Schemas that fail to load are reported and loaded again on first use.
+        """
+        if not self.__preload:
+            return
+        results = await asyncio.gather(
+            *(self.__get_dict_async(name) for name in self.__preload),
+            return_exceptions=True)
+        for name, result in zip(self.__preload, results):
+            if isinstance(result, Exception):
+                print(f"Error in preload log schema '{name}': {repr(result)}")
 
     @abstractmethod
     async def _save_schema_async(self, schema: dict, routing_key: str = None):
@@ -95,7 +189,84 @@ class SchemaBaseLogger(ILogService):
             data is persisted (e.g., POST to API, send to queue)
         """
 
-    async def __get_dict_async(self, schema_name: int) -> LogSchema:
+    async def _save_schema_batch_async(self, records: 'list[tuple[dict, Optional[str]]]'):
+        """
+        Save a batch of buffered schema data
+
+        Args:
+            records: List of (schema, routing_key) tuples in arrival order
+
+        Note:
+            Default implementation saves records one by one; subclasses
+            that buffer records override this with a bulk operation.
+        """
+        for schema, routing_key in records:
+            await self._save_schema_async(schema, routing_key)
+
+    async def _enqueue_schema_async(self, schema: dict, routing_key: Optional[str] = None) -> None:
+        """
+        Buffer schema data for batched saving
+
+        Records are handed to `_save_schema_batch_async` when batch_size records
+        are buffered or every flush_interval seconds. If the buffer is full the
+        caller waits until pending records are saved.
+
+        Args:
+            schema: Formatted schema data
+            routing_key: Optional routing key for message-based loggers
+        """
+        if len(self.__buffer) >= self.__buffer_size:
+            await self.flush_async()
+        self.__buffer.append((schema, routing_key))
+
+        if self.__timer_task is None:
+            self.__timer_task = asyncio.get_running_loop().create_task(
+                self.__flush_periodically_async())
+        if len(self.__buffer) >= self.__batch_size and \
+                (self.__flush_task is None or self.__flush_task.done()):
+            self.__flush_task = asyncio.get_running_loop().create_task(
+                self.flush_async())
+
+    async def flush_async(self) -> None:
+        """
+        Save all buffered records, batch_size at a time
+
+        A batch that fails to save is reported and dropped.
+        """
+        if self.__flush_lock is None:
+            self.__flush_lock = asyncio.Lock()
+        async with self.__flush_lock:
+            while self.__buffer:
+                batch = self.__buffer[:self.__batch_size]
+                del self.__buffer[:self.__batch_size]
+                try:
+                    await self._save_schema_batch_async(batch)
+                except Exception as ex:
+                    print(
+                        f"Error in save {len(batch)} log(s) with schema logger: {repr(ex)}")
+
+    async def close_async(self) -> None:
+        """
+        Flush buffered records and release resources (called on shutdown)
+        """
+        if self.__owns_background_queue:
+            await self.__background_queue.stop_async()
+        if self.__timer_task is not None:
+            self.__timer_task.cancel()
+            self.__timer_task = None
+        await self.flush_async()
+        if self.__session is not None and not self.__session.closed:
+            await self.__session.close()
+        self.__session = None
+
+    async def __flush_periodically_async(self) -> None:
+        """Flush buffered records every flush_interval seconds"""
+        while True:
+            await asyncio.sleep(self.__flush_interval)
+            if self.__buffer:
+                await self.flush_async()
+
+    async def __get_dict_async(self, schema_name: str) -> LogSchema:
         """
         Get schema with caching
 
@@ -105,13 +276,57 @@ class SchemaBaseLogger(ILogService):
         Returns:
             LogSchema: Cached or newly loaded schema
 
+        Raises:
+            KeyError: If the schema is unknown (also while negatively cached)
+
         Note:
-            Schemas are cached after first load to reduce API calls
+            Concurrent callers share one fetch per schema name. A cached schema
+            older than schema_ttl is refreshed in background and swapped in
+            when loaded; callers keep getting the cached version meanwhile.
         """
-        if schema_name not in self.__schemas:
+        now = time.monotonic()
+        cached = self.__schemas.get(schema_name)
+        if cached is not None:
+            schema, loaded_at = cached
+            if self.__schema_ttl is not None and now - loaded_at >= self.__schema_ttl and \
+                    schema_name not in self.__schema_loads:
+                self.__start_schema_load(schema_name)
+            return schema
+        unknown = self.__unknown_schemas.get(schema_name)
+        if unknown is not None:
+            if now - unknown[1] < self.__negative_ttl:
+                raise unknown[0]
+            del self.__unknown_schemas[schema_name]
+        load = self.__schema_loads.get(schema_name)
+        if load is None:
+            load = self.__start_schema_load(schema_name)
+        return await asyncio.shield(load)
+
+    def __start_schema_load(self, schema_name: str) -> asyncio.Task:
+        """Start the single shared load task for a schema name"""
+        load = asyncio.get_running_loop().create_task(
+            self.__load_and_cache_schema_async(schema_name))
+        # Background refreshes may have no awaiting caller
+        load.add_done_callback(lambda task: task.cancelled() or task.exception())
+        self.__schema_loads[schema_name] = load
+        return load
+
+    async def __load_and_cache_schema_async(self, schema_name: str) -> LogSchema:
+        """Load a schema and update the (negative) cache"""
+        try:
             schema = await self.__load_schema_async(schema_name)
-            self.__schemas[schema_name] = schema
-        return self.__schemas[schema_name]
+        except Exception as ex:
+            cached = self.__schemas.get(schema_name)
+            if cached is not None:
+                # Keep serving the current version, retry after schema_ttl
+                self.__schemas[schema_name] = (cached[0], time.monotonic())
+            elif isinstance(ex, KeyError):
+                self.__unknown_schemas[schema_name] = (ex, time.monotonic())
+            raise
+        finally:
+            self.__schema_loads.pop(schema_name, None)
+        self.__schemas[schema_name] = (schema, time.monotonic())
+        return schema
 
     def new_object_log(self, schema_name: str, routing_key: Optional[str] = None, **kwargs) -> LogObject:
         """
@@ -183,8 +398,16 @@ class SchemaBaseLogger(ILogService):
             **kwargs: Log parameters
 
         Returns:
-            Coroutine: Task for background logging
+            Coroutine: Future resolved with True if the record was queued or
+            False if it was dropped (see LogQueue)
         """
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return loop.create_task(self.log_async(log_object, **kwargs))
+        if log_object is None:
+            if "schema_name" not in kwargs:
+                raise Exception("'schema_name' not set for apply logging!")
+            schema_name = kwargs.pop("schema_name")
+            log_object = self.new_object_log(schema_name, **kwargs)
+        if self.__background_queue is None:
+            self.__background_queue = LogQueue(
+                self.log_async, self.options, asyncio.get_running_loop())
+            self.__owns_background_queue = True
+        return self.__background_queue.put(log_object)
@@ -1,5 +1,7 @@
 from typing import Any
 from bclib.parser.html.html_parser_ex import HtmlParserEx
+from bclib.parser.html.source_command_cache import (ParsedSourceCommand,
+                                                    SourceCommandCache)
 from bclib.parser.answer import Answer, UserActionTypes, UserAction
 
 
@@ -5,7 +5,7 @@ from bclib.parser.answer.enriched_data import EnrichedData
 from bclib.parser.answer.storage_data import StorageData
 from bclib.parser.answer.question_data import QuestionData
 from bclib import parser
-from bclib.db_manager import RESTfulConnection
+from bclib.db_manager import RESTfulConnection, RESTfulSessionPool
 from bclib.parser.answer.validators import Validator
 from bclib.utility import DictEx
 from ..answer.user_action_types import UserActionTypes
@@ -16,11 +16,12 @@ class Answer:
     """BasisJsonParser is a tool to parse basis_core components json objects. This tool is developed based on
              basis_core key and values."""
 
-    def __init__(self, data: 'str|Any', api_url: 'str' = None, check_validation:"bool"= False):
+    def __init__(self, data: 'str|Any', api_url: 'str' = None, check_validation:"bool"= False,
+                 session_pool: 'RESTfulSessionPool' = None):
         self.json = json.loads(data) if isinstance(data, str) else data
         self.__answer_list: 'list[UserAction]' = None
         self.__api_connection = RESTfulConnection(
-            api_url) if api_url else None
+            api_url, session_pool) if api_url else None
         self.check_validation = check_validation 
 
     async def __fill_answer_list_async(self):
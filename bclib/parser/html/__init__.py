@@ -1 +1,3 @@
 from bclib.parser.html.html_parser_ex import HtmlParserEx
+from bclib.parser.html.source_command_cache import (ParsedSourceCommand,
+                                                    SourceCommandCache)
@@ -0,0 +1,99 @@
+"""LRU cache of parsed dbsource commands"""
+from collections import OrderedDict
+from typing import Optional
+
+from bclib.utility import FrozenDictEx
+
+from ..html.html_parser_ex import HtmlParserEx
+
+
+class ParsedSourceCommand:
+    """
+    Parsed dbsource command shared by requests with the same command markup
+
+    Attributes:
+        command (FrozenDictEx): Read-only parsed command
+        params (FrozenDictEx): Read-only name -> value of the command's
+            <params><add name value/></params>, None if the command has none
+    """
+
+    __slots__ = ('command', 'params')
+
+    def __init__(self, raw_command: str) -> None:
+        parser = HtmlParserEx()
+        parser.feed(raw_command)
+        self.command = FrozenDictEx(parser.get_dict())
+        self.params: Optional[FrozenDictEx] = None
+        params_list = self.command.get('params', ())
+        if len(params_list) > 0 and "add" in params_list[0]:
+            self.params = FrozenDictEx({item.get('name'): item.get('value')
+                                        for item in params_list[0].get('add', ())})
+
+
+class SourceCommandCache:
+    """
+    Bounded LRU cache of parsed dbsource commands keyed by the raw command markup
+
+    Front-ends send the same command templates over and over, so source
+    contexts take the parsed command from here instead of running the HTML
+    parser on every request. Entries are read-only (FrozenDictEx) because they
+    are shared by all requests with the same command; use copy() to get a
+    mutable DictEx.
+
+    Example:
+        ```python
+        parsed = SourceCommandCache.shared().get(raw_command)
+        members = parsed.command.member
+        ```
+    """
+
+    __shared: 'SourceCommandCache' = None
+
+    def __init__(self, max_entries: int = 512) -> None:
+        """
+        Initialize cache
+
+        Args:
+            max_entries: Max cached commands, least recently used are dropped first
+        """
+        self.max_entries = max_entries
+        self.__entries: 'OrderedDict[str, ParsedSourceCommand]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def shared(cls) -> 'SourceCommandCache':
+        """Get the process-wide cache used by source contexts"""
+        if cls.__shared is None:
+            cls.__shared = SourceCommandCache()
+        return cls.__shared
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, raw_command: str) -> ParsedSourceCommand:
+        """
+        Get parsed command, parsing and caching it on first use
+
+        Args:
+            raw_command: Command markup, e.g. "<basis core='dbsource' ...>...</basis>"
+
+        Returns:
+            ParsedSourceCommand: Shared parsed command
+        """
+        entry = self.__entries.get(raw_command)
+        if entry is not None:
+            self.hits += 1
+            self.__entries.move_to_end(raw_command)
+            return entry
+        self.misses += 1
+        entry = ParsedSourceCommand(raw_command)
+        if self.max_entries > 0:
+            self.__entries[raw_command] = entry
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        """Remove all cached commands"""
+        self.__entries.clear()
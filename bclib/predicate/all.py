@@ -65,8 +65,14 @@ class All(Predicate):
         """
         super().__init__(None)
         self.__predicate_list = predicates
+        self.__is_async = any(predicate.is_async for predicate in predicates)
 
-    async def check_async(self, context: 'Context') -> bool:
+    @property
+    def is_async(self) -> bool:
+        """Check if any combined predicate must be awaited"""
+        return self.__is_async
+
+    def check(self, context: 'Context') -> bool:
         """
         Check if all predicates pass
 
@@ -81,10 +87,31 @@ class All(Predicate):
 
         Note:
             Short-circuits on first False result for performance.
+            Only valid when no combined predicate is async (see is_async).
+        """
+        try:
+            for predicate in self.__predicate_list:
+                if not predicate.check(context):
+                    return False
+            return True
+        except Exception:
+            return False
+
+    async def check_async(self, context: 'Context') -> bool:
+        """
+        Check if all predicates pass, awaiting async predicates
+
+        Args:
+            context: Current request context to evaluate
+
+        Returns:
+            True if all predicates return True, False if any returns False
         """
         try:
             for predicate in self.__predicate_list:
-                if not await predicate.check_async(context):
+                matched = await predicate.check_async(context) if predicate.is_async\
+                    else predicate.check(context)
+                if not matched:
                     return False
             return True
         except Exception:
@@ -67,8 +67,14 @@ class Any(Predicate):
         """
         super().__init__(None)
         self.__predicate_list = predicates
+        self.__is_async = any(predicate.is_async for predicate in predicates)
 
-    async def check_async(self, context: 'Context') -> bool:
+    @property
+    def is_async(self) -> bool:
+        """Check if any combined predicate must be awaited"""
+        return self.__is_async
+
+    def check(self, context: 'Context') -> bool:
         """
         Check if at least one predicate passes
 
@@ -83,32 +89,32 @@ class Any(Predicate):
 
         Note:
             Short-circuits on first True result for performance.
+            Only valid when no combined predicate is async (see is_async).
         """
         try:
             for predicate in self.__predicate_list:
-                if await predicate.check_async(context):
+                if predicate.check(context):
                     return True
             return False
         except Exception:
             return False
-        super().__init__(None)
-        self.__predicate_list = predicates
 
     async def check_async(self, context: 'Context') -> bool:
         """
-        Check if any predicate returns True
+        Check if at least one predicate passes, awaiting async predicates
 
         Args:
-            context: Current request context
+            context: Current request context to evaluate
 
         Returns:
-            True if at least one predicate is True, False otherwise
+            True if any predicate returns True, False if all return False
         """
         try:
             for predicate in self.__predicate_list:
-                if await predicate.check_async(context):
+                matched = await predicate.check_async(context) if predicate.is_async\
+                    else predicate.check(context)
+                if matched:
                     return True
             return False
-        except Exception as ex:
-            print("Error in any predicate", ex)
+        except Exception:
             return False
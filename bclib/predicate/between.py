@@ -60,7 +60,7 @@ class Between(Predicate):
         self.__min_value = min_value
         self.__max_value = max_value
 
-    async def check_async(self, context: 'Context') -> bool:
+    def check(self, context: 'Context') -> bool:
         """
         Check if value is within range
 
@@ -77,7 +77,7 @@ class Between(Predicate):
             Value is converted to int; conversion errors return False.
         """
         try:
-            value = self._evaluate_expression(context)
+            value = self._accessor(context)
             return self.__min_value < int(value) < self.__max_value
         except (KeyError, AttributeError, TypeError, ValueError):
             return False
@@ -16,7 +16,7 @@ Example:
     
     # Check if query parameter equals a value
     predicate = Equal("context.query.status", "active")
-    is_match = await predicate.check_async(context)
+    is_match = predicate.check(context)
     
     # Check if URL segment matches
     id_check = Equal("context.url_segments.id", "123")
@@ -75,7 +75,12 @@ class Equal(Predicate):
         super().__init__(expression)
         self.__value = value
 
-    async def check_async(self, context: 'Context') -> bool:
+    @property
+    def matching_values(self) -> tuple:
+        """Get the expected value as the only matching value"""
+        return (self.__value,)
+
+    def check(self, context: 'Context') -> bool:
         """
         Check if the expression evaluates to the expected value
 
@@ -91,11 +96,11 @@ class Equal(Predicate):
         Example:
             ```python
             predicate = Equal("context.query.user_id", "123")
-            result = await predicate.check_async(context)  # True if match
+            result = predicate.check(context)  # True if match
             ```
         """
         try:
-            value = self._evaluate_expression(context)
+            value = self._accessor(context)
             return self.__value == value
         except (KeyError, AttributeError, TypeError):
             return False
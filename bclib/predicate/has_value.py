@@ -58,7 +58,7 @@ class HasValue(Predicate):
         """
         super().__init__(expression)
 
-    async def check_async(self, context: 'Context') -> bool:
+    def check(self, context: 'Context') -> bool:
         """
         Check if value exists and is not empty
 
@@ -76,7 +76,7 @@ class HasValue(Predicate):
             For other types, checks boolean truthiness.
         """
         try:
-            value = self._evaluate_expression(context)
+            value = self._accessor(context)
             if value is None:
                 return False
             if isinstance(value, str):
@@ -63,7 +63,12 @@ class InList(Predicate):
         super().__init__(expression)
         self.__items = items
 
-    async def check_async(self, context: 'Context') -> bool:
+    @property
+    def matching_values(self) -> tuple:
+        """Get the allowed values"""
+        return self.__items
+
+    def check(self, context: 'Context') -> bool:
         """
         Check if value is in allowed list
 
@@ -77,7 +82,7 @@ class InList(Predicate):
             Does not raise exceptions; returns False on error
         """
         try:
-            value = self._evaluate_expression(context)
+            value = self._accessor(context)
             return value in self.__items
         except (KeyError, AttributeError, TypeError):
             return False
@@ -60,7 +60,7 @@ class LessThan(Predicate):
         super().__init__(expression)
         self.__value = value
 
-    async def check_async(self, context: 'Context') -> bool:
+    def check(self, context: 'Context') -> bool:
         """
         Check if extracted value is less than threshold
 
@@ -74,7 +74,7 @@ class LessThan(Predicate):
             Does not raise exceptions; returns False on error
         """
         try:
-            value = self._evaluate_expression(context)
+            value = self._accessor(context)
             return self.__value > value
         except (KeyError, AttributeError, TypeError, ValueError):
             return False
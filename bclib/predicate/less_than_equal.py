@@ -56,7 +56,7 @@ class LessThanEqual(Predicate):
         super().__init__(expression)
         self.__value = value
 
-    async def check_async(self, context: 'Context') -> bool:
+    def check(self, context: 'Context') -> bool:
         """
         Check if value is less than or equal to threshold
 
@@ -70,7 +70,7 @@ class LessThanEqual(Predicate):
             Does not raise exceptions; returns False on error
         """
         try:
-            value = self._evaluate_expression(context)
+            value = self._accessor(context)
             return self.__value >= value
         except (KeyError, AttributeError, TypeError, ValueError):
             return False
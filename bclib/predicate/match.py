@@ -68,7 +68,7 @@ class Match(Predicate):
         super().__init__(expression)
         self.__compiled_regex = re.compile(value)
 
-    async def check_async(self, context: 'Context') -> bool:
+    def check(self, context: 'Context') -> bool:
         """
         Check if value matches the regex pattern
 
@@ -85,7 +85,7 @@ class Match(Predicate):
             Value is converted to string before matching.
         """
         try:
-            value = self._evaluate_expression(context)
+            value = self._accessor(context)
             return self.__compiled_regex.match(str(value)) is not None
         except (KeyError, AttributeError, TypeError):
             return False
@@ -61,7 +61,7 @@ class NotEqual(Predicate):
         super().__init__(expression)
         self.__value = value
 
-    async def check_async(self, context: 'Context') -> bool:
+    def check(self, context: 'Context') -> bool:
         """
         Check if the expression evaluates to a different value
 
@@ -75,7 +75,7 @@ class NotEqual(Predicate):
             Does not raise exceptions; returns False on error
         """
         try:
-            value = self._evaluate_expression(context)
+            value = self._accessor(context)
             return self.__value != value
         except (KeyError, AttributeError, TypeError):
             return False
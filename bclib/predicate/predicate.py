@@ -22,8 +22,10 @@ Example:
     ```
 """
 
-from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+import keyword
+from abc import ABC
+from types import FunctionType
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 if TYPE_CHECKING:
     from bclib.context import Context
@@ -37,6 +39,11 @@ class Predicate(ABC):
     This abstract base class provides common functionality for expression evaluation
     and defines the interface that all predicates must implement.
 
+    Predicates that only inspect the context implement the synchronous check();
+    check_async() calls it. Predicates that must await something (e.g. Callback)
+    override check_async() and report is_async, so dispatching awaits just
+    those. Subclasses must override at least one of the two.
+
     Attributes:
         expression: The expression string to evaluate (e.g., "context.query.user_id")
 
@@ -47,15 +54,24 @@ class Predicate(ABC):
                 super().__init__(expression)
                 self.__value = value
 
-            async def check_async(self, context: Context) -> bool:
+            def check(self, context: Context) -> bool:
                 try:
-                    actual = self._evaluate_expression(context)
+                    actual = self._accessor(context)
                     return actual == self.__value
                 except (KeyError, AttributeError):
                     return False
         ```
     """
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Reject concrete subclasses that override neither check() nor check_async()"""
+        super().__init_subclass__(**kwargs)
+        is_abstract = any(getattr(value, '__isabstractmethod__', False)
+                          for value in vars(cls).values())
+        if not is_abstract and cls.check is Predicate.check and cls.check_async is Predicate.check_async:
+            raise TypeError(
+                f"Predicate {cls.__name__} must override check() or check_async()")
+
     def __init__(self, expression: str) -> None:
         """
         Initialize the predicate with an expression
@@ -65,8 +81,8 @@ class Predicate(ABC):
                        Can be None for predicates that don't evaluate expressions
 
         Note:
-            Expression parsing is done once during initialization for performance.
-            The parsed parts are cached in _parts and _start_idx.
+            The expression is compiled once into the _accessor function, so
+            evaluating it does not walk or inspect the path per request.
         """
         super().__init__()
         self.expression = expression
@@ -77,6 +93,65 @@ class Predicate(ABC):
         else:
             self._parts = []
             self._start_idx = 0
+        self._accessor: Callable[['Context'], Any] = Predicate.__compile_accessor(
+            self._parts[self._start_idx:]) if expression else Predicate.__no_value
+
+    @property
+    def is_async(self) -> bool:
+        """
+        Check if the predicate must be awaited
+
+        Returns:
+            True if the predicate overrides check_async()
+        """
+        return type(self).check_async is not Predicate.check_async
+
+    @property
+    def matching_values(self) -> 'Optional[tuple]':
+        """
+        Get the constant values the expression must have for the predicate to pass
+
+        Used to index handlers by value (see HandlerTable). Only predicates
+        that pass exactly when the expression equals one of a fixed set of
+        values (Equal, InList) return them.
+
+        Returns:
+            Optional[tuple]: Allowed values, None if the predicate is not such a check
+        """
+        return None
+
+    def check(self, context: 'Context') -> bool:
+        """
+        Apply predicate checking logic synchronously
+
+        Implemented by predicates that do not need to await anything.
+
+        Args:
+            context: Current request context to evaluate
+
+        Returns:
+            True if the predicate condition is met, False otherwise
+
+        Raises:
+            TypeError: If the predicate is async (see is_async)
+        """
+        raise TypeError(f"{type(self).__name__} is async, use check_async()")
+
+    async def check_async(self, context: 'Context') -> bool:
+        """
+        Apply predicate checking logic
+
+        Args:
+            context: Current request context to evaluate
+
+        Returns:
+            True if the predicate condition is met, False otherwise
+
+        Note:
+            Calls check() by default. Predicates that must await something
+            override this method instead of check().
+        """
+        return self.check(context)
 
     def _evaluate_expression(self, context: 'Context') -> Any:
         """
@@ -104,44 +179,45 @@ class Predicate(ABC):
             value = self._evaluate_expression(context)
             ```
         """
-        if not self.expression:
-            return None
-
-        obj = context
+        return self._accessor(context)
 
-        # Navigate through the path
-        for part in self._parts[self._start_idx:]:
-            # Handle dictionary access (like query, url_segments, form)
-            if hasattr(obj, '__getitem__'):
-                obj = obj[part]
-            # Handle attribute access
-            elif hasattr(obj, part):
-                obj = getattr(obj, part)
-            else:
-                raise KeyError(f"Path '{part}' not found")
-
-        return obj
-
-    @abstractmethod
-    async def check_async(self, context: 'Context') -> bool:
+    @staticmethod
+    def __compile_accessor(parts: 'list[str]') -> Callable[['Context'], Any]:
         """
-        Apply predicate checking logic
+        Generate the function that reads an expression path from a context
 
-        This method must be implemented by all concrete predicate classes.
+        The first part is read as an attribute of the context (context.query,
+        context.url_segments, context.body, context.cms, ...). Each following
+        part is read by key from dicts, and from other objects by key when they
+        support it, else as an attribute.
 
         Args:
-            context: Current request context to evaluate
+            parts: Path parts after the leading 'context'
 
         Returns:
-            True if the predicate condition is met, False otherwise
-
-        Example:
-            ```python
-            async def check_async(self, context: Context) -> bool:
-                try:
-                    value = self._evaluate_expression(context)
-                    return value == self.__expected_value
-                except (KeyError, AttributeError):
-                    return False
-            ```
+            Callable: Function taking the context and returning the value
         """
+        lines = ["def accessor(context):", "    obj = context"]
+        if parts:
+            root = parts[0]
+            lines.append(f"    obj = context.{root}"
+                         if root.isidentifier() and not keyword.iskeyword(root)
+                         else f"    obj = getattr(context, {root!r})")
+        for part in parts[1:]:
+            lines.append(f"    obj = obj[{part!r}] if isinstance(obj, dict) else step(obj, {part!r})")
+        lines.append("    return obj")
+        code = compile("\n".join(lines), "<predicate>", "exec")
+        return FunctionType(code.co_consts[0], {"step": Predicate.__step}, "accessor")
+
+    @staticmethod
+    def __no_value(context: 'Context') -> None:
+        return None
+
+    @staticmethod
+    def __step(obj: Any, part: str) -> Any:
+        """Read one path part from a non-dict object"""
+        if hasattr(obj, '__getitem__'):
+            return obj[part]
+        if hasattr(obj, part):
+            return getattr(obj, part)
+        raise KeyError(f"Path '{part}' not found")
@@ -80,7 +80,7 @@ class Url(Predicate):
         super().__init__(expression)
         self.__validator: FunctionType = Url.__generate_validator(expression)
 
-    async def check_async(self, context: 'Context') -> bool:
+    def check(self, context: 'Context') -> bool:
         """
         Check if request URL matches pattern
 
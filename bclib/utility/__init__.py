@@ -2,6 +2,7 @@ from .dict_ex import DictEx
 from .dict_resolver import (get_dict_keys_at_path, has_dict_key,
                             resolve_dict_value,
                             resolve_dict_value_with_default)
+from .frozen_dict_ex import FrozenDictEx
 from .http_base_data_name import HttpBaseDataName
 from .http_base_data_type import HttpBaseDataType
 from .http_headers import HttpHeaders
@@ -12,6 +13,7 @@ from .static_file_handler import StaticFileHandler
 
 __all__ = [
     'DictEx',
+    'FrozenDictEx',
     'resolve_dict_value',
     'resolve_dict_value_with_default',
     'has_dict_key',
@@ -0,0 +1,61 @@
+from typing import Any, NoReturn
+
+from .dict_ex import DictEx
+
+
+class FrozenDictEx(DictEx):
+    """Read-only DictEx for values shared between requests
+
+    Nested dicts are frozen as well and lists become tuples. copy() and
+    copy.deepcopy() return a regular, mutable DictEx.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        for arg in args:
+            if isinstance(arg, dict):
+                for k, v in arg.items():
+                    dict.__setitem__(self, k, FrozenDictEx.freeze(v))
+
+    @classmethod
+    def freeze(cls, value: Any) -> Any:
+        """Get read-only version of a dict, list or tuple value"""
+        if isinstance(value, FrozenDictEx):
+            return value
+        if isinstance(value, dict):
+            return FrozenDictEx(value)
+        if isinstance(value, (list, tuple)):
+            return tuple(FrozenDictEx.freeze(item) for item in value)
+        return value
+
+    def __readonly(self, *args, **kwargs) -> NoReturn:
+        raise TypeError(
+            "FrozenDictEx is read-only, use copy() to get a mutable DictEx")
+
+    __setitem__ = __readonly
+    __delitem__ = __readonly
+    __setattr__ = __readonly
+    __ior__ = __readonly
+    clear = __readonly
+    pop = __readonly
+    popitem = __readonly
+    setdefault = __readonly
+    update = __readonly
+
+    def copy(self) -> DictEx:
+        return DictEx(FrozenDictEx.thaw(self))
+
+    def __copy__(self) -> DictEx:
+        return self.copy()
+
+    def __deepcopy__(self, memo=None) -> DictEx:
+        return self.copy()
+
+    @classmethod
+    def thaw(cls, value: Any) -> Any:
+        """Get mutable (dict/list) version of a frozen value"""
+        if isinstance(value, dict):
+            return {k: FrozenDictEx.thaw(v) for k, v in value.items()}
+        if isinstance(value, tuple):
+            return [FrozenDictEx.thaw(item) for item in value]
+        return value
@@ -28,6 +28,7 @@ class HttpMimeTypes:
     JS = "text/javascript"
     JSON = "application/json"
     JSONLD = "application/ld+json"
+    NDJSON = "application/x-ndjson"
     MID = "audio/midi"
     MIDI = "audio/midi"
     X_MIDI = "audio/x-midi"
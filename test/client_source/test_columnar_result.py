@@ -0,0 +1,97 @@
+"""Unit Tests for columnar source results
+
+Member handlers can return a ColumnarResult that is projected by the
+member's column_names and written as array rows with columnNames.
+"""
+
+import asyncio
+import json
+import unittest
+from array import array
+
+from bclib import edge
+from bclib.context import (ClientSourceContext, ClientSourceMemberContext,
+                           ColumnarResult)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+COMMAND = """
+<basis core='dbsource' run='atclient' source='shop' name='catalog'>
+    <member name='products' type='list'></member>
+    <member name='legacy' type='list'></member>
+</basis>
+"""
+
+RECORDS = [(1, "pen", 2.5), (2, "book", 12.0), (3, "bag", 30.25)]
+
+
+class TestColumnarResult(unittest.IsolatedAsyncioTestCase):
+    """Test suite for ColumnarResult"""
+
+    def test_construction_and_projection(self):
+        """Test building from records and rows, and zero-copy projection"""
+        result = ColumnarResult.from_records(RECORDS, ["id", "name", "price"])
+        self.assertEqual(len(result), 3)
+        self.assertEqual(result.column_names, ["id", "name", "price"])
+
+        projected = result.select(["price", "id"])
+        self.assertIs(projected["id"], result["id"])
+        self.assertEqual(list(projected.iter_rows()), [(2.5, 1), (12.0, 2), (30.25, 3)])
+
+        rows = result.to_rows()
+        self.assertEqual(rows[1], {"id": 2, "name": "book", "price": 12.0})
+        self.assertEqual(ColumnarResult.from_rows(rows).to_rows(), rows)
+        self.assertEqual(len(ColumnarResult.from_records([], ["id"])), 0)
+
+        with self.assertRaises(ValueError):
+            ColumnarResult({"id": [1, 2], "name": ["a"]})
+
+    def test_array_columns_are_serializable(self):
+        """Test that array columns with tolist() are converted to Python scalars"""
+        result = ColumnarResult({"id": array("q", [1, 2]), "price": array("d", [0.5, 1.5])})
+        source = result.to_source({"tableName": "t"})
+        self.assertEqual(json.loads(json.dumps(source)), {
+            "options": {"tableName": "t", "columnNames": ["id", "price"]},
+            "data": [[1, 0.5], [2, 1.5]]})
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy_columns(self):
+        """Test NumPy-backed columns"""
+        result = ColumnarResult({"id": numpy.arange(3), "price": numpy.array([1.0, 2.0, 3.0])})
+        self.assertEqual(json.dumps(result.to_source({})["data"]),
+                         "[[0, 1.0], [1, 2.0], [2, 3.0]]")
+
+    async def test_source_response(self):
+        """Test columnar and row results side by side in a source response"""
+        app = edge.from_options({}, asyncio.get_running_loop())
+
+        @app.client_source_handler(None, None, app.equal("context.command.source", "shop"))
+        def shop(context: ClientSourceContext):
+            return RECORDS
+
+        @app.client_source_member_handler(None, None, app.equal("context.member.name", "products"))
+        def products(context: ClientSourceMemberContext):
+            context.column_names = ["name", "price"]
+            return ColumnarResult.from_records(context.data, ["id", "name", "price"])
+
+        @app.client_source_member_handler(None, None, app.equal("context.member.name", "legacy"))
+        def legacy(context: ClientSourceMemberContext):
+            return [{"id": record[0]} for record in context.data]
+
+        cms = {"request": {"url": "source"}, "form": {"command": COMMAND}}
+        response = await app.dispatch_async(ClientSourceContext(cms, app, None))
+        products_source, legacy_source = json.loads(response["cms"]["content"])["sources"]
+
+        self.assertEqual(products_source["options"]["tableName"], "catalog.products")
+        self.assertEqual(products_source["options"]["columnNames"], ["name", "price"])
+        self.assertEqual(products_source["data"],
+                         [["pen", 2.5], ["book", 12.0], ["bag", 30.25]])
+        self.assertIsNone(legacy_source["options"]["columnNames"])
+        self.assertEqual(legacy_source["data"], [{"id": 1}, {"id": 2}, {"id": 3}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""Unit Tests for the parsed source command cache
+
+Client source contexts take the parsed command and params from a bounded
+LRU cache keyed by the raw command, shared read-only between requests.
+"""
+
+import copy
+import unittest
+
+from bclib.context import ClientSourceContext
+from bclib.di.service_provider import ServiceProvider
+from bclib.parser import SourceCommandCache
+from bclib.utility import DictEx, FrozenDictEx
+
+COMMAND = """
+<basis core='dbsource' run='atclient' source='basiscore' mid='20' name='demo'>
+    <params><add name='catid' value='5'></add><add name='lang' value='fa'></add></params>
+    <member name='list' type='list' request='catname'></member>
+    <member name='count' type='scalar' request='count'></member>
+</basis>
+"""
+
+
+class Dispatcher:
+    """Dispatcher stand-in providing the root service provider"""
+
+    def __init__(self):
+        self.service_provider = ServiceProvider()
+        self.options = {}
+
+
+class TestSourceCommandCache(unittest.TestCase):
+    """Test suite for parsed command caching"""
+
+    def create_context(self, command: str) -> ClientSourceContext:
+        cms = {"request": {"url": "source"}, "form": {"command": command}}
+        return ClientSourceContext(cms, Dispatcher(), None)
+
+    def test_requests_share_parsed_command(self):
+        """Test that the same command is parsed once and params are precomputed"""
+        cache = SourceCommandCache.shared()
+        cache.clear()
+        misses = cache.misses
+
+        first = self.create_context(COMMAND)
+        second = self.create_context(COMMAND)
+
+        self.assertEqual(cache.misses - misses, 1)
+        self.assertIs(first.command, second.command)
+        self.assertEqual([member.name for member in first.command.member], ["list", "count"])
+        self.assertEqual(first.params, {"catid": "5", "lang": "fa"})
+        self.assertIsNone(self.create_context("<basis name='x'></basis>").params)
+
+    def test_shared_entries_are_read_only(self):
+        """Test that handlers cannot modify the shared command"""
+        command = self.create_context(COMMAND).command
+        with self.assertRaises(TypeError):
+            command["name"] = "other"
+        with self.assertRaises(TypeError):
+            command.member[0]["name"] = "other"
+        with self.assertRaises(AttributeError):
+            command.member.append({})
+
+        mutable = copy.deepcopy(command)
+        mutable.member[0]["name"] = "other"
+        mutable.member.append(DictEx({"name": "extra"}))
+        self.assertNotIsInstance(mutable, FrozenDictEx)
+        self.assertEqual(mutable.member[0].name, "other")
+        self.assertEqual(command.member[0].name, "list")
+
+    def test_least_recently_used_dropped(self):
+        """Test the max_entries bound"""
+        cache = SourceCommandCache(max_entries=2)
+        a, b, c = ("<basis name='a'></basis>", "<basis name='b'></basis>",
+                   "<basis name='c'></basis>")
+        first_a = cache.get(a)
+        cache.get(b)
+        cache.get(a)
+        cache.get(c)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.get(a), first_a)
+        self.assertEqual(cache.misses, 3)
+        cache.get(b)
+        self.assertEqual(cache.misses, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+"""Unit Tests for MongoBulkWriter
+
+Buffered insert/upsert/$inc operations are merged and flushed as unordered
+bulk writes on size, time and shutdown, with per-flush results.
+"""
+
+import asyncio
+import unittest
+
+from pymongo import InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError
+
+from bclib.connections.mongo.mongo_bulk_writer import MongoBulkWriter
+from bclib.connections.mongo.mongo_connection import MongoConnection
+
+
+class WriteResult:
+    def __init__(self, details: dict):
+        self.bulk_api_result = details
+
+
+class FakeCollection:
+    """Async collection stand-in recording bulk writes"""
+
+    name = "counters"
+
+    def __init__(self, fail: bool = False):
+        self.writes = []
+        self.fail = fail
+
+    async def bulk_write(self, operations, ordered=True):
+        self.writes.append((operations, ordered))
+        details = {"nInserted": sum(isinstance(op, InsertOne) for op in operations),
+                   "nUpserted": sum(isinstance(op, UpdateOne) for op in operations),
+                   "nMatched": 0, "nModified": 0, "writeErrors": []}
+        if self.fail:
+            details["writeErrors"] = [{"index": 0, "errmsg": "duplicate key"}]
+            raise BulkWriteError(details)
+        return WriteResult(details)
+
+
+class TestMongoBulkWriter(unittest.IsolatedAsyncioTestCase):
+    """Test suite for the write-behind bulk writer"""
+
+    async def test_flush_on_size_merges_inc(self):
+        """Test that $inc on the same _id is merged and max_batch triggers a flush"""
+        collection = FakeCollection()
+        writer = MongoBulkWriter(collection, max_batch=3, max_delay_ms=10000)
+        for _ in range(100):
+            writer.inc("home", {"views": 1, "clicks": 2})
+        writer.upsert({"_id": "about"}, {"title": "About"})
+        writer.inc("about", {"views": 5})
+        self.assertEqual(collection.writes, [])
+
+        writer.insert({"event": "open"})
+        await asyncio.sleep(0)
+
+        operations, ordered = collection.writes[0]
+        self.assertFalse(ordered)
+        self.assertEqual(len(operations), 3)
+        self.assertEqual(operations[1], UpdateOne(
+            {"_id": "home"}, {"$inc": {"views": 100, "clicks": 200}}, upsert=True))
+        self.assertEqual(operations[2], UpdateOne(
+            {"_id": "about"}, {"$set": {"title": "About"}, "$inc": {"views": 5}}, upsert=True))
+        self.assertEqual(writer.last_result.upserted_count, 2)
+        self.assertEqual(writer.pending_count, 0)
+
+    async def test_only_inc_set_unset_are_merged(self):
+        """Test that other operators and conflicting fields stay separate operations"""
+        collection = FakeCollection()
+        writer = MongoBulkWriter(collection, max_batch=1000, max_delay_ms=10000)
+        writer.update({"_id": 1}, {"$set": {"a": 1}, "$inc": {"n": 1}})
+        writer.update({"_id": 1}, {"$unset": {"a": ""}, "$inc": {"n": 2}})
+        writer.update({"_id": 1}, {"$push": {"tags": "x"}})
+        writer.update({"_id": 1}, {"$push": {"tags": "y"}})
+        writer.update({"_id": 1}, {"$inc": {"n": 4}})
+        writer.update({"_id": 1}, {"$set": {"n": 0}})
+        writer.update({"_id": 2}, {"$max": {"score": 5}})
+        await writer.flush_async()
+
+        operations, _ = collection.writes[0]
+        self.assertEqual(operations, [
+            UpdateOne({"_id": 1}, {"$inc": {"n": 3}, "$unset": {"a": ""}}, upsert=False),
+            UpdateOne({"_id": 1}, {"$push": {"tags": "x"}}, upsert=False),
+            UpdateOne({"_id": 1}, {"$push": {"tags": "y"}}, upsert=False),
+            UpdateOne({"_id": 1}, {"$inc": {"n": 4}}, upsert=False),
+            UpdateOne({"_id": 1}, {"$set": {"n": 0}}, upsert=False),
+            UpdateOne({"_id": 2}, {"$max": {"score": 5}}, upsert=False),
+        ])
+
+    async def test_upsert_not_merged_into_update(self):
+        """Test that updates with a different upsert flag stay separate operations"""
+        collection = FakeCollection()
+        writer = MongoBulkWriter(collection, max_batch=1000, max_delay_ms=10000)
+        writer.inc("home", {"views": 1}, upsert=False)
+        writer.upsert({"_id": "home"}, {"title": "Home"})
+        writer.inc("home", {"views": 2})
+        await writer.flush_async()
+
+        operations, _ = collection.writes[0]
+        self.assertEqual(operations, [
+            UpdateOne({"_id": "home"}, {"$inc": {"views": 1}}, upsert=False),
+            UpdateOne({"_id": "home"}, {"$set": {"title": "Home"}, "$inc": {"views": 2}},
+                      upsert=True),
+        ])
+
+    async def test_flush_on_time_and_results(self):
+        """Test the max_delay_ms flush and the on_flush callback"""
+        results = []
+        writer = MongoBulkWriter(FakeCollection(), max_batch=1000,
+                                 max_delay_ms=20, on_flush=results.append)
+        writer.insert({"a": 1})
+        writer.insert({"a": 2})
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(len(results), 1)
+        self.assertTrue(results[0].succeeded)
+        self.assertEqual((results[0].operations, results[0].inserted_count), (2, 2))
+
+    async def test_errors_are_reported_and_close_flushes(self):
+        """Test that bulk write errors are reported and close flushes the rest"""
+        results = []
+        writer = MongoBulkWriter(FakeCollection(fail=True), max_batch=1000,
+                                 max_delay_ms=10000, on_flush=results.append)
+        writer.insert({"_id": 1})
+        await writer.close_async()
+
+        self.assertFalse(results[0].succeeded)
+        self.assertEqual(len(results[0].write_errors), 1)
+        self.assertEqual(writer.error_count, 1)
+
+    async def test_writer_shared_by_handles(self):
+        """Test that handles of a shared connection use the same writer"""
+        options = {"connection_string": "mongodb://localhost:27017",
+                   "database_name": "app"}
+        shared = MongoConnection(options)
+        first = MongoConnection(options, shared)
+        second = MongoConnection(options, shared)
+
+        self.assertIs(first.bulk_writer("events"), second.bulk_writer("events"))
+        self.assertIsNot(first.bulk_writer("events"), first.bulk_writer("counters"))
+        await shared.dispose_async()
+
+
+if __name__ == '__main__':
+    unittest.main()
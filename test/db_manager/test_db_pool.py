@@ -0,0 +1,114 @@
+"""Unit Tests for DbManager connection pools
+
+SQLite connections are pooled per connection key, reused across
+open_connection calls and used by the async query API on pool threads.
+"""
+
+import asyncio
+import os
+import tempfile
+import unittest
+
+from bclib.db_manager import DbManager
+
+
+class TestDbPool(unittest.IsolatedAsyncioTestCase):
+    """Test suite for pooled SQLite connections and the async query API"""
+
+    async def asyncSetUp(self):
+        """Create a SQLite database with a pooled connection setting"""
+        self.folder = tempfile.TemporaryDirectory()
+        path = os.path.join(self.folder.name, "test.db")
+        self.manager = DbManager({"settings": {
+            "connections.sqlite.main": {
+                "connection_string": path,
+                "pool": {"min_size": 1, "max_size": 2, "health_check_after": 0}}
+        }}, asyncio.get_running_loop())
+        await self.manager.start_async()
+        await self.manager.execute_async(
+            "main", "CREATE TABLE items (id INTEGER, name TEXT)")
+
+    async def asyncTearDown(self):
+        await self.manager.stop_async()
+        self.folder.cleanup()
+
+    async def test_open_connection_reuses_pooled_connection(self):
+        """Test that exiting a Db returns its connection to the pool"""
+        first = self.manager.open_sqllite_connection("main")
+        with first:
+            pass
+        second = self.manager.open_sqllite_connection("main")
+        with second:
+            pass
+
+        self.assertIs(first, second)
+        self.assertEqual(self.manager.get_pool("main").size, 1)
+
+    async def test_async_api_runs_on_pool_threads(self):
+        """Test execute/fetch/fetchmany and the max_size bound"""
+        inserted = await asyncio.gather(*(
+            self.manager.execute_async(
+                "main", "INSERT INTO items VALUES (?, ?)", (i, f"item{i}"))
+            for i in range(10)))
+        self.assertEqual(inserted, [1] * 10)
+
+        rows = await self.manager.fetch_async(
+            "main", "SELECT name FROM items WHERE id < ? ORDER BY id", (3,))
+        self.assertEqual([row[0] for row in rows], ["item0", "item1", "item2"])
+
+        batches = [len(batch) async for batch in self.manager.fetchmany(
+            "main", "SELECT * FROM items", size=4)]
+        self.assertEqual(batches, [4, 4, 2])
+        self.assertLessEqual(self.manager.get_pool("main").size, 2)
+
+    async def test_idle_connections_are_evicted(self):
+        """Test that idle connections above min_size are closed after idle_timeout"""
+        pool = self.manager.get_pool("main")
+        await asyncio.gather(*(self.manager.fetch_async(
+            "main", "SELECT 1") for _ in range(4)))
+        self.assertEqual(pool.size, 2)
+
+        pool.idle_timeout = 0
+
+        with self.manager.open_connection("main"):
+            pass
+        self.assertEqual(pool.size, 1)
+
+    async def test_failed_request_is_rolled_back(self):
+        """Test that uncommitted writes of a failed request are not seen by the next lease"""
+        db = self.manager.open_sqllite_connection("main")
+        with self.assertRaises(RuntimeError):
+            with db:
+                db.connection.execute("INSERT INTO items VALUES (1, 'failed')")
+                raise RuntimeError("request failed")
+
+        db = self.manager.open_sqllite_connection("main")
+        with db:
+            db.connection.execute("INSERT INTO items VALUES (2, 'committed')")
+            db.connection.commit()
+
+        rows = await self.manager.fetch_async("main", "SELECT id FROM items ORDER BY id")
+        self.assertEqual(rows, [(2,)])
+
+    async def test_connection_closed_when_rollback_fails(self):
+        """Test that a connection that cannot be rolled back is not reused"""
+        pool = self.manager.get_pool("main")
+        db = self.manager.open_sqllite_connection("main")
+        connection = db.connection
+
+        class BrokenConnection:
+            def rollback(self):
+                raise RuntimeError("connection lost")
+
+            def close(self):
+                connection.close()
+
+        db.connection = BrokenConnection()
+        with db:
+            pass
+        self.assertEqual(pool.idle_count, 0)
+        self.assertIsNot(self.manager.open_sqllite_connection("main"), db)
+
+
+if __name__ == '__main__':
+    unittest.main()
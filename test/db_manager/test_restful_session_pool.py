@@ -0,0 +1,117 @@
+"""Unit Tests for shared RESTful sessions in DbManager
+
+RESTful connections to the same base URL share one keep-alive session
+from the RESTfulSessionPool injected into DbManager and closed when it
+stops. Sessions of another event loop are closed before they are replaced.
+"""
+
+import asyncio
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from bclib import edge
+from bclib.db_manager import DbManager, IDbManager, RESTfulSessionPool
+
+
+class TestRESTfulSessionPool(unittest.IsolatedAsyncioTestCase):
+    """Test suite for keep-alive session reuse"""
+
+    async def asyncSetUp(self):
+        """Start a fake API that records the client port of each request"""
+        self.peers = []
+
+        async def echo(request: web.Request):
+            self.peers.append(request.transport.get_extra_info("peername")[1])
+            body = await request.json() if request.can_read_body else None
+            return web.json_response({"query": dict(request.query), "body": body})
+
+        app = web.Application()
+        app.router.add_get("/api/{tail:.*}", echo)
+        app.router.add_post("/api/{tail:.*}", echo)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.manager = DbManager({"settings": {
+            "connections.rest.api": str(self.server.make_url("/api/")),
+            "connections.rest.other": str(self.server.make_url("/api/other/"))
+        }, "restful_session": {"limit": 1}}, asyncio.get_running_loop())
+
+    async def asyncTearDown(self):
+        await self.manager.stop_async()
+        await self.server.close()
+
+    async def test_requests_reuse_one_connection(self):
+        """Test that sequential get/post calls reuse a keep-alive connection"""
+        for _ in range(3):
+            db = self.manager.open_restful_connection("api")
+            result = await db.get_async("items", {"page": "1"})
+            self.assertEqual(result["query"], {"page": "1"})
+        db = self.manager.open_restful_connection("other")
+        result = await db.post_async("items", {"id": 5})
+        self.assertEqual(result["body"], {"id": 5})
+
+        self.assertEqual(len(self.peers), 4)
+        self.assertEqual(len(set(self.peers)), 1)
+
+    async def test_session_shared_per_origin_and_closed_on_stop(self):
+        """Test that one session serves an origin until DbManager stops"""
+        pool = self.manager._restful_sessions
+        first = pool.get_session(str(self.server.make_url("/api/a")))
+        second = pool.get_session(str(self.server.make_url("/other")))
+        self.assertIs(first, second)
+        self.assertIsNot(first, pool.get_session("http://example.com/api"))
+
+        await self.manager.stop_async()
+        self.assertTrue(first.closed)
+
+    async def test_pool_injected(self):
+        """Test that the edge pool is injected without replacing the default pool"""
+        app = edge.from_options({"restful_session": {"limit": 7}}, asyncio.get_running_loop())
+        pool = app.service_provider.get_service(RESTfulSessionPool)
+        manager = app.service_provider.get_service(IDbManager)
+
+        self.assertIs(manager._restful_sessions, pool)
+        self.assertEqual(pool.limit, 7)
+        self.assertIsNot(RESTfulSessionPool.default(), pool)
+
+
+class TestSessionLoopChange(unittest.TestCase):
+    """Test suite for sessions used from a new event loop"""
+
+    def session_on(self, pool: RESTfulSessionPool, loop: asyncio.AbstractEventLoop):
+        async def get_session():
+            return pool.get_session("http://localhost:8080/api")
+        return loop.run_until_complete(get_session())
+
+    def test_session_of_closed_loop_replaced(self):
+        """Test that a session of a closed loop is marked closed and replaced"""
+        pool = RESTfulSessionPool()
+        old_loop = asyncio.new_event_loop()
+        old = self.session_on(pool, old_loop)
+        old_loop.close()
+
+        loop = asyncio.new_event_loop()
+        new = self.session_on(pool, loop)
+        self.assertTrue(old.closed)
+        self.assertIsNot(old, new)
+        loop.run_until_complete(pool.close_async())
+        loop.close()
+
+    def test_session_closed_on_its_own_loop(self):
+        """Test that a session of a loop still open is closed on that loop"""
+        pool = RESTfulSessionPool()
+        old_loop = asyncio.new_event_loop()
+        old = self.session_on(pool, old_loop)
+
+        loop = asyncio.new_event_loop()
+        self.session_on(pool, loop)
+        old_loop.run_until_complete(asyncio.sleep(0))
+        self.assertTrue(old.closed)
+        old_loop.close()
+        loop.run_until_complete(pool.close_async())
+        loop.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+"""Unit Tests for runtime handler registration
+
+register_handler/unregister_handler update the router incrementally,
+register_handlers updates it once per batch, requests in flight keep the
+handlers they started with and WebSocket sessions are routed again after
+handlers change.
+"""
+
+import asyncio
+import json
+import unittest
+from unittest.mock import patch
+
+from bclib import edge
+from bclib.context import RESTfulContext, WebSocketContext
+from bclib.context.context_factory import ContextFactory
+from bclib.listener.http.http_message import HttpMessage
+from bclib.listener.http.websocket_message import WebSocketMessage
+from bclib.listener.message_type import MessageType
+
+
+class FakeSession:
+    """Minimal stand-in for WebSocketSession (no aiohttp socket needed)"""
+
+    def __init__(self, url: str):
+        self.id = "session-0001"
+        self.cms_object = {"cms": {"request": {
+            "url": url, "full-url": f"http://localhost/{url}", "method": "GET"}}}
+        self.session_manager = None
+        self.services = None
+        self.context_type = None
+        self.callback_info = None
+        self.routes_version = -1
+        self.url_segments = None
+
+
+def returning(value):
+    async def handler():
+        return value
+    return handler
+
+
+class TestDynamicRegistration(unittest.IsolatedAsyncioTestCase):
+    """Test suite for incremental router updates"""
+
+    def setUp(self):
+        """Create dispatcher with an initialized router"""
+        self.app = edge.from_options({"log_request": False})
+        self.factory = self.app.build_router()
+
+    def routes(self, factory: ContextFactory = None) -> dict:
+        return dict((factory or self.factory)._ContextFactory__route_lookup)
+
+    def rebuilt_routes(self) -> dict:
+        factory = self.app.service_provider.create_instance(
+            ContextFactory, lookup=self.app._Dispatcher__look_up)
+        factory.rebuild_router()
+        return self.routes(factory)
+
+    async def dispatch(self, url: str):
+        cms = {"request": {"url": url, "full-url": f"http://localhost/{url}"}}
+        context = self.factory.create_context(HttpMessage({"cms": cms}))
+        response = await self.app.dispatch_async(context)
+        return type(context), json.loads(response["cms"]["content"])
+
+    async def test_incremental_updates_match_rebuild(self):
+        """Test that insert/remove give the same router as a full rebuild"""
+        handlers = [returning({"n": i}) for i in range(6)]
+        for i, handler in enumerate(handlers):
+            self.app.register_handler(RESTfulContext, handler, [self.app.url(f"api/items/{i % 3}")])
+        self.app.register_handler(WebSocketContext, returning(None), [self.app.url("api/items/0")])
+        self.assertEqual(self.routes(), self.rebuilt_routes())
+        self.assertEqual(len(self.routes()), 3)
+
+        self.assertEqual(await self.dispatch("api/items/1"), (RESTfulContext, {"n": 1}))
+
+        # Pattern stays while another handler of the same type uses it
+        self.app.unregister_handler(RESTfulContext, handlers[1])
+        self.assertEqual(await self.dispatch("api/items/1"), (RESTfulContext, {"n": 4}))
+        self.app.unregister_handler(RESTfulContext, handlers[4])
+        self.assertNotIn("api/items/1", self.routes())
+
+        # Pattern moves to the remaining context type
+        self.app.unregister_handler(RESTfulContext, handlers[0])
+        self.app.unregister_handler(RESTfulContext, handlers[3])
+        self.assertIs(self.routes()["api/items/0"], WebSocketContext)
+        self.assertEqual(self.routes(), self.rebuilt_routes())
+
+        self.app.unregister_handler(RESTfulContext)
+        self.assertEqual(self.routes(), {"api/items/0": WebSocketContext})
+
+    def test_shared_pattern_precedence(self):
+        """Test that a pattern shared by context types routes to the last one in the lookup"""
+        self.app.register_handler(RESTfulContext, returning({}), [self.app.url("api/x")])
+        self.app.register_handler(WebSocketContext, returning(None), [self.app.url("api/x")])
+        self.assertIs(self.routes()["api/x"], WebSocketContext)
+
+        # Lookup order of context types decides, not the order of the handlers
+        self.app.register_handler(RESTfulContext, returning({}), [self.app.url("api/y")])
+        self.app.register_handler(WebSocketContext, returning(None), [self.app.url("api/z")])
+        self.app.register_handler(RESTfulContext, returning({}), [self.app.url("api/z")])
+        self.assertIs(self.routes()["api/z"], WebSocketContext)
+        self.assertEqual(self.routes(), self.rebuilt_routes())
+
+        self.app.unregister_handler(WebSocketContext)
+        self.assertIs(self.routes()["api/x"], RESTfulContext)
+        self.assertEqual(self.routes(), self.rebuilt_routes())
+
+    async def test_batch_updates_router_once(self):
+        """Test that register_handlers adds all routes in one update"""
+        with patch.object(self.factory, 'add_routes', wraps=self.factory.add_routes) as add_routes:
+            self.app.register_handlers(
+                [(RESTfulContext, returning({"n": i}), [self.app.url(f"api/batch/{i}")])
+                 for i in range(20)])
+        self.assertEqual(add_routes.call_count, 1)
+        self.assertEqual(len(self.routes()), 20)
+        self.assertEqual(await self.dispatch("api/batch/7"), (RESTfulContext, {"n": 7}))
+
+    def test_single_registers_update_router_in_place(self):
+        """Test that registering one handler at a time does not copy the route table"""
+        table = self.factory._ContextFactory__route_lookup
+        for i in range(50):
+            self.app.register_handler(RESTfulContext, returning({"n": i}), [self.app.url(f"api/one/{i}")])
+        self.app.unregister_handler(RESTfulContext)
+        self.assertIs(self.factory._ContextFactory__route_lookup, table)
+        self.assertEqual(self.routes(), {})
+
+    def test_register_before_initialize(self):
+        """Test that handlers can be registered before the router exists"""
+        app = edge.from_options({"log_request": False})
+        app.register_handler(RESTfulContext, returning({}), [app.url("api/early")])
+        self.assertEqual(len(app._Dispatcher__look_up[RESTfulContext]), 1)
+
+    async def test_in_flight_request_keeps_handlers(self):
+        """Test that unregistering does not affect requests already dispatched"""
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def slow():
+            started.set()
+            await release.wait()
+            return {"slow": True}
+
+        self.app.register_handler(RESTfulContext, slow, [self.app.url("api/slow")])
+        task = asyncio.create_task(self.dispatch("api/slow"))
+        await started.wait()
+        self.app.unregister_handler(RESTfulContext, slow)
+        release.set()
+        self.assertEqual(await task, (RESTfulContext, {"slow": True}))
+        self.assertNotIn("api/slow", self.routes())
+
+    async def test_websocket_session_routed_again(self):
+        """Test that a session does not keep a handler that was replaced"""
+        calls = []
+
+        async def old_handler(context: WebSocketContext):
+            calls.append("old")
+
+        async def new_handler(context: WebSocketContext):
+            calls.append("new")
+
+        self.app.register_handler(WebSocketContext, old_handler, [self.app.url("ws/chat")])
+        session = FakeSession("ws/chat")
+        await self.app.on_message_receive_async(
+            WebSocketMessage.connect(session, MessageType.CONNECT))
+
+        self.app.unregister_handler(WebSocketContext, old_handler)
+        self.app.register_handler(WebSocketContext, new_handler, [self.app.url("ws/chat")])
+        await self.app.on_message_receive_async(
+            WebSocketMessage.text_message(session, MessageType.MESSAGE, "hi"))
+        await self.app.on_message_receive_async(
+            WebSocketMessage.text_message(session, MessageType.MESSAGE, "hi"))
+
+        self.assertEqual(calls, ["old", "new", "new"])
+        self.assertEqual(session.routes_version, self.app.routes_version)
+
+
+if __name__ == '__main__':
+    unittest.main()
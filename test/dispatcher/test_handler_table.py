@@ -0,0 +1,101 @@
+"""Unit Tests for value-indexed handler dispatch
+
+Handlers discriminated by Equal/InList predicates on the same expression are
+selected through a dict lookup; other handlers are still checked in
+registration order.
+"""
+
+import asyncio
+import json
+import unittest
+
+from bclib import edge
+from bclib.context import RESTfulContext
+from bclib.dispatcher.callback_info import CallbackInfo
+from bclib.dispatcher.handler_table import HandlerTable
+from bclib.listener.http.http_message import HttpMessage
+from bclib.predicate import Equal, HasValue, InList
+
+
+class Context:
+    def __init__(self, **query):
+        self.query = query
+
+
+def handler_named(name):
+    async def handler(context):
+        return name
+    return handler
+
+
+class TestHandlerTable(unittest.IsolatedAsyncioTestCase):
+    """Test suite for HandlerTable and indexed dispatch"""
+
+    def create_table(self):
+        self.handlers = [
+            CallbackInfo([Equal("context.query.action", "list")], handler_named("list")),
+            CallbackInfo([HasValue("context.query.debug")], handler_named("debug")),
+            CallbackInfo([InList("context.query.action", "add", "edit"),
+                          Equal("context.query.kind", "user")], handler_named("save")),
+            CallbackInfo([Equal("context.query.action", "add")], handler_named("add")),
+            CallbackInfo([], handler_named("fallback")),
+        ]
+        return HandlerTable(self.handlers)
+
+    def test_candidates_keep_registration_order(self):
+        """Test candidate selection per value"""
+        table = self.create_table()
+        list_, debug, save, add, fallback = self.handlers
+
+        self.assertEqual(table.expression, "context.query.action")
+        self.assertEqual(table.indexed_values, 3)
+        self.assertEqual(table.candidates(Context(action="list")), (list_, debug, fallback))
+        self.assertEqual(table.candidates(Context(action="add")), (debug, save, add, fallback))
+        self.assertEqual(table.candidates(Context(action="delete")), (debug, fallback))
+        self.assertEqual(table.candidates(Context()), (debug, fallback))
+        self.assertEqual(table.candidates(Context(action=["list"])), (debug, fallback))
+
+    def test_not_indexed_without_shared_expression(self):
+        """Test that a single discriminated handler is not indexed"""
+        handlers = [CallbackInfo([Equal("context.query.action", "list")], handler_named("a")),
+                    CallbackInfo([Equal("context.query.other", [1])], handler_named("b"))]
+        table = HandlerTable(handlers)
+        self.assertIsNone(table.expression)
+        self.assertEqual(table.candidates(Context(action="x")), tuple(handlers))
+
+    async def test_dispatch_uses_index(self):
+        """Test dispatch through the index with many action handlers"""
+        app = edge.from_options({}, asyncio.get_running_loop())
+        checked = []
+
+        for i in range(50):
+            async def action(index=i):
+                return {"action": index}
+            app.restful_handler("api", None, app.equal("context.query.action", f"a{i}"))(action)
+
+        async def dispatch(action):
+            cms = {"request": {"url": "api"}, "query": {"action": action}}
+            context = RESTfulContext(cms, app, HttpMessage({"cms": cms}))
+            response = await app.dispatch_async(context)
+            return json.loads(response["cms"]["content"])["action"]
+
+        self.assertEqual(await dispatch("a42"), 42)
+        self.assertEqual(await dispatch("a0"), 0)
+
+        # Handlers registered later are picked up
+        @app.restful_handler("api", None, app.equal("context.query.action", "late"))
+        async def late():
+            return {"action": "late"}
+        self.assertEqual(await dispatch("late"), "late")
+
+        async def fallback(context: RESTfulContext):
+            checked.append(context.query.get("action"))
+            return {"action": None}
+        app.restful_handler("api")(fallback)
+
+        self.assertEqual(await dispatch("a7"), 7)
+        self.assertIsNone(await dispatch("zzz"))
+        self.assertEqual(checked, ["zzz"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""Unit Tests for source member dispatch
+
+Member contexts of client source commands are dispatched concurrently up to
+member_concurrency, keep the member order of the command and are served by
+the first matching handler in registration order.
+"""
+
+import asyncio
+import json
+import time
+import unittest
+
+from bclib import edge
+from bclib.context import ClientSourceContext, ClientSourceMemberContext
+
+COMMAND = """
+<basis core='dbsource' run='atclient' source='dashboard' mid='20' name='stats'>
+    <member name='m0' type='list'></member>
+    <member name='m1' type='list'></member>
+    <member name='m2' type='list'></member>
+    <member name='m3' type='list'></member>
+    <member name='m4' type='list'></member>
+    <member name='m5' type='list'></member>
+</basis>
+"""
+
+
+class TestSourceMemberDispatch(unittest.IsolatedAsyncioTestCase):
+    """Test suite for concurrent source member dispatch"""
+
+    def create_app(self, member_concurrency: int):
+        app = edge.from_options({"member_concurrency": member_concurrency},
+                                asyncio.get_running_loop())
+        self.active = 0
+        self.max_active = 0
+        self.m0_checks = 0
+
+        async def is_m0(context):
+            self.m0_checks += 1
+            return context.member.name == "m0"
+
+        @app.client_source_handler(None, None, app.equal("context.command.source", "dashboard"))
+        def dashboard(context: ClientSourceContext):
+            return [{"id": 1}]
+
+        @app.client_source_member_handler(None, None, app.callback(is_m0))
+        def first_member(context: ClientSourceMemberContext):
+            raise ValueError("m0 failed")
+
+        @app.client_source_member_handler()
+        async def slow_member(context: ClientSourceMemberContext):
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            # Later members finish first
+            await asyncio.sleep(0.05 - int(context.member.name[1:]) * 0.005)
+            self.active -= 1
+            return [{"member": context.member.name}]
+
+        return app
+
+    async def dispatch(self, app):
+        cms = {"request": {"url": "source"}, "form": {"command": COMMAND}}
+        context = ClientSourceContext(cms, app, None)
+        return context, await app.dispatch_async(context)
+
+    async def test_members_dispatched_concurrently_in_order(self):
+        """Test concurrent dispatch with results in member order"""
+        app = self.create_app(member_concurrency=10)
+        start = time.perf_counter()
+        _, response = await self.dispatch(app)
+        elapsed = time.perf_counter() - start
+
+        sources = json.loads(response["cms"]["content"])["sources"]
+        self.assertEqual([source["options"]["tableName"] for source in sources],
+                         [f"stats.m{i}" for i in range(6)])
+        self.assertEqual([source["data"] for source in sources[1:]],
+                         [[{"member": f"m{i}"}] for i in range(1, 6)])
+        self.assertIn("m0 failed", sources[0]["data"]["errorMessage"])
+        self.assertEqual(self.max_active, 5)
+        self.assertLess(elapsed, 0.15)
+
+    async def test_concurrency_limit(self):
+        """Test that member_concurrency bounds members in flight"""
+        app = self.create_app(member_concurrency=2)
+        await self.dispatch(app)
+        self.assertEqual(self.max_active, 2)
+
+    async def test_first_registered_handler_wins(self):
+        """Test that a handler served before does not take priority over earlier handlers"""
+        app = edge.from_options({"member_concurrency": 1}, asyncio.get_running_loop())
+        vip = False
+
+        async def is_vip(context):
+            return vip
+
+        @app.client_source_handler()
+        def dashboard(context: ClientSourceContext):
+            return [{"id": 1}]
+
+        @app.client_source_member_handler(None, None, app.callback(is_vip))
+        def vip_member(context: ClientSourceMemberContext):
+            return [{"member": "vip"}]
+
+        @app.client_source_member_handler()
+        def default_member(context: ClientSourceMemberContext):
+            return [{"member": "default"}]
+
+        def served(response):
+            return {source["data"][0]["member"]
+                    for source in json.loads(response["cms"]["content"])["sources"]}
+
+        self.assertEqual(served((await self.dispatch(app))[1]), {"default"})
+        vip = True
+        self.assertEqual(served((await self.dispatch(app))[1]), {"vip"})
+
+        app = self.create_app(member_concurrency=1)
+        await self.dispatch(app)
+        await self.dispatch(app)
+        self.assertEqual(self.m0_checks, 12)
+
+if __name__ == '__main__':
+    unittest.main()
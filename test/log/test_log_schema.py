@@ -0,0 +1,79 @@
+"""Unit Tests for LogSchema answer formatting
+
+Source expressions are compiled once at load, answers are built from
+prebuilt property templates and formatting errors are counted.
+"""
+
+import unittest
+
+from bclib.log_service.log_schema import LogSchema
+
+SCHEMA = {"schemaName": "event", "schemaVersion": 2, "lid": 1, "schemaId": 7,
+          "paramUrl": "p", "questions": [
+              {"title": "user", "prpId": 1, "parts": [{}, {}]},
+              {"title": "tags", "prpId": 2, "multi": True, "parts": [{}], "TypeID": 3},
+              {"title": "double", "prpId": 3, "parts": [{}], "source": "user[0][0] * 2"},
+              {"title": "escape", "prpId": 4, "parts": [{}], "source": "().__class__"},
+              {"title": "count", "prpId": 5, "parts": [{}], "source": "len(user) if isinstance(user, list) else 0"},
+              {"title": "file", "prpId": 6, "parts": [{}], "source": "open('/etc/hostname').read()"},
+          ]}
+
+
+class TestLogSchema(unittest.TestCase):
+    """Test suite for LogSchema.get_answer"""
+
+    def test_answer_layout(self):
+        """Test parts/values layout, multi limits and computed sources"""
+        answer = LogSchema(SCHEMA).get_answer({
+            "user": [[5, "a", "ignored"], [6]],
+            "tags": [["x"], ["y"]]})
+
+        self.assertEqual(answer["schemaName"], "event")
+        self.assertEqual(answer["properties"][0], {
+            "prpId": 1, "TypeID": 0, "answers": [{"parts": [
+                {"part": 1, "values": [{"value": 5}]},
+                {"part": 2, "values": [{"value": "a"}]}]}]})
+        self.assertEqual(len(answer["properties"][1]["answers"]), 2)
+        self.assertEqual(
+            answer["properties"][2]["answers"][0]["parts"][0]["values"], [{"value": 10}])
+        self.assertEqual(
+            answer["properties"][3]["answers"][0]["parts"][0]["values"], [{"value": 2}])
+        self.assertEqual(len(answer["properties"]), 4)
+
+    def test_format_escapes_rejected(self):
+        """Test that str formatting cannot reach dunder attributes"""
+        sources = ['"{0.__class__.__mro__[1].__subclasses__}".format(user)',
+                   '"{0}".format(user)',
+                   '"{u}".format_map({"u": user})',
+                   '"{0.__class__}" % user']
+        schema = LogSchema({**SCHEMA, "questions": [
+            {"title": f"s{i}", "prpId": i, "parts": [{}], "source": source}
+            for i, source in enumerate(sources)]})
+        answer = schema.get_answer({"user": [[5]]})
+
+        self.assertEqual(answer["properties"], [])
+        self.assertEqual(schema.error_count, len(sources))
+        self.assertIsInstance(schema.last_error, ValueError)
+
+    def test_builtins_outside_allow_list(self):
+        """Test that builtins outside the allow-list are not available to sources"""
+        schema = LogSchema(SCHEMA)
+        schema.get_answer({"user": [[5]]})
+
+        self.assertEqual(schema.error_count, 2)
+        self.assertIsInstance(schema.last_error, NameError)
+
+    def test_errors_are_counted(self):
+        """Test that failing and disallowed sources are skipped and counted"""
+        schema = LogSchema(SCHEMA)
+        answer = schema.get_answer({"tags": [["x"]]})
+
+        self.assertEqual([p["prpId"] for p in answer["properties"]], [2])
+        # 'double' and 'count' fail (no user), 'escape' is rejected at compile
+        # time and 'file' has no open builtin
+        self.assertEqual(schema.error_count, 4)
+        self.assertIsInstance(schema.last_error, NameError)
+
+
+if __name__ == '__main__':
+    unittest.main()
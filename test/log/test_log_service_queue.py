@@ -0,0 +1,148 @@
+"""Unit Tests for LogService background queue
+
+Background records go through a bounded queue drained by worker tasks,
+with overflow policies, counters and flush on shutdown. Schema loggers use
+the same queue for their own log_in_background.
+"""
+
+import asyncio
+import unittest
+
+from bclib.log_service.log_object import LogObject
+from bclib.log_service.log_service import LogService
+from bclib.log_service.schema_base_logger import SchemaBaseLogger
+
+
+class SlowLogger:
+    """Logger stand-in that records log objects after a short delay"""
+
+    def __init__(self):
+        self.logged = []
+        self.release = asyncio.Event()
+
+    def new_object_log(self, schema_name, routing_key=None, **kwargs):
+        return LogObject(schema_name, routing_key, **kwargs)
+
+    async def log_async(self, log_object, **kwargs):
+        await self.release.wait()
+        self.logged.append(log_object.schema_name)
+
+
+class RecordingSchemaLogger(SchemaBaseLogger):
+    """Schema logger that records log objects instead of loading schemas"""
+
+    def __init__(self, options: dict):
+        super().__init__({"url": "http://localhost/log", **options})
+        self.logged = []
+
+    async def log_async(self, log_object=None, **kwargs):
+        await asyncio.sleep(0)
+        self.logged.append(log_object.schema_name)
+
+    async def _save_schema_async(self, schema, routing_key=None):
+        pass
+
+
+class TestLogServiceQueue(unittest.IsolatedAsyncioTestCase):
+    """Test suite for bounded background logging"""
+
+    def create_service(self, **options) -> LogService:
+        service = LogService({"logger": {
+            "type": "schema.restful", "url": "http://localhost/log", **options}},
+            asyncio.get_running_loop())
+        self.schema_logger = service._LogService__logger
+        self.logger = SlowLogger()
+        service._LogService__logger = self.logger
+        return service
+
+    async def fill(self, service: LogService, count: int, prefix: str = "s") -> list:
+        return [service.log_in_background(schema_name=f"{prefix}{i}")
+                for i in range(count)]
+
+    async def test_drop_oldest_and_flush_on_stop(self):
+        """Test drop_oldest keeps the newest records and stop drains the queue"""
+        service = self.create_service(queue_size=3, workers=1)
+        await self.fill(service, 1)
+        await asyncio.sleep(0)  # worker takes s0 and waits
+        await self.fill(service, 5, "n")
+
+        self.logger.release.set()
+        await service.stop_async()
+
+        self.assertEqual(self.logger.logged, ["s0", "n2", "n3", "n4"])
+        self.assertEqual(service.dropped_count, 2)
+        self.assertEqual(service.enqueued_count, 6)
+        self.assertEqual(service.flushed_count, 4)
+
+    async def test_drop_new(self):
+        """Test drop_new rejects records once the queue is full"""
+        service = self.create_service(
+            queue_size=2, workers=1, overflow="drop_new")
+        results = await self.fill(service, 4)
+
+        self.assertEqual([await r for r in results], [True, True, False, False])
+        self.logger.release.set()
+        await service.stop_async()
+        self.assertEqual(self.logger.logged, ["s0", "s1"])
+
+    async def test_block_waits_for_space(self):
+        """Test block policy returns a task that completes once space frees up"""
+        service = self.create_service(
+            queue_size=1, workers=1, overflow="block")
+        await self.fill(service, 1)
+        await asyncio.sleep(0)
+        results = await self.fill(service, 3, "n")
+
+        self.logger.release.set()
+        self.assertEqual(await asyncio.gather(*results), [True, True, True])
+        await service.stop_async()
+        self.assertEqual(sorted(self.logger.logged), ["n0", "n1", "n2", "s0"])
+        self.assertEqual(service.dropped_count, 0)
+
+    async def test_sample_under_pressure(self):
+        """Test sample keeps 1 of sample_rate records once half full"""
+        service = self.create_service(
+            queue_size=100, workers=1, overflow="sample", sample_rate=5)
+        await self.fill(service, 100)
+
+        # 50 accepted before the half mark, then every 5th of the rest
+        self.assertEqual(service.enqueued_count, 60)
+        self.assertEqual(service.dropped_count, 40)
+        self.logger.release.set()
+        await service.stop_async()
+
+    async def test_restart_after_stop(self):
+        """Test that records logged after stop start new workers"""
+        service = self.create_service(queue_size=10, workers=2)
+        self.logger.release.set()
+        await self.fill(service, 2)
+        await service.stop_async()
+        await self.fill(service, 2, "n")
+        await service.stop_async()
+
+        self.assertEqual(self.logger.logged, ["s0", "s1", "n0", "n1"])
+        self.assertEqual(service.flushed_count, 4)
+
+    async def test_schema_logger_uses_service_queue(self):
+        """Test that log_in_background of the configured schema logger uses the service queue"""
+        service = self.create_service(queue_size=2, workers=1, overflow="drop_new")
+        results = [self.schema_logger.log_in_background(schema_name=f"s{i}") for i in range(3)]
+
+        self.assertEqual([await r for r in results], [True, True, False])
+        self.assertEqual(service.dropped_count, 1)
+        self.logger.release.set()
+        await service.stop_async()
+        self.assertEqual(self.logger.logged, ["s0", "s1"])
+
+    async def test_standalone_schema_logger_queue(self):
+        """Test that a schema logger used on its own drains its queue on close"""
+        schema_logger = RecordingSchemaLogger({"queue_size": 2, "overflow": "drop_new"})
+        results = [schema_logger.log_in_background(schema_name=f"s{i}") for i in range(3)]
+        self.assertEqual([await r for r in results], [True, True, False])
+
+        await schema_logger.close_async()
+        self.assertEqual(schema_logger.logged, ["s0", "s1"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""Unit Tests for RabbitSchemaBaseLogger buffering
+
+Records are buffered and published in batches over one connection, by size
+or interval, and flushed when the logger is closed.
+"""
+
+import asyncio
+import unittest
+
+from bclib.log_service.rabbit_schema_base_logger import RabbitSchemaBaseLogger
+
+
+class FakeConnection:
+    """Records publish_many_async calls instead of talking to RabbitMQ"""
+
+    def __init__(self):
+        self.batches = []
+        self.closed = False
+
+    async def publish_many_async(self, messages, routing_key=None, exchange=None):
+        self.batches.append((routing_key, list(messages)))
+
+    async def close_async(self):
+        self.closed = True
+
+
+class TestRabbitSchemaLogger(unittest.IsolatedAsyncioTestCase):
+    """Test suite for batched schema log publishing"""
+
+    def create_logger(self, **options) -> RabbitSchemaBaseLogger:
+        logger = RabbitSchemaBaseLogger({
+            "url": "http://localhost/schema",
+            "connection": {"url": "amqp://localhost", "exchange": "logs"},
+            **options})
+        self.connection = FakeConnection()
+        logger._RabbitSchemaBaseLogger__connection = self.connection
+        return logger
+
+    async def test_flush_by_size_grouped_by_routing_key(self):
+        """Test that a full batch is published, grouped by routing key"""
+        logger = self.create_logger(batch_size=4, flush_interval=60)
+        for i in range(4):
+            await logger._save_schema_async({"i": i}, "a" if i % 2 else "b")
+        await asyncio.sleep(0)
+
+        self.assertEqual(self.connection.batches, [
+            ("b", [{"i": 0}, {"i": 2}]), ("a", [{"i": 1}, {"i": 3}])])
+        await logger.close_async()
+
+    async def test_flush_by_interval_and_on_close(self):
+        """Test periodic flush of a partial batch and flush on close"""
+        logger = self.create_logger(batch_size=100, flush_interval=0.01)
+        await logger._save_schema_async({"i": 0})
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.connection.batches, [(None, [{"i": 0}])])
+
+        await logger._save_schema_async({"i": 1})
+        await logger.close_async()
+        self.assertEqual(self.connection.batches[-1], (None, [{"i": 1}]))
+        self.assertTrue(self.connection.closed)
+
+    async def test_full_buffer_waits_for_flush(self):
+        """Test that the buffer never grows past buffer_size"""
+        logger = self.create_logger(
+            batch_size=2, buffer_size=2, flush_interval=60)
+        for i in range(5):
+            await logger._save_schema_async({"i": i})
+            self.assertLessEqual(
+                len(logger._SchemaBaseLogger__buffer), 2)
+        await logger.close_async()
+        published = [m["i"] for _, batch in self.connection.batches
+                     for m in batch]
+        self.assertEqual(sorted(published), list(range(5)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+"""Unit Tests for RESTfulSchemaBaseLogger
+
+Schema loading and log submission share one pooled session; bulk mode
+POSTs buffered answers as one array per batch.
+"""
+
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from bclib.log_service.restful_schema_base_logger import \
+    RESTfulSchemaBaseLogger
+
+SCHEMA = {"schemaName": "event", "schemaVersion": 1, "lid": 1, "schemaId": 7,
+          "paramUrl": "", "questions": [
+              {"title": "user", "prpId": 1, "parts": [{}]}]}
+
+
+class TestRESTfulSchemaLogger(unittest.IsolatedAsyncioTestCase):
+    """Test suite for pooled and bulk schema log submission"""
+
+    async def asyncSetUp(self):
+        """Start a fake schema/log API"""
+        self.posts = []
+        self.peers = set()
+
+        async def get_schema(request: web.Request):
+            self.peers.add(request.transport.get_extra_info("peername"))
+            return web.json_response({"sources": [{"data": [SCHEMA]}]})
+
+        async def post_log(request: web.Request):
+            self.peers.add(request.transport.get_extra_info("peername"))
+            self.posts.append(await request.json())
+            return web.json_response({})
+
+        app = web.Application()
+        app.router.add_get("/schema/{name}", get_schema)
+        app.router.add_post("/log", post_log)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    def create_logger(self, **options) -> RESTfulSchemaBaseLogger:
+        return RESTfulSchemaBaseLogger({
+            "get_url": str(self.server.make_url("/schema")),
+            "post_url": str(self.server.make_url("/log")),
+            **options})
+
+    async def test_requests_reuse_one_connection(self):
+        """Test that schema load and posts go over one keep-alive connection"""
+        logger = self.create_logger()
+        for i in range(5):
+            await logger.log_async(schema_name="event", user=[[i]])
+        await logger.close_async()
+
+        self.assertEqual(len(self.posts), 5)
+        self.assertTrue(all("schema" in post for post in self.posts))
+        self.assertEqual(len(self.peers), 1)
+
+    async def test_bulk_mode_posts_arrays(self):
+        """Test that bulk mode submits batch_size answers per request"""
+        logger = self.create_logger(bulk=True, batch_size=3, flush_interval=60)
+        for i in range(7):
+            await logger.log_async(schema_name="event", user=[[i]])
+        await logger.close_async()
+
+        self.assertEqual([len(post["schemas"]) for post in self.posts], [3, 3, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
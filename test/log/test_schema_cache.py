@@ -0,0 +1,94 @@
+"""Unit Tests for SchemaBaseLogger schema resolution
+
+Concurrent first use fetches a schema once, schemas can be preloaded and
+refreshed in background after a TTL, and unknown names are cached.
+"""
+
+import asyncio
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from bclib.log_service.restful_schema_base_logger import \
+    RESTfulSchemaBaseLogger
+
+
+def schema(version: int) -> dict:
+    return {"schemaName": "event", "schemaVersion": version, "lid": 1, "schemaId": 7,
+            "paramUrl": "", "questions": [{"title": "user", "prpId": 1, "parts": [{}]}]}
+
+
+class TestSchemaCache(unittest.IsolatedAsyncioTestCase):
+    """Test suite for single-flight, TTL and negative schema caching"""
+
+    async def asyncSetUp(self):
+        """Start a fake schema/log API that counts schema fetches"""
+        self.fetches = []
+        self.version = 1
+        self.posts = []
+
+        async def get_schema(request: web.Request):
+            name = request.match_info["name"]
+            self.fetches.append(name)
+            await asyncio.sleep(0.01)
+            if name != "event":
+                return web.json_response({}, status=404)
+            return web.json_response({"sources": [{"data": [schema(self.version)]}]})
+
+        async def post_log(request: web.Request):
+            self.posts.append((await request.json())["schema"])
+            return web.json_response({})
+
+        app = web.Application()
+        app.router.add_get("/schema/{name}", get_schema)
+        app.router.add_post("/log", post_log)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+    async def asyncTearDown(self):
+        await self.logger.close_async()
+        await self.server.close()
+
+    def create_logger(self, **options) -> RESTfulSchemaBaseLogger:
+        self.logger = RESTfulSchemaBaseLogger({
+            "get_url": str(self.server.make_url("/schema")),
+            "post_url": str(self.server.make_url("/log")),
+            **options})
+        return self.logger
+
+    async def test_single_flight_and_preload(self):
+        """Test that concurrent first use and preload share one fetch"""
+        logger = self.create_logger(preload=["event"])
+        await asyncio.gather(logger.start_async(), *(
+            logger.log_async(schema_name="event", user=[[i]]) for i in range(20)))
+
+        self.assertEqual(self.fetches, ["event"])
+        self.assertEqual(len(self.posts), 20)
+
+    async def test_ttl_refresh_in_background(self):
+        """Test that a stale schema is served while the new version loads"""
+        logger = self.create_logger(schema_ttl=0.05)
+        await logger.log_async(schema_name="event", user=[[1]])
+        self.version = 2
+        await asyncio.sleep(0.06)
+
+        await logger.log_async(schema_name="event", user=[[2]])
+        await asyncio.sleep(0.03)
+        await logger.log_async(schema_name="event", user=[[3]])
+
+        self.assertEqual([post["schemaVersion"] for post in self.posts], [1, 1, 2])
+        self.assertEqual(len(self.fetches), 2)
+
+    async def test_unknown_schema_is_negatively_cached(self):
+        """Test that an unknown name is fetched once within negative_ttl"""
+        logger = self.create_logger(negative_ttl=60)
+        for _ in range(3):
+            await logger.log_async(schema_name="missing", user=[[1]])
+
+        self.assertEqual(self.fetches, ["missing"])
+        self.assertEqual(self.posts, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+"""Unit Tests for compiled predicates
+
+Expressions are compiled once into accessor functions, built-in predicates
+are checked synchronously and only async predicates such as Callback are
+awaited by CallbackInfo.
+"""
+
+import unittest
+
+from bclib.context import CmsBaseContext
+from bclib.dispatcher.callback_info import CallbackInfo
+from bclib.exception import ShortCircuitErr
+from bclib.predicate import (All, Any, Between, Callback, Equal, HasValue,
+                             InList, Predicate, Url)
+from bclib.utility import DictEx
+
+
+class Context:
+    """Context stand-in with the usual attribute roots"""
+
+    def __init__(self, **values):
+        self.query = {}
+        self.url_segments = None
+        self.body = None
+        self.cms = {}
+        self.url = "api/users/12"
+        self.__dict__.update(values)
+
+    def generate_error_response(self, exception):
+        return {"error": exception}
+
+
+class LegacyPredicate(Predicate):
+    """Custom predicate written against the async-only interface"""
+
+    def __init__(self, result: bool):
+        super().__init__(None)
+        self.result = result
+
+    async def check_async(self, context) -> bool:
+        return self.result
+
+
+class TestCompiledPredicates(unittest.IsolatedAsyncioTestCase):
+    """Test suite for compiled predicates and the sync fast path"""
+
+    def test_expression_paths(self):
+        """Test dict, DictEx, attribute and missing paths"""
+        context = Context(query={"status": "active", "page": "3"},
+                          body={"user": {"role": "admin"}},
+                          command=DictEx({"source": "basiscore", "mid": "20"}))
+
+        self.assertTrue(Equal("context.query.status", "active").check(context))
+        self.assertTrue(Equal("context.body.user.role", "admin").check(context))
+        self.assertTrue(InList("context.command.mid", "10", "20").check(context))
+        self.assertTrue(Between("context.query.page", 1, 5).check(context))
+        self.assertTrue(HasValue("context.url").check(context))
+        self.assertFalse(Equal("context.query.missing", None).check(context))
+        self.assertFalse(Equal("context.url_segments.id", "12").check(context))
+        self.assertFalse(Equal("context.nothing.id", "12").check(context))
+        self.assertEqual(Equal("context.body.user", None)._evaluate_expression(context),
+                         {"role": "admin"})
+
+    def test_url_sets_segments(self):
+        """Test that the Url predicate stays synchronous and fills url_segments"""
+        class UrlContext(Context, CmsBaseContext):
+            pass
+
+        context = UrlContext.__new__(UrlContext)
+        Context.__init__(context)
+        self.assertTrue(Url("api/users/:id").check(context))
+        self.assertEqual(context.url_segments, {"id": "12"})
+
+    def test_is_async(self):
+        """Test which predicates must be awaited"""
+        async def allow(context):
+            return True
+
+        self.assertFalse(Equal("context.query.a", 1).is_async)
+        self.assertFalse(All(Equal("context.query.a", 1), Url("api")).is_async)
+        self.assertTrue(Callback(allow).is_async)
+        self.assertTrue(Any(Equal("context.query.a", 1), Callback(allow)).is_async)
+        self.assertTrue(LegacyPredicate(True).is_async)
+
+        class CheckedPredicate(Predicate):
+            """Sync check() plus an async check_async() doing more work"""
+
+            def check(self, context) -> bool:
+                return True
+
+            async def check_async(self, context) -> bool:
+                return False
+
+        self.assertTrue(CheckedPredicate(None).is_async)
+
+    def test_subclass_must_override_a_check(self):
+        """Test that a predicate without check() or check_async() is rejected"""
+        with self.assertRaises(TypeError):
+            class EmptyPredicate(Predicate):
+                pass
+
+    async def test_callback_info_paths(self):
+        """Test sync and mixed predicate lists in CallbackInfo"""
+        async def handler(context):
+            return "handled"
+
+        async def deny(context):
+            raise ShortCircuitErr("denied")
+
+        context = Context(query={"role": "admin"})
+        sync_info = CallbackInfo([Equal("context.query.role", "admin")], handler)
+        self.assertEqual(await sync_info.try_execute_async(context), "handled")
+
+        mixed = CallbackInfo([Equal("context.query.role", "admin"),
+                              Any(LegacyPredicate(False), LegacyPredicate(True))], handler)
+        self.assertEqual(await mixed.try_execute_async(context), "handled")
+
+        not_matched = CallbackInfo([LegacyPredicate(True), Equal("context.query.role", "user")],
+                                   handler)
+        self.assertIsNone(await not_matched.try_execute_async(context))
+
+        short_circuit = CallbackInfo([Callback(deny)], handler)
+        response = await short_circuit.try_execute_async(context)
+        self.assertIsInstance(response["error"], ShortCircuitErr)
+
+    async def test_check_async_still_supported(self):
+        """Test that built-in predicates can still be awaited"""
+        context = Context(query={"role": "admin"})
+        self.assertTrue(await Equal("context.query.role", "admin").check_async(context))
+        self.assertTrue(await All(Equal("context.query.role", "admin"),
+                                  LegacyPredicate(True)).check_async(context))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""Unit Tests for Dispatcher.rabbit_batch_handler
+
+Messages are collected into batches by size or wait time, the handler is
+called once per batch with one DI scope and its result decides per-message
+ack/nack. Listeners raise their concurrency to the batch size.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import Mock, patch
+
+from bclib import edge
+from bclib.listener.rabbit.rabbit_listener import RabbitListener
+from bclib.listener.rabbit.rabbit_message import RabbitMessage
+
+
+class TestRabbitBatchHandler(unittest.IsolatedAsyncioTestCase):
+    """Test suite for batched RabbitMQ message handling"""
+
+    def setUp(self):
+        """Create dispatcher with a rabbit context factory"""
+        self.app = edge.from_options({"log_request": False})
+        self.batches = []
+
+    async def send(self, count: int) -> list[RabbitMessage]:
+        """Dispatch messages concurrently, as a pooled listener would"""
+        messages = [RabbitMessage("localhost", "q", str(i).encode())
+                    for i in range(count)]
+        await asyncio.gather(*(self.app.on_message_receive_async(message)
+                               for message in messages))
+        return messages
+
+    async def test_batches_by_size_and_wait(self):
+        """Test that full batches flush at max_size and the rest after max_wait_ms"""
+        @self.app.rabbit_batch_handler(max_size=4, max_wait_ms=20)
+        async def ingest(messages: list[RabbitMessage]):
+            self.batches.append([m.message_text for m in messages])
+
+        self.app.build_router()
+        messages = await self.send(10)
+
+        self.assertEqual([len(batch) for batch in self.batches], [4, 4, 2])
+        self.assertFalse(any(message.nacked for message in messages))
+
+    async def test_per_message_and_failed_results(self):
+        """Test per-message nack from a bool list and whole-batch nack on error"""
+        @self.app.rabbit_batch_handler(max_size=4, max_wait_ms=20, requeue=True)
+        async def ingest(contexts: list[edge.RabbitContext]):
+            self.batches.append(contexts)
+            if len(self.batches) == 2:
+                raise ValueError("bulk insert failed")
+            return [int(c.raw_message) % 2 == 0 for c in contexts]
+
+        self.app.build_router()
+        messages = await self.send(8)
+
+        self.assertEqual([m.nacked for m in messages[:4]],
+                         [False, True, False, True])
+        self.assertTrue(all(m.nacked and m.requeue for m in messages[4:]))
+
+    async def test_batch_task_kept_until_done(self):
+        """Test that a running batch is referenced and close_async waits for it"""
+        from bclib.dispatcher.rabbit_batcher import RabbitBatcher
+
+        started = asyncio.Event()
+
+        async def ingest(contexts):
+            started.set()
+            await asyncio.sleep(0.01)
+
+        batcher = RabbitBatcher(ingest, 10, 10000, asyncio.get_running_loop(), Mock())
+        context = Mock()
+        waiter = asyncio.create_task(batcher.add_async(context))
+        await asyncio.sleep(0)
+        self.assertFalse(started.is_set())
+
+        # close_async flushes the pending batch instead of waiting for max_wait_ms
+        await batcher.close_async()
+        self.assertTrue(await waiter)
+        self.assertEqual(batcher._RabbitBatcher__tasks, set())
+
+    async def test_one_scope_per_batch(self):
+        """Test that messages collected into a batch do not create their own DI scope"""
+        @self.app.rabbit_batch_handler(max_size=5, max_wait_ms=20)
+        async def ingest(messages: list[RabbitMessage]):
+            self.batches.append(messages)
+
+        self.app.build_router()
+        services = self.app.service_provider
+        with patch.object(services, 'create_scope', wraps=services.create_scope) as create_scope:
+            await self.send(10)
+        self.assertEqual(len(self.batches), 2)
+        self.assertEqual(create_scope.call_count, 2)
+
+    def test_listener_concurrency_raised(self):
+        """Test that a listener processes at least max_size messages at once"""
+        @self.app.rabbit_batch_handler(max_size=50)
+        async def ingest(messages: list[RabbitMessage]):
+            pass
+
+        listener = RabbitListener({"url": "amqp://localhost", "queue": "q", "prefetch_count": 10},
+                                  self.app, Mock(), asyncio.new_event_loop())
+        self.addCleanup(listener._event_loop.close)
+        listener._apply_batch_size(self.app.max_batch_size)
+        self.assertEqual((listener._concurrency, listener._prefetch_count), (50, 50))
+
+        listener._apply_batch_size(0)
+        self.assertEqual(listener._concurrency, 50)
+
+    def test_batch_parameter_required(self):
+        """Test that a handler without a batch parameter is rejected"""
+        with self.assertRaises(TypeError):
+            @self.app.rabbit_batch_handler()
+            async def ingest(message: RabbitMessage):
+                pass
+
+
+if __name__ == '__main__':
+    unittest.main()
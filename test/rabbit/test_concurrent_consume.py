@@ -0,0 +1,205 @@
+"""Unit Tests for concurrent message consumption in RabbitConnection
+
+Messages are processed by a bounded pool of tasks; messages sharing the
+configured ordering key header are processed in delivery order.
+listening_async consumes from an in-memory queue that replaces the broker.
+"""
+
+import asyncio
+import random
+import unittest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+from bclib.connections.rabbit.rabbit_connection import RabbitConnection
+
+
+class FakeIncomingMessage:
+    """Minimal stand-in for aio_pika IncomingMessage"""
+
+    def __init__(self, index: int, key: str):
+        self.index = index
+        self.headers = {"tenant": key}
+        self.acked = False
+        self.rejected = False
+
+    @asynccontextmanager
+    async def process(self, ignore_processed: bool = False):
+        try:
+            yield
+            self.acked = True
+        except Exception:
+            self.rejected = True
+            raise
+
+
+class FakeQueueIterator:
+    """Queue iterator yielding the given messages, then ending or waiting for more"""
+
+    def __init__(self, queue: 'FakeQueue'):
+        self.queue = queue
+        self.messages = iter(queue.messages)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        for message in self.messages:
+            self.queue.delivered += 1
+            return message
+        if self.queue.keep_open:
+            await asyncio.Event().wait()
+        raise StopAsyncIteration
+
+
+class FakeQueue:
+    def __init__(self, messages: list, keep_open: bool):
+        self.messages = messages
+        self.keep_open = keep_open
+        self.delivered = 0
+
+    def iterator(self):
+        return FakeQueueIterator(self)
+
+
+class FakeChannel:
+    def __init__(self, queue: FakeQueue):
+        self.queue = queue
+        self.is_closed = False
+
+    async def set_qos(self, prefetch_count):
+        pass
+
+    async def declare_queue(self, **kwargs):
+        return self.queue
+
+    async def close(self):
+        self.is_closed = True
+
+
+class FakeConnection:
+    def __init__(self, queue: FakeQueue):
+        self.queue = queue
+        self.is_closed = False
+
+    async def channel(self):
+        return FakeChannel(self.queue)
+
+    async def close(self):
+        self.is_closed = True
+
+
+class RecordingConnection(RabbitConnection):
+    """RabbitConnection that records processed messages instead of dispatching"""
+
+    def __init__(self, options: dict):
+        super().__init__(options, None, None)
+        self.processed = []
+        self.running = 0
+        self.max_running = 0
+        # Messages of the "hot" key wait for this event
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def _process_message(self, message):
+        if message.headers["tenant"] == "hot":
+            await self.release.wait()
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(random.random() / 200)
+        self.running -= 1
+        if message.index == 7:
+            raise ValueError("handler failed")
+        self.processed.append((message.headers["tenant"], message.index))
+
+
+class TestConcurrentConsume(unittest.IsolatedAsyncioTestCase):
+    """Test suite for bounded, key-ordered message processing"""
+
+    def serve(self, messages: list, keep_open: bool = False) -> FakeQueue:
+        """Make listening_async consume the messages from an in-memory queue"""
+        queue = FakeQueue(messages, keep_open)
+        patcher = patch("aio_pika.connect_robust",
+                        AsyncMock(side_effect=lambda url: FakeConnection(queue)))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return queue
+
+    def create_connection(self, concurrency: int) -> RecordingConnection:
+        return RecordingConnection({
+            "url": "amqp://localhost", "queue": "q",
+            "concurrency": concurrency, "ordering_key": "tenant"})
+
+    def test_prefetch_defaults_to_concurrency(self):
+        """Test that prefetch_count follows concurrency unless configured"""
+        connection = RecordingConnection(
+            {"url": "amqp://localhost", "queue": "q", "concurrency": 8})
+        self.assertEqual(connection._prefetch_count, 8)
+        connection = RecordingConnection(
+            {"url": "amqp://localhost", "queue": "q"})
+        self.assertIsNone(connection._prefetch_count)
+        self.assertEqual(self.create_connection(8)._prefetch_count, 32)
+
+    async def test_bounded_and_ordered_per_key(self):
+        """Test concurrency limit, per-key ordering and per-message ack/reject"""
+        connection = self.create_connection(4)
+        messages = [FakeIncomingMessage(i, f"t{i % 3}") for i in range(30)]
+        self.serve(messages)
+
+        await connection.listening_async()
+
+        self.assertLessEqual(connection.max_running, 4)
+        for key in ("t0", "t1", "t2"):
+            indexes = [i for k, i in connection.processed if k == key]
+            self.assertEqual(indexes, sorted(indexes))
+        self.assertTrue(messages[7].rejected)
+        self.assertTrue(all(m.acked for m in messages if m.index != 7))
+        self.assertEqual(connection._ordering_locks, {})
+        self.assertEqual(connection._in_flight, set())
+
+    async def test_busy_key_does_not_block_other_keys(self):
+        """Test that messages queued behind one key leave pool slots to other keys"""
+        connection = self.create_connection(2)
+        connection.release.clear()
+        messages = [FakeIncomingMessage(i, "hot") for i in range(10)]
+        messages.append(FakeIncomingMessage(10, "cold"))
+        self.serve(messages)
+
+        listening = asyncio.create_task(connection.listening_async())
+        for _ in range(100):
+            if connection.processed:
+                break
+            await asyncio.sleep(0.01)
+        self.assertEqual(connection.processed, [("cold", 10)])
+
+        connection.release.set()
+        await listening
+        self.assertEqual([i for k, i in connection.processed if k == "hot"],
+                         [i for i in range(10) if i != 7])
+
+    async def test_cancel_drains_in_flight(self):
+        """Test that cancelling the listener lets in-flight messages finish and ack"""
+        connection = self.create_connection(4)
+        messages = [FakeIncomingMessage(i, f"t{i % 2}") for i in range(8)]
+        queue = self.serve(messages, keep_open=True)
+
+        listening = asyncio.create_task(connection.listening_async())
+        while queue.delivered < len(messages):
+            await asyncio.sleep(0)
+        listening.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await listening
+
+        self.assertEqual(len(connection.processed), 7)
+        self.assertTrue(all(m.acked for m in messages if m.index != 7))
+        self.assertEqual(connection._in_flight, set())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+"""Unit Tests for RestfulConnection GET response cache
+
+Fresh responses are served from cache, stale ones are revalidated with
+ETag, concurrent identical GETs are coalesced and entries are LRU-bounded.
+"""
+
+import asyncio
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from bclib.connections.restful.restful_connection import RestfulConnection
+from bclib.options.service_options import ServiceOptions
+
+
+class TestHttpCache(unittest.IsolatedAsyncioTestCase):
+    """Test suite for the opt-in RestfulConnection cache"""
+
+    async def asyncSetUp(self):
+        """Start a fake API that counts requests per path"""
+        self.requests = []
+        self.etag = '"v1"'
+
+        async def item(request: web.Request):
+            self.requests.append(
+                (request.path, request.headers.get("If-None-Match")))
+            await asyncio.sleep(0.01)
+            if request.headers.get("If-None-Match") == self.etag:
+                return web.Response(status=304, headers={"ETag": self.etag})
+            return web.json_response(
+                {"path": request.path, "etag": self.etag},
+                headers={"ETag": self.etag,
+                         "Cache-Control": request.query.get("cc", "no-cache")})
+
+        async def private(request: web.Request):
+            self.requests.append((request.path, None))
+            return web.json_response({}, headers={"Cache-Control": "no-store"})
+
+        async def whoami(request: web.Request):
+            self.requests.append((request.path, request.headers.get("Authorization")))
+            return web.json_response(
+                {"user": request.headers.get("Authorization")},
+                headers={"Cache-Control": "max-age=60", "Vary": request.query.get("vary", "")})
+
+        app = web.Application()
+        app.router.add_get("/private", private)
+        app.router.add_get("/whoami", whoami)
+        app.router.add_get("/{name}", item)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+    async def asyncTearDown(self):
+        await self.api.close_async()
+        await self.server.close()
+
+    def create_connection(self, cache=True, headers=None) -> RestfulConnection:
+        self.api = RestfulConnection(ServiceOptions({
+            "base_url": str(self.server.make_url("/")), "cache": cache,
+            "headers": headers or {}}))
+        return self.api
+
+    async def test_fresh_and_revalidated_responses(self):
+        """Test max-age serves from cache and no-cache revalidates with ETag"""
+        api = self.create_connection()
+        for _ in range(3):
+            self.assertEqual((await api.get_async("/a", {"cc": "max-age=60"}))["path"], "/a")
+        self.assertEqual(len(self.requests), 1)
+
+        await api.get_async("/b")
+        await api.get_async("/b")
+        self.etag = '"v2"'
+        result = await api.get_async("/b")
+
+        self.assertEqual(result["etag"], '"v2"')
+        self.assertEqual(self.requests[1:], [
+            ("/b", None), ("/b", '"v1"'), ("/b", '"v1"')])
+        self.assertEqual(api.cache.revalidated_count, 1)
+
+    async def test_concurrent_gets_are_coalesced(self):
+        """Test that identical concurrent GETs send one request"""
+        api = self.create_connection()
+        results = await asyncio.gather(*(api.get_async("/c") for _ in range(10)))
+
+        self.assertEqual(len(self.requests), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    async def test_overrides_no_store_and_lru_bound(self):
+        """Test per-call overrides, no-store and max_entries eviction"""
+        api = self.create_connection({"max_entries": 2})
+        await api.get_async("/private")
+        await api.get_async("/private")
+        self.assertEqual(len(self.requests), 2)
+
+        await api.get_async("/d", {"cc": "max-age=60"})
+        await api.get_async("/d", {"cc": "max-age=60"}, cache=False)
+        await api.get_async("/d", {"cc": "max-age=60"}, max_age=0)
+        self.assertEqual([r[1] for r in self.requests[2:]], [None, None, '"v1"'])
+
+        for name in ("e", "f", "g"):
+            await api.get_async(f"/{name}", {"cc": "max-age=60"})
+        self.assertEqual(len(api.cache), 2)
+        await api.get_async("/f", {"cc": "max-age=60"})
+        self.assertEqual(len(self.requests), 8)
+
+    async def test_connections_do_not_share_cache(self):
+        """Test that connections with other default headers never see each other's responses"""
+        tenant_a = self.create_connection(headers={"Authorization": "Bearer a"})
+        tenant_b = self.create_connection(headers={"Authorization": "Bearer b"})
+        try:
+            self.assertEqual((await tenant_a.get_async("/whoami"))["user"], "Bearer a")
+            self.assertEqual((await tenant_b.get_async("/whoami"))["user"], "Bearer b")
+            self.assertEqual((await tenant_a.get_async("/whoami"))["user"], "Bearer a")
+            self.assertEqual(len(self.requests), 2)
+        finally:
+            await tenant_a.close_async()
+
+    async def test_vary_star_is_not_stored(self):
+        """Test that responses varying on unknown request properties are not cached"""
+        api = self.create_connection()
+        await api.get_async("/whoami", {"vary": "*"})
+        await api.get_async("/whoami", {"vary": "*"})
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(len(api.cache), 0)
+
+    async def test_cache_is_opt_in(self):
+        """Test that connections without cache option always hit the network"""
+        api = self.create_connection(cache=None)
+        await api.get_async("/a", {"cc": "max-age=60"})
+        await api.get_async("/a", {"cc": "max-age=60"})
+
+        self.assertIsNone(api.cache)
+        self.assertEqual(len(self.requests), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+"""Unit Tests for RestfulConnection.map_async
+
+Bulk requests keep request order, respect the concurrency limit, retry
+idempotent methods on retryable statuses and hedge slow requests.
+"""
+
+import asyncio
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from bclib.connections.restful.restful_connection import RestfulConnection
+from bclib.options.service_options import ServiceOptions
+
+
+class TestMapAsync(unittest.IsolatedAsyncioTestCase):
+    """Test suite for bulk requests with retry and hedging"""
+
+    async def asyncSetUp(self):
+        """Start a fake API with slow, flaky and echo endpoints"""
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = {}
+
+        async def item(request: web.Request):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01 * (5 - int(request.match_info["id"]) % 5))
+            self.in_flight -= 1
+            return web.json_response({"id": int(request.match_info["id"])})
+
+        async def flaky(request: web.Request):
+            count = self.calls[request.method] = self.calls.get(
+                request.method, 0) + 1
+            return web.json_response({"count": count}, status=503 if count < 3 else 200)
+
+        async def slow_once(request: web.Request):
+            count = self.calls["slow"] = self.calls.get("slow", 0) + 1
+            if count == 1:
+                await asyncio.sleep(1)
+            return web.json_response({"count": count})
+
+        app = web.Application()
+        app.router.add_get("/items/{id}", item)
+        app.router.add_route("*", "/flaky", flaky)
+        app.router.add_get("/slow", slow_once)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.api = RestfulConnection(ServiceOptions({
+            "base_url": str(self.server.make_url("/")),
+            "retry": {"attempts": 3, "base_delay": 0.001}}))
+
+    async def asyncTearDown(self):
+        await self.api.close_async()
+        await self.server.close()
+
+    async def test_results_in_order_with_concurrency_limit(self):
+        """Test that results keep request order under the concurrency cap"""
+        results = await self.api.map_async(
+            [f"/items/{i}" for i in range(12)], concurrency=3)
+
+        self.assertEqual([r["id"] for r in results], list(range(12)))
+        self.assertLessEqual(self.max_in_flight, 3)
+        self.assertEqual(self.api.metrics["requests"], 12)
+
+    async def test_retry_only_idempotent_methods(self):
+        """Test that GET is retried with backoff and POST is not"""
+        results = await self.api.map_async([
+            "/flaky",
+            {"method": "POST", "path": "/flaky", "json": {},
+             "raise_for_status": False}])
+
+        self.assertEqual(results, [{"count": 3}, {"count": 1}])
+        self.assertEqual(self.api.metrics["retries"], 2)
+
+        self.calls.clear()
+        results = await self.api.map_async(
+            ["/flaky"], retry=False, return_exceptions=True)
+        self.assertIsInstance(results[0], Exception)
+
+    async def test_hedged_request_wins(self):
+        """Test that a duplicate is sent after the hedge delay and wins"""
+        results = await self.api.map_async(["/slow"], hedge={"delay": 0.05})
+
+        self.assertEqual(results, [{"count": 2}])
+        self.assertEqual(self.api.metrics["hedges"], 1)
+        self.assertEqual(self.api.metrics["hedge_wins"], 1)
+
+    async def test_hedge_bypasses_cache_coalescing(self):
+        """Test that the duplicate of a cached GET is sent instead of joining the first one"""
+        api = RestfulConnection(ServiceOptions({
+            "base_url": str(self.server.make_url("/")), "cache": True}))
+        self.addAsyncCleanup(api.close_async)
+        results = await api.map_async(["/slow"], hedge={"delay": 0.05})
+
+        self.assertEqual(results, [{"count": 2}])
+        self.assertEqual(api.metrics["hedge_wins"], 1)
+        # Latency of GETs sent through the cache is recorded
+        self.assertIsNotNone(api.metrics["p95_latency"])
+
+    async def test_cancel_before_hedge_cancels_request(self):
+        """Test that cancelling during the hedge delay cancels the request in flight"""
+        task = asyncio.create_task(
+            self.api.map_async(["/slow"], hedge={"delay": 0.5}))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+
+        sending = [t for t in asyncio.all_tasks()
+                   if t.get_coro().__qualname__.endswith("_send_async")]
+        self.assertEqual(sending, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
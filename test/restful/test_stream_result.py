@@ -0,0 +1,145 @@
+"""Unit Tests for streamed handler results
+
+Async iterables returned by handlers are written as a chunked JSON array or
+NDJSON in bounded batches instead of being materialised into one string.
+"""
+
+import datetime
+import json
+import unittest
+
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+from bson import ObjectId
+
+from bclib.context import RESTfulContext, StreamResult
+from bclib.di.service_provider import ServiceProvider
+from bclib.listener.http.http_message import HttpMessage
+
+ITEMS = [{"id": i, "name": f"item {i}"} for i in range(250)]
+
+
+class Dispatcher:
+    """Dispatcher stand-in providing the root service provider"""
+
+    def __init__(self):
+        self.service_provider = ServiceProvider()
+        self.options = {}
+
+
+class Cursor:
+    """Async cursor stand-in recording how many items were pulled"""
+
+    def __init__(self, items, fail_at=None):
+        self.items = items
+        self.fail_at = fail_at
+        self.pulled = 0
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.pulled == self.fail_at:
+            raise RuntimeError("cursor failed")
+        if self.pulled >= len(self.items):
+            raise StopAsyncIteration
+        self.pulled += 1
+        return self.items[self.pulled - 1]
+
+    async def close(self):
+        self.closed = True
+
+
+class TestStreamResult(unittest.IsolatedAsyncioTestCase):
+    """Test suite for streaming async iterable results"""
+
+    async def asyncSetUp(self):
+        self.dispatcher = Dispatcher()
+        self.results = {}
+        self.writes = []
+
+        async def handle(request):
+            message = HttpMessage({"request": {"url": request.path}}, request)
+            context = RESTfulContext(message.cms_object, self.dispatcher, message)
+            context.add_header("X-Total", "250")
+            write_async = context.write_async
+
+            async def record_write_async(data):
+                self.writes.append(data)
+                await write_async(data)
+            context.write_async = record_write_async
+            try:
+                await context.generate_response_async(self.results[request.path])
+            except RuntimeError:
+                self.assertIsNone(message.Response)
+                return web.Response(status=500)
+            return message.Response
+
+        app = web.Application()
+        app.router.add_get("/{name}", handle)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def get(self, path):
+        async with ClientSession() as session:
+            async with session.get(self.server.make_url(path)) as response:
+                return response.status, response.headers, await response.text()
+
+    async def test_async_generator_as_json_array(self):
+        """Test that an async generator is written as a JSON array in batches"""
+        async def generate():
+            for item in ITEMS:
+                yield item
+        self.results["/array"] = generate()
+
+        status, headers, body = await self.get("/array")
+
+        self.assertEqual(status, 200)
+        self.assertEqual(headers["Content-Type"], "application/json")
+        self.assertEqual(headers["X-Total"], "250")
+        self.assertEqual(json.loads(body), ITEMS)
+        # 3 batches of at most 100 items and the closing bracket
+        self.assertEqual(len(self.writes), 4)
+
+    async def test_ndjson_with_bson_values(self):
+        """Test NDJSON output and default encoding of ObjectId and datetime"""
+        _id = ObjectId()
+        created = datetime.datetime(2024, 1, 2, 3, 4, 5)
+        cursor = Cursor([{"_id": _id, "created": created}] * 5)
+        self.results["/ndjson"] = StreamResult(cursor, format=StreamResult.NDJSON, batch_size=2)
+
+        _, headers, body = await self.get("/ndjson")
+
+        self.assertEqual(headers["Content-Type"], "application/x-ndjson")
+        self.assertEqual([json.loads(line) for line in body.splitlines()],
+                         [{"_id": str(_id), "created": created.isoformat()}] * 5)
+        self.assertEqual(len(self.writes), 3)
+        self.assertTrue(cursor.closed)
+
+    async def test_empty_and_failing_sources(self):
+        """Test empty streams and errors raised before the response starts"""
+        self.results["/empty"] = Cursor([])
+        _, _, body = await self.get("/empty")
+        self.assertEqual(json.loads(body), [])
+
+        cursor = Cursor(ITEMS, fail_at=0)
+        self.results["/failing"] = cursor
+        status, _, _ = await self.get("/failing")
+        self.assertEqual(status, 500)
+        self.assertTrue(cursor.closed)
+
+    def test_non_stream_content_is_not_streamed(self):
+        """Test stream detection of handler results"""
+        self.assertFalse(StreamResult.is_stream([1, 2]))
+        self.assertFalse(StreamResult.is_stream({"a": 1}))
+        self.assertTrue(StreamResult.is_stream(Cursor([])))
+        with self.assertRaises(ValueError):
+            StreamResult([], format="csv")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+"""Unit Tests for RestfulConnection streaming
+
+Bodies are consumed as byte chunks, lines, NDJSON records and JSON array
+items, and can be piped into an Edge streaming response.
+"""
+
+import json
+import unittest
+
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+
+from bclib.connections.restful.json_stream import JsonArrayParser
+from bclib.connections.restful.restful_connection import RestfulConnection
+from bclib.context.http_context import HttpContext
+from bclib.listener.http.http_message import HttpMessage
+from bclib.options.service_options import ServiceOptions
+
+ITEMS = [{"id": i, "name": f"item, {i}"} for i in range(500)]
+
+
+async def stream(request: web.Request, payload: bytes, content_type: str) -> web.StreamResponse:
+    """Write payload in small chunks to exercise incremental parsing"""
+    response = web.StreamResponse(headers={"Content-Type": content_type})
+    await response.prepare(request)
+    for i in range(0, len(payload), 37):
+        await response.write(payload[i:i + 37])
+    await response.write_eof()
+    return response
+
+
+class MessageContext:
+    """HttpContext stand-in writing to a real HttpMessage"""
+
+    pipe_async = HttpContext.pipe_async
+
+    def __init__(self, request: web.Request):
+        self.message = HttpMessage({}, request)
+
+    async def start_stream_response_async(self, status, reason, headers):
+        await self.message.start_stream_response_async(status, reason, headers)
+
+    async def write_and_drain_async(self, data):
+        await self.message.write_async(data)
+        await self.message.drain_async()
+
+
+class TestStreaming(unittest.IsolatedAsyncioTestCase):
+    """Test suite for streaming response consumption"""
+
+    async def asyncSetUp(self):
+        """Start a downstream API and an Edge-like proxy"""
+        async def array(request):
+            return await stream(request, json.dumps(ITEMS).encode(), "application/json")
+
+        async def ndjson(request):
+            payload = "\r\n".join(json.dumps(item) for item in ITEMS) + "\n\n"
+            return await stream(request, payload.encode(), "application/x-ndjson")
+
+        async def text(request):
+            return await stream(request, "héllo\nwörld".encode(), "text/plain")
+
+        app = web.Application()
+        app.router.add_get("/array", array)
+        app.router.add_get("/ndjson", ndjson)
+        app.router.add_get("/text", text)
+        app.router.add_get("/json-as-text", lambda request: web.Response(
+            text='{"id": 1}', content_type="text/plain"))
+        app.router.add_get("/problem", lambda request: web.Response(
+            text='{"title": "bad"}', content_type="application/problem+json"))
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.api = RestfulConnection(ServiceOptions(
+            {"base_url": str(self.server.make_url("/"))}))
+
+        async def proxy(request):
+            context = MessageContext(request)
+            await self.api.pipe_async(context, "/ndjson", response_headers={"X-Proxy": "1"})
+            return context.message.Response
+
+        proxy_app = web.Application()
+        proxy_app.router.add_get("/export", proxy)
+        self.proxy = TestServer(proxy_app)
+        await self.proxy.start_server()
+
+    async def asyncTearDown(self):
+        await self.api.close_async()
+        await self.proxy.close()
+        await self.server.close()
+
+    async def test_chunks_and_lines(self):
+        """Test byte chunks and multi-byte safe line splitting"""
+        chunks = [chunk async for chunk in self.api.stream_async("/array", chunk_size=100)]
+        self.assertTrue(all(len(chunk) <= 100 for chunk in chunks))
+        self.assertEqual(json.loads(b"".join(chunks)), ITEMS)
+
+        lines = [line async for line in self.api.iter_lines_async("/text")]
+        self.assertEqual(lines, ["héllo", "wörld"])
+
+    async def test_ndjson_and_json_array(self):
+        """Test record iteration of NDJSON and incremental JSON arrays"""
+        records = [record async for record in self.api.iter_ndjson_async("/ndjson")]
+        self.assertEqual(records, ITEMS)
+
+        items = [item async for item in self.api.iter_json_array_async("/array")]
+        self.assertEqual(items, ITEMS)
+
+        with self.assertRaises(ValueError):
+            async for _ in self.api.iter_json_array_async("/ndjson"):
+                pass
+
+    async def test_pipe_into_streaming_response(self):
+        """Test that a downstream body is forwarded with its content type"""
+        async with ClientSession() as session:
+            async with session.get(self.proxy.make_url("/export")) as response:
+                body = await response.text()
+                self.assertEqual(response.headers["X-Proxy"], "1")
+                self.assertEqual(response.content_type, "application/x-ndjson")
+        self.assertEqual([json.loads(line) for line in body.splitlines()
+                          if line.strip()], ITEMS)
+
+    async def test_buffered_read_parses_once(self):
+        """Test the buffered JSON/text fallback"""
+        self.assertEqual(await self.api.get_async("/array"), ITEMS)
+        self.assertEqual(await self.api.get_async("/text"), "héllo\nwörld")
+        # Only JSON content types are parsed
+        self.assertEqual(await self.api.get_async("/json-as-text"), '{"id": 1}')
+        self.assertEqual(await self.api.get_async("/problem"), {"title": "bad"})
+
+    def test_json_array_parser_pieces(self):
+        """Test items split at every position of the document"""
+        items = [12, -3.5e2, "a,]\"\\b", {"k": [1, {"z": "]}"}]}, [], True, None, ""]
+        document = json.dumps(items)
+        for size in (1, 2, 3, 7, len(document)):
+            parser = JsonArrayParser()
+            received = []
+            for start in range(0, len(document), size):
+                received.extend(parser.feed(document[start:start + size]))
+            parser.close()
+            self.assertEqual(received, items, size)
+
+    def test_json_array_parser_rejects_malformed(self):
+        """Test that missing or extra commas and trailing data are rejected"""
+        for document in ("[1,,2]", "[1 2]", "[1,]", "[,1]", '["a" "b"]', "[1]x", "{}", "[1"):
+            with self.subTest(document=document), self.assertRaises(ValueError):
+                parser = JsonArrayParser()
+                for char in document:
+                    parser.feed(char)
+                parser.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
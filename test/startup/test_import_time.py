@@ -0,0 +1,85 @@
+"""Unit Tests for Edge import time
+
+Each entry point is imported in a fresh interpreter. Optional subsystems
+(aiohttp, cryptography, RabbitMQ clients, MongoDB driver) must only be loaded
+when an application uses them, and importing bclib.edge must stay within the
+time budget.
+"""
+
+import json
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Upper bound for cold `import bclib.edge`, generous enough for slow CI machines
+EDGE_IMPORT_BUDGET_SECONDS = 1.5
+
+OPTIONAL_PACKAGES = {'aiohttp', 'cryptography', 'pika', 'aio_pika', 'pymongo', 'pyodbc'}
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def import_probe(code: str) -> dict:
+    """Run code in a fresh interpreter and get elapsed time and imported modules"""
+    result = subprocess.run([sys.executable, "-c", PROBE.format(code=code)],
+                            cwd=ROOT, capture_output=True, text=True, timeout=60)
+    if result.returncode != 0:
+        raise AssertionError(result.stderr)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def optional_packages(modules: list) -> set:
+    return {name.split('.')[0] for name in modules} & OPTIONAL_PACKAGES
+
+
+class TestImportTime(unittest.TestCase):
+    """Test suite for lazy imports of optional subsystems"""
+
+    def test_edge_import(self):
+        """Test that importing bclib.edge loads no optional subsystem"""
+        probe = import_probe("from bclib import edge")
+        self.assertEqual(optional_packages(probe["modules"]), set())
+        self.assertNotIn("bclib.listener.http.http_listener", probe["modules"])
+        self.assertNotIn("bclib.listener.rabbit.rabbit_listener", probe["modules"])
+        self.assertNotIn("bclib.connections.restful.restful_connection", probe["modules"])
+        self.assertLess(probe["elapsed"], EDGE_IMPORT_BUDGET_SECONDS)
+
+    def test_tcp_application(self):
+        """Test that a TCP-only application does not load HTTP or RabbitMQ code"""
+        probe = import_probe(
+            "import asyncio\n"
+            "from bclib import edge\n"
+            "app = edge.from_options({'tcp': 'localhost:0'}, asyncio.new_event_loop())\n"
+            "from bclib.listener.tcp import TcpListener")
+        self.assertEqual(optional_packages(probe["modules"]), set())
+
+    def test_package_entry_points(self):
+        """Test that subpackages can be imported first without circular imports"""
+        for code in ("import bclib.dispatcher.callback_info",
+                     "from bclib.predicate import Url",
+                     "from bclib.context import ContextFactory, RESTfulContext",
+                     "from bclib.listener.rabbit import RabbitMessage",
+                     "from bclib.listener.tcp import TcpListener"):
+            with self.subTest(code=code):
+                self.assertEqual(optional_packages(import_probe(code)["modules"]), set())
+
+    def test_http_listener_loaded_on_access(self):
+        """Test that lazy exports still resolve to the listener classes"""
+        probe = import_probe(
+            "from bclib.listener.http import HttpListener\n"
+            "from bclib.listener.http.http_listener import HttpListener as Listener\n"
+            "assert HttpListener is Listener")
+        self.assertIn("aiohttp", optional_packages(probe["modules"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
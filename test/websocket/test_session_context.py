@@ -0,0 +1,71 @@
+"""Unit Tests for WebSocket session-scoped context reuse
+
+Route match, handler resolution and DI scope are resolved once per
+WebSocket session and reused for every following message.
+"""
+
+import unittest
+
+from bclib import edge
+from bclib.listener.http.websocket_message import WebSocketMessage
+from bclib.listener.message_type import MessageType
+
+
+class FakeSession:
+    """Minimal stand-in for WebSocketSession (no aiohttp socket needed)"""
+
+    def __init__(self, url: str):
+        self.id = "session-0001"
+        self.cms_object = {"cms": {"request": {
+            "url": url, "full-url": f"http://localhost/{url}", "method": "GET"}}}
+        self.session_manager = None
+        self.services = None
+        self.context_type = None
+        self.callback_info = None
+        self.url_segments = None
+
+
+class TestWebSocketSessionContext(unittest.IsolatedAsyncioTestCase):
+    """Test suite for per-session route/handler caching"""
+
+    def setUp(self):
+        """Create dispatcher with a single WebSocket handler"""
+        self.app = edge.from_options({"log_request": False})
+        self.calls = []
+
+        @self.app.websocket_handler("chat/:room")
+        async def chat_handler(context: edge.WebSocketContext, room: str):
+            self.calls.append((context.message.type, room, context.services))
+
+        self.app.build_router()
+
+    async def test_route_and_handler_cached_on_connect(self):
+        """Test that CONNECT resolves route, handler and url segments"""
+        session = FakeSession("chat/lobby")
+        await self.app.on_message_receive_async(
+            WebSocketMessage.connect(session, MessageType.CONNECT))
+
+        self.assertIs(session.context_type, edge.WebSocketContext)
+        self.assertIsNotNone(session.callback_info)
+        self.assertEqual(session.url_segments, {"room": "lobby"})
+        self.assertIsNotNone(session.services)
+
+    async def test_messages_share_session_scope(self):
+        """Test that message contexts are children of the session scope"""
+        session = FakeSession("chat/lobby")
+        await self.app.on_message_receive_async(
+            WebSocketMessage.connect(session, MessageType.CONNECT))
+        for _ in range(3):
+            await self.app.on_message_receive_async(
+                WebSocketMessage.text_message(session, MessageType.MESSAGE, "hi"))
+
+        self.assertEqual(len(self.calls), 4)
+        self.assertTrue(all(room == "lobby" for _, room, _ in self.calls))
+        scopes = [services for _, _, services in self.calls]
+        # Every message gets its own child scope of the same session scope
+        self.assertEqual(len(set(map(id, scopes))), 4)
+        self.assertTrue(all(scope._parent is session.services for scope in scopes))
+
+
+if __name__ == '__main__':
+    unittest.main()